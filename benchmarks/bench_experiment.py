@@ -0,0 +1,129 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+from io import StringIO
+
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.experiment import FloatParameter, IntegerParameter, Procedure
+from pymeasure.experiment.results import CSVFormatter, Results
+from pymeasure.experiment.sequencer import SequenceHandler
+from pymeasure.experiment.workers import Worker
+from pymeasure.instruments import Instrument
+
+pytest.importorskip("pytest_benchmark")
+
+
+class EmitProcedure(Procedure):
+    """Procedure emitting rows as fast as possible."""
+
+    iterations = IntegerParameter("Loop Iterations", default=1000)
+    value = FloatParameter("Value", units="V", default=1.5)
+
+    DATA_COLUMNS = ["Iteration", "Voltage (V)", "Current (A)"]
+
+    def execute(self):
+        for i in range(self.iterations):
+            self.emit("results", {"Iteration": i, "Voltage (V)": 0.1 * i,
+                                  "Current (A)": 1e-3 * i})
+
+
+def write_results(filename, rows):
+    """Write a results file with `rows` data lines and return the Results instance."""
+    results = Results(EmitProcedure(), filename)
+    with open(filename, "a") as file:
+        file.writelines(f"{i},{0.1 * i},{1e-3 * i}\n" for i in range(rows))
+    return results
+
+
+@pytest.mark.parametrize("rows", (1000, 10000))
+def test_worker_throughput(benchmark, tmp_path, rows):
+    """Procedure.emit -> Worker -> Recorder -> file."""
+    filenames = (str(tmp_path / f"data{i}.csv") for i in range(1000))
+
+    def setup():
+        procedure = EmitProcedure()
+        procedure.iterations = rows
+        return (Worker(Results(procedure, next(filenames))),), {}
+
+    def run(worker):
+        worker.start()
+        worker.join()
+
+    benchmark.pedantic(run, setup=setup, rounds=5)
+    if benchmark.stats is not None:  # None with --benchmark-disable
+        benchmark.extra_info["rows_per_s"] = rows / benchmark.stats.stats.mean
+
+
+def test_csv_formatter(benchmark):
+    formatter = CSVFormatter(EmitProcedure.DATA_COLUMNS)
+    record = {"Iteration": 5, "Voltage (V)": 0.5, "Current (A)": 5e-3}
+    benchmark(formatter.format, record)
+
+
+@pytest.mark.parametrize("rows", (1000, 100000))
+def test_results_data(benchmark, tmp_path, rows):
+    """Load the data of a file (the first access of Results.data)."""
+    filename = str(tmp_path / "data.csv")
+    write_results(filename, rows)
+
+    def setup():
+        return (Results.load(filename, procedure_class=EmitProcedure),), {}
+
+    benchmark.pedantic(lambda results: results.data, setup=setup, rounds=10)
+    benchmark.extra_info["file_size"] = os.path.getsize(filename)
+
+
+@pytest.mark.parametrize("rows", (1000, 100000))
+def test_results_reload(benchmark, tmp_path, rows):
+    filename = str(tmp_path / "data.csv")
+    results = write_results(filename, rows)
+    benchmark(results.reload)
+    benchmark.extra_info["file_size"] = os.path.getsize(filename)
+
+
+def test_results_load_header(benchmark, tmp_path):
+    """Parse the header of a large file."""
+    filename = str(tmp_path / "data.csv")
+    write_results(filename, 100000)
+    benchmark(Results.load, filename, procedure_class=EmitProcedure)
+
+
+def test_parameters_sequence(benchmark):
+    handler = SequenceHandler(file_obj=StringIO(
+        '- "Value", "arange(0, 100)"\n'
+        '-- "Loop Iterations", "arange(1, 11)"\n'))
+    sequence = benchmark(handler.parameters_sequence)
+    assert len(sequence) == 1000
+
+
+@pytest.mark.parametrize("count", (100, 10000))
+def test_values(benchmark, count):
+    """Parse a long comma separated reply."""
+    instrument = Instrument(FakeAdapter(), "Fake", includeSCPI=False)
+    reply = ",".join(["1.2345E-3"] * count)
+    values = benchmark(instrument.values, reply)
+    assert len(values) == count
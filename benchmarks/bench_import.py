@@ -0,0 +1,47 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("statement", (
+    "pass",  # baseline: interpreter startup
+    "import pymeasure",
+    "import pymeasure.experiment",
+    "from pymeasure.experiment import Procedure",
+    "from pymeasure.experiment import Results, Worker",
+    "import pymeasure.instruments",
+    "from pymeasure.instruments import Instrument",
+    "from pymeasure.instruments.keithley import Keithley2400",
+    "import pymeasure.display.windows",
+))
+def test_import_time(benchmark, statement):
+    """Time to start a fresh interpreter and execute the import `statement`."""
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", statement],),
+                       kwargs={"check": True}, rounds=5)
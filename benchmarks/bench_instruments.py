@@ -0,0 +1,179 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments import Channel, Instrument
+from pymeasure.instruments.fakes import SwissArmyFake
+
+pytest.importorskip("pytest_benchmark")
+
+
+class LatencyAdapter(FakeAdapter):
+    """FakeAdapter bouncing back the last written message after a simulated bus latency.
+
+    The total time spent on the bus is accumulated in :attr:`bus_time`, such that it can be
+    separated from the overhead of pymeasure itself.
+
+    :param float latency: Latency in s of each write and read.
+    """
+
+    def __init__(self, latency=0, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.bus_time = 0
+        self._bytes = b""
+
+    def _transfer(self):
+        # Busy waiting, as sleep is not precise enough for short latencies.
+        start = perf_counter()
+        end = start + self.latency
+        while perf_counter() < end:
+            pass
+        self.bus_time += perf_counter() - start
+
+    def _write(self, command, **kwargs):
+        self._transfer()
+        self._buffer = command
+
+    def _write_bytes(self, content, **kwargs):
+        self._transfer()
+        self._bytes = content
+
+    def _read(self, **kwargs):
+        self._transfer()
+        return super()._read()
+
+    def _read_bytes(self, count, break_on_termchar=False, **kwargs):
+        self._transfer()
+        read, self._bytes = self._bytes, b""
+        return read if count == -1 else read[:count]
+
+
+class BenchChannel(Channel):
+    # The adapter bounces back the command, e.g. "1.5" for channel 1.
+    voltage = Channel.measurement("{ch}.5", """Measure a voltage.""")
+
+
+class BenchInstrument(Instrument):
+    """Instrument with typical properties, the adapter bounces back the commands."""
+
+    def __init__(self, adapter, name="Benchmark instrument", **kwargs):
+        super().__init__(adapter, name, includeSCPI=False, **kwargs)
+
+    voltage = Instrument.measurement("1.5", """Measure a voltage.""")
+
+    values_list = Instrument.measurement("1.5,2.5,3.5", """Measure some values.""")
+
+    output = Instrument.control(
+        "1", "%d", """Control the output.""",
+        validator=lambda v, vs: int(v), values=(0, 1), map_values=True, cast=int,
+    )
+
+    ch_1 = Instrument.ChannelCreator(BenchChannel, 1)
+
+
+@pytest.fixture
+def adapter(bus_latency):
+    return LatencyAdapter(bus_latency)
+
+
+@pytest.fixture
+def instrument(adapter):
+    return BenchInstrument(adapter)
+
+
+def run(benchmark, adapter, function, *args):
+    """Benchmark `function` and store the bus time and pymeasure's overhead per call."""
+    calls = 0
+
+    def target():
+        nonlocal calls
+        calls += 1
+        return function(*args)
+
+    adapter.bus_time = 0
+    result = benchmark(target)
+    bus_time = adapter.bus_time / calls
+    benchmark.extra_info["bus_time"] = bus_time
+    if benchmark.stats is not None:  # None with --benchmark-disable
+        benchmark.extra_info["overhead"] = benchmark.stats.stats.mean - bus_time
+    return result
+
+
+def test_adapter_ask(benchmark, adapter):
+    """Baseline: the adapter alone."""
+    def ask(command):
+        adapter.write(command)
+        return adapter.read()
+
+    assert run(benchmark, adapter, ask, "1.5") == "1.5"
+
+
+def test_measurement_get(benchmark, instrument, adapter):
+    assert run(benchmark, adapter, getattr, instrument, "voltage") == 1.5
+
+
+def test_measurement_list_get(benchmark, instrument, adapter):
+    assert run(benchmark, adapter, getattr, instrument, "values_list") == [1.5, 2.5, 3.5]
+
+
+def test_control_get(benchmark, instrument, adapter):
+    assert run(benchmark, adapter, getattr, instrument, "output") == 1
+
+
+def test_control_set(benchmark, instrument, adapter):
+    run(benchmark, adapter, setattr, instrument, "output", 1)
+
+
+def test_channel_get(benchmark, instrument, adapter):
+    """Channel dispatch with Channel.insert_id."""
+    assert run(benchmark, adapter, getattr, instrument.ch_1, "voltage") == 1.5
+
+
+@pytest.mark.parametrize("frame_format", ("mono_8", "mono_16"))
+def test_frame_transfer(benchmark, instrument, adapter, frame_format):
+    """Read a binary image frame of a SwissArmyFake."""
+    fake = SwissArmyFake(wait=0)
+    fake.frame_format = frame_format
+    frame = fake.frame
+    content = frame.tobytes()
+
+    def transfer():
+        instrument.write_bytes(content)  # the "device" provides the frame
+        return instrument.read_binary_values(dtype=frame.dtype)
+
+    data = run(benchmark, adapter, transfer)
+    np.testing.assert_array_equal(data, frame.ravel())
+    benchmark.extra_info["bytes"] = len(content)
+
+
+def test_swiss_army_fake_frame(benchmark):
+    """Generation of the fake data itself, to compare with the transfer."""
+    fake = SwissArmyFake(wait=0)
+    benchmark(getattr, fake, "frame")
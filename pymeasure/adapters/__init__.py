@@ -25,7 +25,7 @@ import logging
 
 from .adapter import Adapter, FakeAdapter
 
-from .protocol import ProtocolAdapter
+from .protocol import ProtocolAdapter, ReplayAdapter
 
 from pymeasure.adapters.telnet import TelnetAdapter
 
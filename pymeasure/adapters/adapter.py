@@ -23,12 +23,17 @@
 #
 
 import logging
+from contextlib import contextmanager
+from time import perf_counter
 from warnings import warn
 
 import numpy as np
 from copy import copy
 from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
 
+from pymeasure.log import truncate_message
+from .profiling import IOProfile
+
 
 class Adapter:
     """ Base class for Adapter child classes, which adapt between the Instrument
@@ -48,6 +53,11 @@ class Adapter:
     :param \\**kwargs: Keyword arguments just to be cooperative.
     """
 
+    #: Maximum number of characters or bytes of a message in the debug log, longer messages
+    #: are truncated. Set it to None to log the complete messages.
+    log_limit = 1024
+    _profile = None  # IOProfile, while profiling
+
     def __init__(self, preprocess_reply=None, log=None, **kwargs):
         super().__init__(**kwargs)
         self.preprocess_reply = preprocess_reply
@@ -71,6 +81,36 @@ class Adapter:
         if self.connection is not None:
             self.connection.close()
 
+    @contextmanager
+    def profile(self, profile=None):
+        """Record number, size, and duration of the transfers within this context.
+
+        .. code::
+
+            with instrument.adapter.profile() as profile:
+                procedure.execute()
+            print(profile.report())  # slowest command prefixes
+            print(profile.report(by="caller"))  # slowest methods
+
+        :param profile: An :class:`~pymeasure.adapters.profiling.IOProfile` to continue,
+            for example to combine several adapters. If None, a new one is created.
+        :return: The :class:`~pymeasure.adapters.profiling.IOProfile`.
+        """
+        previous = self._profile
+        self._profile = IOProfile() if profile is None else profile
+        try:
+            yield self._profile
+        finally:
+            self._profile = previous
+
+    def _profiled(self, direction, method, *args, **kwargs):
+        """Call `method` and record its duration."""
+        start = perf_counter()
+        result = method(*args, **kwargs)
+        duration = perf_counter() - start
+        self._profile.record(direction, args[0] if direction == "write" else result, duration)
+        return result
+
     # Directly called methods, which ensure proper logging of the communication
     # without the termination characters added by the particular adapters.
     # DO NOT OVERRIDE IN SUBCLASS!
@@ -83,8 +123,12 @@ class Adapter:
             (without termination).
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
-        self.log.debug("WRITE:%s", command)
-        self._write(command, **kwargs)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("WRITE:%s", truncate_message(command, self.log_limit))
+        if self._profile is None:
+            self._write(command, **kwargs)
+        else:
+            self._profiled("write", self._write, command, **kwargs)
 
     def write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument.
@@ -94,8 +138,12 @@ class Adapter:
         :param bytes content: The bytes to write to the instrument.
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
-        self.log.debug("WRITE:%s", content)
-        self._write_bytes(content, **kwargs)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("WRITE:%s", truncate_message(content, self.log_limit))
+        if self._profile is None:
+            self._write_bytes(content, **kwargs)
+        else:
+            self._profiled("write", self._write_bytes, content, **kwargs)
 
     def read(self, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -105,8 +153,12 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        read = self._read(**kwargs)
-        self.log.debug("READ:%s", read)
+        if self._profile is None:
+            read = self._read(**kwargs)
+        else:
+            read = self._profiled("read", self._read, **kwargs)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("READ:%s", truncate_message(read, self.log_limit))
         return read
 
     def read_bytes(self, count=-1, break_on_termchar=False, **kwargs):
@@ -120,8 +172,12 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns bytes: Bytes response of the instrument (including termination).
         """
-        read = self._read_bytes(count, break_on_termchar, **kwargs)
-        self.log.debug("READ:%s", read)
+        if self._profile is None:
+            read = self._read_bytes(count, break_on_termchar, **kwargs)
+        else:
+            read = self._profiled("read", self._read_bytes, count, break_on_termchar, **kwargs)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("READ:%s", truncate_message(read, self.log_limit))
         return read
 
     # Methods to implement in the subclasses.
@@ -0,0 +1,144 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+
+# Files whose frames are skipped to find the caller of a transfer.
+_INTERNAL_FILES = tuple(
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "instruments", name)
+    for name in ("common_base.py", "instrument.py", "channel.py")
+)
+_ADAPTERS_DIR = os.path.dirname(__file__) + os.sep
+_COMMON_BASE = _INTERNAL_FILES[0]
+# Names of the property functions of CommonBase.control and their command arguments.
+_PROPERTY_COMMANDS = {"fget": ("get", "get_command"), "fset": ("set", "set_command")}
+
+# Upper edges of the latency histogram bins: 1 µs to 10 s, two bins per decade.
+HISTOGRAM_EDGES = tuple(10 ** (exponent / 2) for exponent in range(-12, 3))
+
+
+def command_prefix(message, length=20):
+    """Return the first word of a message, at most `length` characters long."""
+    if message is None:
+        return ""
+    start = message[:length]
+    if isinstance(start, (bytes, bytearray, memoryview)):
+        start = bytes(start).decode("ascii", errors="replace")
+    words = start.split(None, 1)
+    return words[0] if words else ""
+
+
+class IOStatistics:
+    """Statistics of the transfers of one command prefix or caller."""
+
+    def __init__(self):
+        self.writes = 0
+        self.reads = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.time = 0.
+        self.max_time = 0.
+        self.histogram = [0] * (len(HISTOGRAM_EDGES) + 1)
+
+    @property
+    def count(self):
+        """Number of transfers."""
+        return self.writes + self.reads
+
+    def add(self, direction, nbytes, duration):
+        if direction == "write":
+            self.writes += 1
+            self.bytes_written += nbytes
+        else:
+            self.reads += 1
+            self.bytes_read += nbytes
+        self.time += duration
+        self.max_time = max(self.max_time, duration)
+        self.histogram[bisect_right(HISTOGRAM_EDGES, duration)] += 1
+
+
+class IOProfile:
+    """Record the communication of adapters, see :meth:`Adapter.profile`.
+
+    The transfers are grouped by the command prefix (the first word of the last written message)
+    and by the caller. The caller is the property of an instrument or channel, for example
+    ``Keithley2400.get(':READ?')`` for a measurement, or otherwise the first function outside of
+    the adapter and the instrument base classes, for example a driver method or the `execute`
+    method of a procedure.
+    """
+
+    def __init__(self):
+        self.by_command = defaultdict(IOStatistics)
+        self.by_caller = defaultdict(IOStatistics)
+        self._command = ""
+
+    def record(self, direction, message, duration):
+        """Record a transfer.
+
+        :param str direction: "write" or "read".
+        :param message: The written or read message.
+        :param float duration: Duration of the transfer in s.
+        """
+        if direction == "write":
+            self._command = command_prefix(message)
+        nbytes = len(message) if message is not None else 0
+        self.by_command[self._command].add(direction, nbytes, duration)
+        self.by_caller[self._find_caller()].add(direction, nbytes, duration)
+
+    @staticmethod
+    def _find_caller():
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
+            if filename == _COMMON_BASE and code.co_name in _PROPERTY_COMMANDS:
+                # All properties share the code of fget and fset, their command identifies them.
+                action, argument = _PROPERTY_COMMANDS[code.co_name]
+                f_locals = frame.f_locals
+                return (f"{type(f_locals.get('self')).__name__}.{action}"
+                        f"({f_locals.get(argument)!r})")
+            if not (filename.startswith(_ADAPTERS_DIR) or filename in _INTERNAL_FILES):
+                return getattr(code, "co_qualname", code.co_name)
+            frame = frame.f_back
+        return ""
+
+    def report(self, by="command", limit=None):
+        """Return a table of the statistics sorted by the total time.
+
+        :param str by: Group by "command" prefix or "caller".
+        :param int limit: Maximum number of rows.
+        :return str: The table.
+        """
+        statistics = self.by_command if by == "command" else self.by_caller
+        rows = sorted(statistics.items(), key=lambda item: item[1].time, reverse=True)
+        lines = [f"{by:<30} {'count':>7} {'bytes':>10} {'total (s)':>10} {'mean (ms)':>10} "
+                 f"{'max (ms)':>10}"]
+        for key, stat in rows[:limit]:
+            lines.append(f"{key:<30.30} {stat.count:>7} {stat.bytes_written + stat.bytes_read:>10} "
+                         f"{stat.time:>10.4f} {1e3 * stat.time / stat.count:>10.3f} "
+                         f"{1e3 * stat.max_time:>10.3f}")
+        return "\n".join(lines)
@@ -23,7 +23,7 @@
 #
 
 import logging
-from unittest.mock import MagicMock
+import time
 from warnings import warn
 
 from .adapter import Adapter
@@ -53,7 +53,8 @@ class ProtocolAdapter(Adapter):
     This adapter is primarily meant for use within :func:`pymeasure.test.expected_protocol()`.
 
     The :attr:`connection` attribute is a :class:`unittest.mock.MagicMock` such
-    that every call returns. If you want to set a return value, you can use
+    that every call returns. It is only created, when it is accessed for the first time.
+    If you want to set a return value, you can use
     :code:`adapter.connection.some_method.return_value = 7`,
     such that a call to :code:`adapter.connection.some_method()` will return `7`.
     Similarly, you can verify that this call to the connection method happened
@@ -90,40 +91,83 @@ class ProtocolAdapter(Adapter):
         self._setup_connection(connection_attributes, connection_methods)
 
     def _setup_connection(self, connection_attributes, connection_methods):
-        self.connection = MagicMock()
-        if connection_attributes is not None:
-            for key, value in connection_attributes.items():
-                setattr(self.connection, key, value)
-        if connection_methods is not None:
-            for key, value in connection_methods.items():
-                getattr(self.connection, key).return_value = value
+        self._connection_setup = connection_attributes, connection_methods
+
+    @property
+    def comm_pairs(self):
+        """List of the "reference" message pair tuples, see the class parameters."""
+        return self._comm_pairs
+
+    @comm_pairs.setter
+    def comm_pairs(self, value):
+        self._comm_pairs = value
+        self._pairs = []  # comm_pairs converted to bytes
+
+    def _get_pair(self):
+        """Get the current communication pair as bytes, converting each pair only once.
+
+        The conversion happens on demand, as pairs may be appended to :attr:`comm_pairs` later on.
+        """
+        while len(self._pairs) <= self._index:
+            p_write, p_read = self.comm_pairs[len(self._pairs)]
+            self._pairs.append((to_bytes(p_write), to_bytes(p_read)))
+        return self._pairs[self._index]
+
+    @property
+    def connection(self):
+        """Mocked connection, created at first access (creating it is expensive)."""
+        if self._connection is None:
+            from unittest.mock import MagicMock  # slow to import
+
+            connection_attributes, connection_methods = self._connection_setup
+            self._connection = MagicMock()
+            if connection_attributes is not None:
+                for key, value in connection_attributes.items():
+                    setattr(self._connection, key, value)
+            if connection_methods is not None:
+                for key, value in connection_methods.items():
+                    getattr(self._connection, key).return_value = value
+        return self._connection
+
+    @connection.setter
+    def connection(self, value):
+        self._connection = value
+
+    def close(self):
+        """Close the connection, if it has been created."""
+        if getattr(self, "_connection", None) is not None:
+            self._connection.close()
 
     def _write(self, command, **kwargs):
         """Compare the command with the expected one and fill the read."""
         self._write_bytes(to_bytes(command))
         assert self._write_buffer is None, (
-            f"Written bytes '{self._write_buffer}' do not match expected "
+            f"Written bytes '{bytes(self._write_buffer)}' do not match expected "
             f"'{self.comm_pairs[self._index][0]}'.")
 
     def _write_bytes(self, content, **kwargs):
-        """Write the bytes `content`. If a command is full, fill the read."""
+        """Write the bytes `content`. If a command is full, fill the read.
+
+        A message composed of several writes is collected in a bytearray, which is extended in
+        place instead of concatenating bytes for each write.
+        """
         if self._write_buffer is None:
-            self._write_buffer = content
+            self._write_buffer = bytearray(content)
         else:
             self._write_buffer += content
         try:
-            p_write, p_read = self.comm_pairs[self._index]
+            p_write, p_read = self._get_pair()
         except IndexError:
             raise ValueError(f"No communication pair left to write {content}.")
-        if self._write_buffer == to_bytes(p_write):
+        if self._write_buffer == p_write:
             assert self._read_buffer is None, (
-                f"Unread response '{self._read_buffer}' present when writing. "
+                f"Unread response '{bytes(self._read_buffer)}' present when writing. "
                 "Maybe a property's 'check_set_errors' is not accounted for, "
                 "a read() call is missing in a method, or the defined protocol is incorrect?"
             )
             # Clear the write buffer
             self._write_buffer = None
-            self._read_buffer = to_bytes(p_read)
+            self._read_buffer = p_read
             self._index += 1
         # If _write_buffer does _not_ agree with p_write, this is not cause for
         # concern, because you can in principle compose a message over several writes.
@@ -138,6 +182,9 @@ class ProtocolAdapter(Adapter):
         """Read `count` number of bytes from the buffer.
 
         :param int count: Number of bytes to read. If -1, return the buffer.
+
+        A partially read message is kept as a memoryview, such that reading a large message in
+        parts does not copy the remainder for each part.
         """
         if break_on_termchar:
             warn(("Breaking on termination character in `read_bytes` cannot be tested. "
@@ -149,25 +196,25 @@ class ProtocolAdapter(Adapter):
                 self._read_buffer = None
             else:
                 read = self._read_buffer[:count]
-                self._read_buffer = self._read_buffer[count:]
-            return read
+                self._read_buffer = memoryview(self._read_buffer)[count:]
+            return bytes(read)
         else:
             try:
-                p_write, p_read = self.comm_pairs[self._index]
+                p_write, p_read = self._get_pair()
             except IndexError:
                 raise ValueError("No communication pair left for reading.")
             assert p_write is None, (
-                f"Written {self._write_buffer} do not match expected {p_write} prior to read."
+                f"Written {bytes(self._write_buffer)} do not match expected {p_write} "
+                "prior to read."
                 if self._write_buffer
                 else "Unexpected read without prior write.")
             assert p_read is not None, "Communication pair cannot be (None, None)."
             self._index += 1
-            p_read = to_bytes(p_read)
             if count == -1 or count >= len(p_read):
                 # _read_buffer is already empty, no action required.
                 return p_read
             else:
-                self._read_buffer = p_read[count:]
+                self._read_buffer = memoryview(p_read)[count:]
                 return p_read[:count]
 
     def flush_read_buffer(self):
@@ -178,3 +225,77 @@ class ProtocolAdapter(Adapter):
         encountering an END indicator (which causes loss of data).
         """
         self.connection.flush("pyvisa.constants.BufferOperation.discard_read_buffer")
+
+
+class ReplayAdapter(ProtocolAdapter):
+    """Adapter replaying a recorded session with its timing.
+
+    Like the :class:`ProtocolAdapter`, it verifies the written messages and returns the recorded
+    responses. Additionally, a response is only available after the recorded delay since its
+    command has been written, which allows to benchmark procedures offline with realistic
+    latencies.
+
+    Record a session by adding a :class:`~pymeasure.generator.ByteStreamHandler` with
+    :code:`timestamps=True` to the logger of the adapter (see :meth:`from_file`):
+
+    .. code::
+
+        adapter.log_limit = None  # record complete messages
+        adapter.log.addHandler(ByteStreamHandler(open("session.txt", "wb"), timestamps=True))
+        adapter.log.setLevel(logging.DEBUG)
+
+    :param list comm_pairs: List of message pair tuples, see :class:`ProtocolAdapter`.
+    :param list delays: Delay in s between the write and the (last) read of each pair.
+        If None, no delays are applied.
+    :param float time_scale: Factor applied to all delays, e.g. 0 to replay without delays or
+        2 to simulate a device twice as slow.
+    :param \\**kwargs: Keyword arguments for the :class:`ProtocolAdapter`.
+    """
+
+    def __init__(self, comm_pairs=None, delays=None, time_scale=1, **kwargs):
+        super().__init__(comm_pairs, **kwargs)
+        if delays is None:
+            delays = [0] * len(self.comm_pairs)
+        if len(delays) != len(self.comm_pairs):
+            raise ValueError("There has to be one delay per communication pair.")
+        self.delays = delays
+        self.time_scale = time_scale
+        self._ready_at = None
+
+    @classmethod
+    def from_file(cls, filename, time_scale=1, **kwargs):
+        """Create an adapter from a session recorded with timestamps.
+
+        :param str filename: Name of the file written by the
+            :class:`~pymeasure.generator.ByteStreamHandler`.
+        :param float time_scale: Factor applied to all delays.
+        :param \\**kwargs: Keyword arguments for the adapter.
+        """
+        from pymeasure.generator import parse_stream
+
+        with open(filename, "rb") as file:
+            comm_pairs, delays = parse_stream(file, timing=True)
+        return cls(comm_pairs, delays=delays, time_scale=time_scale, **kwargs)
+
+    def _wait(self):
+        """Wait until the current response is available."""
+        if self._ready_at is not None:
+            remaining = self._ready_at - time.perf_counter()
+            self._ready_at = None
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _write_bytes(self, content, **kwargs):
+        """Write the bytes `content` and start the delay of the response."""
+        index = self._index
+        super()._write_bytes(content, **kwargs)
+        if self._index > index and self._read_buffer is not None:
+            self._ready_at = time.perf_counter() + self.delays[index] * self.time_scale
+
+    def _read_bytes(self, count, break_on_termchar=False, **kwargs):
+        """Read `count` number of bytes, after the response is available."""
+        if self._read_buffer is None and self._index < len(self.delays):
+            # Response without a command, wait the whole delay.
+            self._ready_at = time.perf_counter() + self.delays[self._index] * self.time_scale
+        self._wait()
+        return super()._read_bytes(count, break_on_termchar, **kwargs)
@@ -25,6 +25,7 @@
 import logging
 
 import serial
+from pymeasure.log import truncate_message
 from .adapter import Adapter
 
 log = logging.getLogger(__name__)
@@ -107,21 +108,64 @@ class SerialAdapter(Adapter):
             return self.connection.read(count, **kwargs)
         else:
             # For -1 we empty the buffer completely
-            return self._read_bytes_until_timeout()
+            return self._read_bytes_until_timeout(**kwargs)
 
     def _read_bytes_until_timeout(self, chunk_size=256, **kwargs):
         """Read from the serial until a timeout occurs, regardless of the number of bytes.
 
-        :chunk_size: The number of bytes attempted to in a single transaction.
+        :chunk_size: The minimum number of bytes attempted to in a single transaction.
             Multiple of these transactions will occur.
         """
         # `Serial.readlines()` has an unpredictable timeout, see PR #866
-        data = bytes()
-        while True:
-            chunk = self.connection.read(chunk_size, **kwargs)
+        data = bytearray()
+        for chunk in self._iter_chunks(-1, chunk_size, **kwargs):
             data += chunk
-            if len(chunk) < chunk_size:  # If fewer bytes got returned, we had a timeout
-                return data
+        return bytes(data)
+
+    def _iter_chunks(self, count, chunk_size, **kwargs):
+        """Read `count` bytes (-1 for up to a timeout) in chunks and yield them.
+
+        Each read requests at least `chunk_size` bytes, or everything which is already
+        waiting in the input buffer, whichever is larger.
+        """
+        remaining = count if count >= 0 else None
+        while remaining is None or remaining > 0:
+            size = max(chunk_size, self.connection.in_waiting)
+            if remaining is not None:
+                size = min(size, remaining)
+                remaining -= size
+            chunk = self.connection.read(size, **kwargs)
+            if chunk:
+                yield chunk
+            if len(chunk) < size:  # If fewer bytes got returned, we had a timeout
+                return
+
+    def iter_bytes(self, count=-1, break_on_termchar=False, chunk_size=4096, **kwargs):
+        """Read bytes from the instrument and yield them in chunks as they arrive.
+
+        This allows to process (e.g. write to disk) large responses without holding
+        all of them in memory. Reading stops after `count` bytes, at the termination
+        character, or when a timeout occurs.
+
+        :param int count: Number of bytes to read. A value of -1 indicates to
+            read until a timeout occurs.
+        :param bool break_on_termchar: Stop reading at a termination character. In this
+            case the response is read by a single call to `read_until` of the connection,
+            which yields one chunk.
+        :param int chunk_size: Minimum number of bytes requested in a single read.
+            If more bytes are already waiting, all of them are read at once.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns: Iterator of bytes chunks (including termination).
+        """
+        if break_on_termchar and self.read_termination:
+            chunks = iter((self._read_bytes(count, True, **kwargs),))
+        else:
+            chunks = self._iter_chunks(count, chunk_size, **kwargs)
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        for chunk in chunks:
+            if debug:
+                self.log.debug("READ:%s", truncate_message(chunk, self.log_limit))
+            yield chunk
 
     def flush_read_buffer(self):
         """Flush and discard the input buffer."""
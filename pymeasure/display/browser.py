@@ -128,6 +128,29 @@ class Browser(QtWidgets.QTreeWidget):
         adds a BrowserItem to the Browser, filling all relevant columns with
         Parameter data.
         """
+        item = self._prepare_item(experiment)
+        self.addTopLevelItem(item)
+        self.setItemWidget(item, 2, item.progressbar)
+        return item
+
+    def add_all(self, experiments):
+        """Add several :class:`Experiment<pymeasure.display.manager.Experiment>` objects
+        to the Browser (see :meth:`add`) in one update.
+        """
+        items = [self._prepare_item(experiment) for experiment in experiments]
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        try:
+            self.addTopLevelItems(items)
+            for item in items:
+                self.setItemWidget(item, 2, item.progressbar)
+        finally:
+            self.setSortingEnabled(sorting)
+            self.setUpdatesEnabled(True)
+        return items
+
+    def _prepare_item(self, experiment):
         experiment_parameters = experiment.procedure.parameter_objects()
         experiment_parameter_names = list(experiment_parameters.keys())
 
@@ -142,7 +165,4 @@ class Browser(QtWidgets.QTreeWidget):
         for i, column in enumerate(self.display_parameters):
             if column in experiment_parameter_names:
                 item.setText(i + 4, str(experiment_parameters[column]))
-
-        self.addTopLevelItem(item)
-        self.setItemWidget(item, 2, item.progressbar)
         return item
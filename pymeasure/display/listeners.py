@@ -23,10 +23,12 @@
 #
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .Qt import QtCore
 from .thread import StoppableQThread
 from ..experiment.procedure import Procedure
+from ..experiment.results import Results
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -125,3 +127,52 @@ class Monitor(QtCore.QThread):
                 self.log.emit(data)
 
         log.info("Monitor caught stop command")
+
+
+class ResultsLoader(StoppableQThread):
+    """QThread loading results files in a pool of background threads.
+
+    Each file is loaded (including its data, if `read_data` is True) and emitted with the
+    :attr:`loaded` signal as soon as it is ready, such that the results can be shown
+    progressively. :meth:`stop` cancels the files not yet loaded.
+
+    :param filenames: List of the filenames to load.
+    :param max_workers: Number of loading threads, see
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+    :param read_data: Whether to read the data as well, otherwise only the headers are parsed
+        and the data is read on first access (e.g. when the curves are shown).
+    """
+
+    loaded = QtCore.Signal(object)  # Results
+    failed = QtCore.Signal(str, str)  # filename, error message
+
+    def __init__(self, filenames, max_workers=None, read_data=True, parent=None):
+        super().__init__(parent)
+        self.filenames = list(filenames)
+        self.max_workers = max_workers
+        self.read_data = read_data
+
+    @staticmethod
+    def load(filename, read_data=True):
+        results = Results.load(filename)
+        if read_data:
+            results.data  # read the data in the background thread
+        return results
+
+    def run(self):
+        with ThreadPoolExecutor(self.max_workers) as pool:
+            futures = {pool.submit(self.load, filename, self.read_data): filename
+                       for filename in self.filenames}
+            for future in as_completed(futures):
+                if self.should_stop():
+                    for f in futures:
+                        f.cancel()
+                    log.info("Loading of results files cancelled")
+                    break
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    log.exception("Could not load data file %s", futures[future])
+                    self.failed.emit(futures[future], str(exc))
+                else:
+                    self.loaded.emit(results)
@@ -24,6 +24,7 @@
 
 import logging
 
+from collections import deque
 from logging import Handler
 
 from .Qt import QtCore
@@ -52,3 +53,38 @@ class LogHandler(Handler):
 
     def emit(self, record):
         self.emitter.record.emit(self.format(record))
+
+
+class BufferedLogHandler(Handler):
+    """ Log handler which collects the records in a bounded buffer instead of emitting a signal
+    for each record. The records are taken with :meth:`take`, e.g. periodically by a timer in
+    the GUI thread, which also formats them.
+
+    :param capacity: Maximum number of buffered records. If the buffer is full, the oldest
+        record is dropped.
+    """
+
+    def __init__(self, capacity=1000):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def emit(self, record):
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        self.records.append(record)
+
+    def take(self):
+        """ Take the buffered records out of the buffer.
+
+        :return: Tuple of the list of records and the number of records dropped since the
+            last call.
+        """
+        self.acquire()
+        try:
+            records, dropped = list(self.records), self.dropped
+            self.records.clear()
+            self.dropped = 0
+        finally:
+            self.release()
+        return records, dropped
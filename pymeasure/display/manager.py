@@ -23,7 +23,10 @@
 #
 
 import logging
+import os
 
+from collections import Counter, deque
+from itertools import count
 from os.path import basename
 
 from .Qt import QtCore
@@ -45,58 +48,102 @@ class Experiment(QtCore.QObject):
         an experiment. They could represent different views of the same experiment. Not required
         for `.ManagedConsole` displayed experiments.
     :param browser_item: :class:`.BaseBrowserItem` based object
+    :param curve_factory: Callable, which returns the curve list for the results. If given, the
+        curves are created (by the :class:`Manager`) when the experiment starts.
     """
 
-    def __init__(self, results, curve_list=None, browser_item=None, parent=None):
+    def __init__(self, results, curve_list=None, browser_item=None, parent=None,
+                 curve_factory=None):
         super().__init__(parent)
         self.results = results
         self.data_filename = self.results.data_filename
         self.procedure = self.results.procedure
         self.curve_list = curve_list
         self.browser_item = browser_item
+        self.curve_factory = curve_factory
 
 
 class ExperimentQueue(QtCore.QObject):
     """ Represents a queue of Experiments and allows queries to
     be easily preformed.
+
+    The experiments are indexed by their filename and browser item. Experiments, which are
+    queued (their procedure has the status QUEUED) when they are appended, are kept in a queue
+    from which :meth:`next` takes them in order.
     """
 
     def __init__(self):
         super().__init__()
-        self.queue = []
+        self._experiments = {}  # ordered set of the experiments: {experiment: append count}
+        self._appended = count()
+        self._order = []  # list of the experiments for indexing, rebuilt after a removal
+        self._queued = deque()  # (append count, experiment) of queued experiments
+        self._filenames = Counter()
+        self._browser_items = {}
+
+    @property
+    def queue(self):
+        """ Tuple of all experiments. It is a read-only snapshot, use :meth:`append` and
+        :meth:`remove` to change the queue. """
+        return tuple(self)
 
     def append(self, experiment):
-        self.queue.append(experiment)
+        self._experiments[experiment] = appended = next(self._appended)
+        if self._order is not None:
+            self._order.append(experiment)
+        if experiment.procedure.status == Procedure.QUEUED:
+            self._queued.append((appended, experiment))
+        self._filenames[basename(experiment.data_filename)] += 1
+        if experiment.browser_item is not None:
+            self._browser_items[id(experiment.browser_item)] = experiment
 
     def remove(self, experiment):
-        if experiment not in self.queue:
+        if experiment not in self._experiments:
             raise Exception("Attempting to remove an Experiment that is "
                             "not in the ExperimentQueue")
         else:
             if experiment.procedure.status == Procedure.RUNNING:
                 raise Exception("Attempting to remove a running experiment")
             else:
-                self.queue.pop(self.queue.index(experiment))
+                # Removed experiments are skipped in (and then removed from) the queue by next
+                del self._experiments[experiment]
+                self._order = None
+                filename = basename(experiment.data_filename)
+                self._filenames[filename] -= 1
+                if not self._filenames[filename]:
+                    del self._filenames[filename]
+                if self._browser_items.get(id(experiment.browser_item)) is experiment:
+                    del self._browser_items[id(experiment.browser_item)]
 
     def __contains__(self, value):
         if isinstance(value, Experiment):
-            return value in self.queue
+            return value in self._experiments
         if isinstance(value, str):
-            for experiment in self.queue:
-                if basename(experiment.data_filename) == basename(value):
-                    return True
-            return False
+            return basename(value) in self._filenames
         return False
 
     def __getitem__(self, key):
-        return self.queue[key]
+        if self._order is None:
+            self._order = list(self._experiments)
+        return self._order[key]
+
+    def __iter__(self):
+        return iter(self._experiments)
+
+    def __len__(self):
+        return len(self._experiments)
 
     def next(self):
         """ Returns the next experiment on the queue
         """
-        for experiment in self.queue:
-            if experiment.procedure.status == Procedure.QUEUED:
+        while self._queued:
+            appended, experiment = self._queued[0]
+            # Skip experiments, which have been removed (and maybe appended again later on)
+            if (self._experiments.get(experiment) == appended
+                    and experiment.procedure.status == Procedure.QUEUED):
                 return experiment
+            # The experiment has been started or removed
+            self._queued.popleft()
         raise StopIteration("There are no queued experiments")
 
     def has_next(self):
@@ -110,10 +157,7 @@ class ExperimentQueue(QtCore.QObject):
         return True
 
     def with_browser_item(self, item):
-        for experiment in self.queue:
-            if experiment.browser_item is item:
-                return experiment
-        return None
+        return self._browser_items.get(id(item))
 
 
 class BaseManager(QtCore.QObject):
@@ -170,6 +214,12 @@ class BaseManager(QtCore.QObject):
         """
         self.experiments.append(experiment)
 
+    def load_all(self, experiments):
+        """ Load several Experiments at once
+        """
+        for experiment in experiments:
+            self.experiments.append(experiment)
+
     def queue(self, experiment):
         """ Adds an experiment to the queue.
         """
@@ -178,15 +228,34 @@ class BaseManager(QtCore.QObject):
         if self._start_on_add and not self.is_running():
             self.next()
 
+    def queue_all(self, experiments):
+        """ Adds several experiments to the queue at once, e.g. the experiments of a sequence.
+        """
+        experiments = list(experiments)
+        self.load_all(experiments)
+        for experiment in experiments:
+            self.queued.emit(experiment)
+        if self._start_on_add and not self.is_running():
+            self.next()
+
     def remove(self, experiment):
         """ Removes an Experiment
+
+        The data file of an experiment, which has not been started, is deleted if it is still
+        empty, as it has only been created to reserve the filename.
         """
         self.experiments.remove(experiment)
+        if experiment.procedure.status == Procedure.QUEUED:
+            try:
+                if os.path.getsize(experiment.data_filename) == 0:
+                    os.remove(experiment.data_filename)
+            except OSError:
+                pass  # the file does not exist (anymore)
 
     def clear(self):
         """ Remove all Experiments
         """
-        for experiment in self.experiments[:]:
+        for experiment in list(self.experiments):
             self.remove(experiment)
 
     def next(self):
@@ -301,6 +370,38 @@ class Manager(BaseManager):
 
         super().load(experiment)
         self.browser.add(experiment)
+        self._load_curves(experiment)
+
+    def load_all(self, experiments):
+        """ Load several Experiments at once, their browser items are added in one update
+        """
+        super().load_all(experiments)
+        self.browser.add_all(experiments)
+        for experiment in experiments:
+            self._load_curves(experiment)
+
+    def next(self):
+        if not self.is_running() and self.experiments.has_next():
+            self._create_curves(self.experiments.next())
+        super().next()
+
+    def _create_curves(self, experiment):
+        """ Creates the curves of an experiment, which have been deferred to its start
+        """
+        if experiment.curve_factory is None:
+            return
+        experiment.results.write_header()  # the curves read the data file
+        experiment.curve_list = experiment.curve_factory(experiment.results)
+        experiment.curve_factory = None
+        self._load_curves(experiment)
+
+    @staticmethod
+    def _load_curves(experiment):
+        """ Loads the curves of an experiment into their widgets, unless the experiment is
+        hidden (its browser item is unchecked), in which case the data is not read either
+        """
+        if experiment.browser_item.checkState(0) != QtCore.Qt.CheckState.Checked:
+            return
         for curve in experiment.curve_list:
             if curve:
                 curve.wdg.load(curve)
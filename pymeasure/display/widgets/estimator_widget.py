@@ -48,9 +48,12 @@ class EstimatorThread(StoppableQThread):
     def __del__(self):
         self.wait()
 
-    def run(self):
+    def start(self):
+        # Clear the flag before the thread runs, such that an immediate stop is not lost.
         self._should_stop.clear()
+        super().start()
 
+    def run(self):
         while not self._should_stop.wait(self.delay):
             estimates = self._get_estimates()
             self.new_estimates.emit(estimates)
@@ -71,6 +74,11 @@ class EstimatorWidget(QtWidgets.QWidget):
     asking for two keyword arguments in the Implementation of the `get_estimates` function:
     `sequence` and `sequence_length`, respectively.
 
+    The sequence (or only its length, if the sequence itself is not asked for) is evaluated
+    only when the sequence has been changed. If `get_estimates` returns a duration, it is called
+    only when the parameters or the sequence have been changed. Estimates returned as a list are
+    requested on every update, as they may contain the current time.
+
     """
     provide_sequence = False
     provide_sequence_length = False
@@ -80,6 +88,8 @@ class EstimatorWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._parent = parent
+        self._sequence_cache = None  # (sequence text, sequence, sequence length)
+        self._duration_cache = None  # (fingerprint of the inputs, duration)
 
         self.check_get_estimates_signature()
 
@@ -169,15 +179,7 @@ class EstimatorWidget(QtWidgets.QWidget):
 
         kwargs = dict()
 
-        sequence = None
-        sequence_length = None
-        if hasattr(self._parent, "sequencer"):
-            try:
-                sequence = self._parent.sequencer.get_sequence()
-            except SequenceEvaluationError:
-                sequence_length = 0
-            else:
-                sequence_length = len(sequence)
+        sequence_text, sequence, sequence_length = self._get_sequence()
 
         if self.provide_sequence:
             kwargs["sequence"] = sequence
@@ -185,13 +187,40 @@ class EstimatorWidget(QtWidgets.QWidget):
         if self.provide_sequence_length:
             kwargs["sequence_length"] = sequence_length
 
-        estimates = procedure.get_estimates(**kwargs)
+        fingerprint = (repr(procedure.parameter_values()), sequence_text)
+        if self._duration_cache is not None and self._duration_cache[0] == fingerprint:
+            estimates = self._duration_cache[1]
+        else:
+            estimates = procedure.get_estimates(**kwargs)
+            if isinstance(estimates, (int, float)):
+                self._duration_cache = (fingerprint, estimates)
 
         if isinstance(estimates, (int, float)):
             estimates = self._estimates_from_duration(estimates, sequence_length)
 
         return estimates
 
+    def _get_sequence(self):
+        """ Return the text, the sequence (if asked for) and the length of the sequence of the
+        sequencer, which are only evaluated if the sequence text has been changed.
+        """
+        if not hasattr(self._parent, "sequencer"):
+            return None, None, None
+
+        sequence_text = str(self._parent.sequencer.data)
+        if self._sequence_cache is None or self._sequence_cache[0] != sequence_text:
+            sequence = None
+            try:
+                if self.provide_sequence:
+                    sequence = self._parent.sequencer.get_sequence()
+                    sequence_length = len(sequence)
+                else:
+                    sequence_length = self._parent.sequencer.get_sequence_length()
+            except SequenceEvaluationError:
+                sequence_length = 0
+            self._sequence_cache = (sequence_text, sequence, sequence_length)
+        return self._sequence_cache
+
     def update_estimates(self):
         """ Method that gets and displays the estimates.
         Implemented for connecting to the 'update'-button.
@@ -24,7 +24,7 @@
 
 import logging
 
-from ..log import LogHandler
+from ..log import BufferedLogHandler
 from ..Qt import QtWidgets, QtCore, QtGui
 from .tab_widget import TabWidget
 
@@ -71,10 +71,16 @@ class LogWidget(TabWidget, QtWidgets.QWidget):
 
     It is recommended to include this widget in all subclasses of
     :class:`ManagedWindowBase<pymeasure.display.windows.managed_window.ManagedWindowBase>`
+
+    The log records are collected by the :attr:`handler` and added to the view in batches
+    every :attr:`update_interval` ms. The view keeps the last :attr:`maximum_lines` records;
+    records exceeding that number within one batch are dropped and only counted.
     """
 
     fmt = '%(asctime)s : %(message)s (%(levelname)s)'
     datefmt = '%m/%d/%Y %I:%M:%S %p'
+    maximum_lines = 1000
+    update_interval = 100  # ms
 
     tab_widget = None
     tab_index = None
@@ -95,17 +101,34 @@ class LogWidget(TabWidget, QtWidgets.QWidget):
 
         # Setup blinking
         self._blink_qtimer.timeout.connect(self._blink)
-        self.handler.connect(self._blinking_start)
+
+        self._update_qtimer = QtCore.QTimer(self)
+        self._update_qtimer.timeout.connect(self.update_view)
+        self._update_qtimer.start(self.update_interval)
 
     def _setup_ui(self):
         self.view = QtWidgets.QPlainTextEdit()
         self.view.setReadOnly(True)
-        self.handler = LogHandler()
+        self.view.setMaximumBlockCount(self.maximum_lines)
+        # one line is left for the number of dropped records
+        self.handler = BufferedLogHandler(capacity=self.maximum_lines - 1)
         self.handler.setFormatter(HTMLFormatter(
             fmt=self.fmt,
             datefmt=self.datefmt,
         ))
-        self.handler.connect(self.view.appendHtml)
+
+    def update_view(self):
+        """ Add the log records collected since the last update to the view. """
+        records, dropped = self.handler.take()
+        if dropped:
+            self.view.appendHtml(f"<!--INFO--><i>... {dropped} log messages dropped ...</i>")
+        for record in records:
+            self.view.appendHtml(self.handler.format(record))
+
+        if records:
+            most_severe = max(records, key=lambda record: record.levelno)
+            if most_severe.levelno >= logging.WARNING:
+                self._blinking_start(f"<!--{most_severe.levelname}-->")
 
     def _layout(self):
         vbox = QtWidgets.QVBoxLayout(self)
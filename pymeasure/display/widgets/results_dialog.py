@@ -37,6 +37,8 @@ class ResultsDialog(QtWidgets.QFileDialog):
     """
     Widget that displays a dialog box for loading a past experiment run.
     It shows a preview of curves from the results file when selected in the dialog box.
+    Experiments may be opened hidden, see :attr:`open_hidden`, which defers reading their
+    data until they are shown.
 
     This widget used by the `open_experiment` method in
     :class:`ManagedWindowBase<pymeasure.display.windows.managed_window.ManagedWindowBase>` class
@@ -87,12 +89,19 @@ class ResultsDialog(QtWidgets.QFileDialog):
         preview_tab.addTab(metadata_vbox_widget, "Metadata")
         self.layout().addWidget(preview_tab, 0, 5, 4, 1)
         self.layout().setColumnStretch(5, 1)
+        self.hidden_checkbox = QtWidgets.QCheckBox("Open hidden (read the data when shown)")
+        self.layout().addWidget(self.hidden_checkbox, 4, 0, 1, 5)
         self.setMinimumSize(900, 500)
         self.resize(900, 500)
 
         self.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFiles)
         self.currentChanged.connect(self.update_preview)
 
+    @property
+    def open_hidden(self):
+        """Whether the selected experiments are to be opened hidden."""
+        return self.hidden_checkbox.isChecked()
+
     def update_preview(self, filename):
         # Add preview tabs as appropriate
         if not os.path.isdir(filename) and filename != '':
@@ -532,6 +532,10 @@ class SequencerWidget(QtWidgets.QWidget):
     def get_sequence(self):
         return self.data.parameters_sequence(self.names_inv)
 
+    def get_sequence_length(self):
+        """ Return the length of the sequence without generating it """
+        return self.data.sequence_length()
+
     def queue_sequence(self):
         """
         Obtain a list of parameters from the sequence tree, enter these into
@@ -549,17 +553,22 @@ class SequencerWidget(QtWidgets.QWidget):
                 "Queuing %d measurements based on the entered sequences." % len(sequence)
             )
 
-            for entry in sequence:
-                QtWidgets.QApplication.processEvents()
-                parameters = dict(ChainMap(*entry[::-1]))
-
-                procedure = self._parent.make_procedure()
-                procedure.set_parameters(parameters)
-                self._parent.queue(procedure=procedure)
+            self._parent.queue_procedures(self._make_procedures(sequence))
 
         finally:
             self.queue_button.setEnabled(True)
 
+    def _make_procedures(self, sequence, process_events_every=100):
+        """ Generate the procedures of a sequence, while keeping the GUI responsive. """
+        for i, entry in enumerate(sequence):
+            if i % process_events_every == 0:
+                QtWidgets.QApplication.processEvents()
+            parameters = dict(ChainMap(*entry[::-1]))
+
+            procedure = self._parent.make_procedure()
+            procedure.set_parameters(parameters)
+            yield procedure
+
     def save_sequence(self):
         dialog = SequenceDialog(save=True)
         if dialog.exec():
@@ -29,10 +29,12 @@ import platform
 import subprocess
 import tempfile
 import shutil
+from functools import partial
 
 import pyqtgraph as pg
 
 from ..browser import BrowserItem
+from ..listeners import ResultsLoader
 from ..manager import Manager, Experiment
 from ..Qt import QtCore, QtWidgets, QtGui
 from ..widgets import (
@@ -391,24 +393,63 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         dialog = ResultsDialog(self.procedure_class,
                                widget_list=self.widget_list)
         if dialog.exec():
-            filenames = dialog.selectedFiles()
-            for filename in map(str, filenames):
-                if filename in self.manager.experiments:
+            filenames = []
+            for filename in map(str, dialog.selectedFiles()):
+                if filename in self.manager.experiments or filename in filenames:
                     QtWidgets.QMessageBox.warning(
                         self, "Load Error",
                         "The file %s cannot be opened twice." % os.path.basename(filename)
                     )
                 elif filename == '':
-                    return
+                    break
                 else:
-                    results = Results.load(filename)
-                    experiment = self.new_experiment(results)
-                    for curve in experiment.curve_list:
-                        if curve:
-                            curve.update_data()
-                    experiment.browser_item.progressbar.setValue(100)
-                    self.manager.load(experiment)
-                    log.info('Opened data file %s' % filename)
+                    filenames.append(filename)
+            if filenames:
+                self.load_experiments(filenames, hidden=dialog.open_hidden)
+
+    def load_experiments(self, filenames, hidden=False):
+        """Load the results files in the background and add them as they are ready.
+
+        A progress dialog allows to cancel the loading.
+
+        :param filenames: List of the filenames to load.
+        :param hidden: Whether to add the experiments hidden (with unchecked browser items). Only
+            their headers are loaded, the data is read when they are shown.
+        :return: The :class:`~pymeasure.display.listeners.ResultsLoader` thread.
+        """
+        loader = ResultsLoader(filenames, read_data=not hidden, parent=self)
+        progress = QtWidgets.QProgressDialog("Loading data files...", "Cancel", 0,
+                                             len(filenames), self)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(loader.stop)
+
+        done = 0
+
+        def step():
+            nonlocal done
+            done += 1
+            progress.setValue(done)
+
+        loader.loaded.connect(partial(self._add_loaded_results, hidden=hidden))
+        loader.loaded.connect(step)
+        loader.failed.connect(step)
+        loader.finished.connect(progress.reset)
+        loader.finished.connect(loader.deleteLater)
+        loader.start()
+        return loader
+
+    def _add_loaded_results(self, results, hidden=False):
+        filename = results.data_filename
+        if filename in self.manager.experiments:
+            return  # opened meanwhile
+        experiment = self.new_experiment(results)
+        experiment.browser_item.progressbar.setValue(100)
+        if hidden:
+            experiment.browser_item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
+        # The widgets update the curves (with the already loaded data) when loading them,
+        # hidden curves are loaded (and their data read) when they are shown.
+        self.manager.load(experiment)
+        log.info('Opened data file %s' % filename)
 
     def save_experiment_copy(self, source_filename):
         """Save a copy of the datafile to a selected folder and file.
@@ -435,6 +476,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
             for curve in experiment.curve_list:
                 if curve:
                     curve.wdg.set_color(curve, color=color)
+            if experiment.curve_factory is not None:
+                experiment.curve_factory = partial(self.new_curves, color=color)
 
     def open_file_externally(self, filename):
         """ Method to open the datafile using an external editor or viewer. Uses the default
@@ -465,15 +508,21 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
             color = pg.intColor(self.browser.topLevelItemCount() % 8)
         return wdg.new_curve(results, color=color, **kwargs)
 
+    def new_curves(self, results, color=None):
+        """ Return the list of the curves of all widgets for the results """
+        kwargs = {} if color is None else {"color": color}
+        curve_list = []
+        for wdg in self.widget_list:
+            new_curve = self.new_curve(wdg, results, **kwargs)
+            if isinstance(new_curve, (tuple, list)):
+                curve_list.extend(new_curve)
+            else:
+                curve_list.append(new_curve)
+        return curve_list
+
     def new_experiment(self, results, curve=None):
         if curve is None:
-            curve_list = []
-            for wdg in self.widget_list:
-                new_curve = self.new_curve(wdg, results)
-                if isinstance(new_curve, (tuple, list)):
-                    curve_list.extend(new_curve)
-                else:
-                    curve_list.append(new_curve)
+            curve_list = self.new_curves(results)
         else:
             curve_list = curve[:]
 
@@ -538,36 +587,77 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
 
         """
 
-        # Check if the filename and the directory inputs are available
-        if not self.enable_file_input:
-            raise NotImplementedError("Queue method must be overwritten if the filename- and "
-                                      "directory-inputs are disabled.")
-
         if procedure is None:
             procedure = self.make_procedure()
 
-        if self.store_measurement:
-            try:
-                filename = unique_filename(
-                    self.directory,
-                    prefix=self.file_input.filename_base,
-                    datetimeformat="",
-                    procedure=procedure,
-                    ext=self.file_input.filename_extension,
-                )
-            except KeyError as E:
-                if not E.args[0].startswith("The following placeholder-keys are not valid:"):
-                    raise E from None
-                log.error(f"Invalid filename provided: {E.args[0]}")
-                return
-        else:
-            filename = tempfile.mktemp(prefix='TempFile_', suffix='.csv')
+        filename = self._results_filename(procedure)
+        if filename is None:
+            return
 
         results = Results(procedure, filename)
 
         experiment = self.new_experiment(results)
         self.manager.queue(experiment)
 
+    def queue_procedures(self, procedures):
+        """ Queue measurements for several procedures at once, e.g. the procedures of a sequence.
+
+        Unlike calling :meth:`queue` for each procedure, the header of a data file and the
+        curves of an experiment are only created when the experiment starts, and the browser
+        items are added in one update.
+        If :meth:`queue` or :meth:`new_experiment` is overridden, :meth:`queue` is called for each
+        procedure instead.
+        If the filename of a procedure is invalid, the procedures before it are queued only.
+
+        :param procedures: Iterable of :class:`~pymeasure.experiment.procedure.Procedure`
+            objects.
+        """
+        if (type(self).queue is not ManagedWindowBase.queue
+                or type(self).new_experiment is not ManagedWindowBase.new_experiment):
+            for procedure in procedures:
+                self.queue(procedure=procedure)
+            return
+
+        experiments = []
+        count = self.browser.topLevelItemCount()
+        try:
+            for procedure in procedures:
+                filename = self._results_filename(procedure)
+                if filename is None:
+                    break  # the invalid filename has been logged
+                results = Results(procedure, filename, write_header=False)
+                color = pg.intColor((count + len(experiments)) % 8)
+                experiments.append(Experiment(results, [], BrowserItem(results, color),
+                                              curve_factory=partial(self.new_curves, color=color)))
+        finally:
+            # Queue the experiments created so far, also if one fails, as their filenames are
+            # reserved already.
+            if experiments:
+                self.manager.queue_all(experiments)
+
+    def _results_filename(self, procedure):
+        """ Return the filename for the results of a procedure, None if it is invalid """
+        # Check if the filename and the directory inputs are available
+        if not self.enable_file_input:
+            raise NotImplementedError("Queue method must be overwritten if the filename- and "
+                                      "directory-inputs are disabled.")
+
+        if not self.store_measurement:
+            return tempfile.mktemp(prefix='TempFile_', suffix='.csv')
+
+        try:
+            return unique_filename(
+                self.directory,
+                prefix=self.file_input.filename_base,
+                datetimeformat="",
+                procedure=procedure,
+                ext=self.file_input.filename_extension,
+            )
+        except KeyError as E:
+            if not E.args[0].startswith("The following placeholder-keys are not valid:"):
+                raise E from None
+            log.error(f"Invalid filename provided: {E.args[0]}")
+
     def abort(self):
         self.abort_button.setEnabled(False)
         self.abort_button.setText("Resume")
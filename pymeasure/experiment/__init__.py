@@ -22,12 +22,36 @@
 # THE SOFTWARE.
 #
 
-from .parameters import (Parameter, IntegerParameter, FloatParameter,
-                         VectorParameter, ListParameter, BooleanParameter,
-                         Measurable, Metadata)
-from .procedure import Procedure, UnknownProcedure
-from .results import Results, unique_filename, replace_placeholders
-from .workers import Worker
-from .listeners import Listener, Recorder
-from .config import get_config
-from .experiment import Experiment, get_array, get_array_steps, get_array_zero
+from importlib import import_module
+
+# Attributes and the modules they are imported from on first access.
+_lazy_attributes = {
+    **dict.fromkeys(("Parameter", "IntegerParameter", "FloatParameter", "VectorParameter",
+                     "ListParameter", "BooleanParameter", "Measurable", "Metadata"),
+                    ".parameters"),
+    **dict.fromkeys(("Procedure", "UnknownProcedure"), ".procedure"),
+    **dict.fromkeys(("Results", "unique_filename", "replace_placeholders"), ".results"),
+    "Worker": ".workers",
+    **dict.fromkeys(("Listener", "Recorder"), ".listeners"),
+    "ResultsCatalog": ".catalog",
+    "get_config": ".config",
+    **dict.fromkeys(("Experiment", "get_array", "get_array_steps", "get_array_zero"),
+                    ".experiment"),
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name):
+    """Import the attributes lazily (PEP 562), to keep the import of the package fast."""
+    try:
+        module = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_attributes})
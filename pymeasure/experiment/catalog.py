@@ -0,0 +1,226 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import os
+import sqlite3
+from datetime import datetime
+
+from .results import Results
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+def _to_number(value):
+    """Return the leading number of a header value (e.g. 2.0 for "2.0 T") or None."""
+    try:
+        return float(value.split(maxsplit=1)[0])
+    except (ValueError, IndexError):
+        return None
+
+
+def _count_rows(data_filename, header_count):
+    """Count the data rows of a file, excluding the header and the column labels."""
+    lines = 0
+    last = b"\n"
+    with open(data_filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1  # last line without line break
+    return max(lines - header_count - 1, 0)
+
+
+class ResultsCatalog:
+    """ Persistent index of the headers of results files in an SQLite database.
+
+    The catalog stores the procedure, the parameters, the metadata, the number of data rows and
+    the modification time of each file. :meth:`update` only parses new or modified files, such
+    that searching large data directories is fast.
+
+    .. code-block:: python
+
+        catalog = ResultsCatalog("catalog.sqlite")
+        catalog.update("data")
+        catalog.find(parameters={"Field": (">", 2)}, modified_after=datetime(2024, 5, 1))
+
+    :param database: Filename of the SQLite database, it is created if necessary.
+    """
+
+    OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "LIKE")
+
+    def __init__(self, database):
+        self.database = database
+        self.connection = sqlite3.connect(database)
+        with self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    filename TEXT PRIMARY KEY,
+                    procedure TEXT,
+                    rows INTEGER,
+                    mtime REAL,
+                    size INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS values_ (
+                    filename TEXT REFERENCES files(filename) ON DELETE CASCADE,
+                    section TEXT,
+                    name TEXT,
+                    value TEXT,
+                    number REAL
+                );
+                CREATE INDEX IF NOT EXISTS values_name ON values_ (name, number);
+                CREATE INDEX IF NOT EXISTS values_filename ON values_ (filename);
+            """)
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def update(self, directory, extensions=(".csv",), recursive=True):
+        """ Add new and modified files of a directory and remove the deleted ones.
+
+        :param directory: Directory to search for results files.
+        :param extensions: File extensions of the results files.
+        :param recursive: Whether to search the subdirectories as well.
+        :return: Number of added or updated files.
+        """
+        directory = os.path.abspath(directory)
+        prefix = os.path.join(directory, "")
+        known = {}  # cataloged files, which the scan would return if they still exist
+        for filename, mtime, size in self.connection.execute(
+                "SELECT filename, mtime, size FROM files WHERE substr(filename, 1, ?) = ?",
+                (len(prefix), prefix)):
+            if (filename.endswith(tuple(extensions))
+                    and (recursive or os.path.dirname(filename) == directory)):
+                known[filename] = (mtime, size)
+        updated = 0
+        with self.connection:
+            for entry in self._scan(directory, extensions, recursive):
+                stat = entry.stat()
+                if not stat.st_size:
+                    continue  # reserved for an experiment, which has not been started yet
+                filename = os.path.abspath(entry.path)
+                if known.pop(filename, None) == (stat.st_mtime, stat.st_size):
+                    continue
+                try:
+                    self._add(filename, stat)
+                except Exception as exc:
+                    log.warning(f"Could not add '{filename}' to the catalog: {exc}")
+                else:
+                    updated += 1
+            # remaining files have been deleted
+            self._remove(known)
+        return updated
+
+    @classmethod
+    def _scan(cls, directory, extensions, recursive):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        yield from cls._scan(entry.path, extensions, recursive)
+                elif entry.name.endswith(tuple(extensions)):
+                    yield entry
+
+    def _add(self, filename, stat):
+        header, header_count = Results.read_header(filename)
+        procedure, sections = Results.parse_header_sections(header)
+        self._remove([filename])
+        self.connection.execute(
+            "INSERT INTO files VALUES (?, ?, ?, ?, ?)",
+            (filename, procedure, _count_rows(filename, header_count), stat.st_mtime,
+             stat.st_size))
+        self.connection.executemany(
+            "INSERT INTO values_ VALUES (?, ?, ?, ?, ?)",
+            [(filename, section, name, value, _to_number(value))
+             for section, values in sections.items() for name, value in values.items()])
+
+    def _remove(self, filenames):
+        filenames = [(filename,) for filename in filenames]
+        self.connection.executemany("DELETE FROM values_ WHERE filename = ?", filenames)
+        self.connection.executemany("DELETE FROM files WHERE filename = ?", filenames)
+
+    def find(self, procedure=None, parameters=None, modified_after=None, modified_before=None):
+        """ Find files by their procedure, parameter or metadata values and modification time.
+
+        :param procedure: Name of the procedure class (optionally with module, as in the header).
+        :param parameters: Dictionary of the parameter or metadata names and the required
+            values. A value is either compared as a string or given as a tuple of an operator
+            (one of :attr:`OPERATORS`) and a value, numbers are compared with the leading number
+            of the stored value (e.g. 2 for "2 T").
+        :param modified_after: Only files modified after this datetime.
+        :param modified_before: Only files modified before this datetime.
+        :return: List of the filenames, sorted by modification time.
+        """
+        conditions = []
+        arguments = []
+        if procedure is not None:
+            conditions.append("(procedure = ? OR procedure LIKE ?)")
+            arguments.extend((procedure, f"%.{procedure}"))
+        if modified_after is not None:
+            conditions.append("mtime > ?")
+            arguments.append(datetime.timestamp(modified_after))
+        if modified_before is not None:
+            conditions.append("mtime < ?")
+            arguments.append(datetime.timestamp(modified_before))
+        for name, value in (parameters or {}).items():
+            operator, value = value if isinstance(value, tuple) else ("=", value)
+            if operator not in self.OPERATORS:
+                raise ValueError(f"Invalid operator '{operator}', use one of {self.OPERATORS}.")
+            column = "number" if isinstance(value, (int, float)) else "value"
+            conditions.append("filename IN (SELECT filename FROM values_ "
+                              f"WHERE name = ? AND {column} {operator} ?)")
+            arguments.extend((name, value))
+        query = "SELECT filename FROM files"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY mtime"
+        return [row[0] for row in self.connection.execute(query, arguments)]
+
+    def info(self, filename):
+        """ Return the cataloged information of a file.
+
+        :return: Dictionary with the "procedure", "rows", "modified" time and the sections,
+            e.g. "Parameters", each a dictionary of names and string values; or None, if the
+            file is not in the catalog.
+        """
+        filename = os.path.abspath(filename)
+        row = self.connection.execute(
+            "SELECT procedure, rows, mtime FROM files WHERE filename = ?", (filename,)).fetchone()
+        if row is None:
+            return None
+        info = {"procedure": row[0], "rows": row[1],
+                "modified": datetime.fromtimestamp(row[2])}
+        for section, name, value in self.connection.execute(
+                "SELECT section, name, value FROM values_ WHERE filename = ?", (filename,)):
+            info.setdefault(section, {})[name] = value
+        return info
@@ -23,6 +23,7 @@
 #
 
 import logging
+from contextlib import contextmanager
 from logging import StreamHandler, FileHandler
 
 from ..log import QueueListener
@@ -112,6 +113,24 @@ class Recorder(QueueListener):
 
         super().__init__(queue, *handlers)
 
+    @contextmanager
+    def files_released(self):
+        """ Context manager which blocks the recording and closes the files, such that they
+        can be replaced within the context. The files are reopened (in append mode) by the
+        next recorded entry.
+        """
+        for handler in self.handlers:
+            handler.acquire()
+        try:
+            for handler in self.handlers:
+                if handler.stream is not None:
+                    handler.stream.close()
+                    handler.stream = None
+            yield
+        finally:
+            for handler in self.handlers:
+                handler.release()
+
     def stop(self):
         for handler in self.handlers:
             handler.close()
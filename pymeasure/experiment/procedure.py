@@ -23,15 +23,14 @@
 #
 
 import logging
+import os
 import sys
 import inspect
 from copy import deepcopy
-from importlib.machinery import SourceFileLoader
+from importlib.util import module_from_spec, spec_from_file_location
 import re
-from pint import UndefinedUnitError
 
 from .parameters import Parameter, Measurable, Metadata
-from pymeasure.units import ureg
 
 log = logging.getLogger()
 log.addHandler(logging.NullHandler())
@@ -91,6 +90,10 @@ class Procedure:
         :type record: dict
         :return: Dictionary of columns with Pint units.
         """
+        # pint is imported here, as it is slow to import
+        from pint import UndefinedUnitError
+        from pymeasure.units import ureg
+
         units_pattern = r"\((?P<units>[\w/\(\)\*\t]+)\)"
         units = {}
         for column in columns:
@@ -327,30 +330,61 @@ class ProcedureWrapper:
 
     def __getstate__(self):
         # Get all information needed to reconstruct procedure
-        self._parameters = self.procedure.parameter_values()
-        self._class = self.procedure.__class__.__name__
-        module = sys.modules[self.procedure.__module__]
-        self._package = module.__package__
-        self._module = module.__name__
-        self._file = module.__file__
-
         state = self.__dict__.copy()
-        del state['procedure']
+        procedure = state.pop('procedure')
+        state['_procedure'] = (*_procedure_source(procedure.__class__),
+                               procedure.parameter_values())
         return state
 
     def __setstate__(self, state):
+        module_name, filename, class_name, parameters = state.pop('_procedure')
         self.__dict__.update(state)
 
         # Restore the procedure
-        module = SourceFileLoader(self._module, self._file).load_module()
-        cls = getattr(module, self._class)
-
+        cls = _load_procedure_class(module_name, filename, class_name)
         self.procedure = cls()
-        self.procedure.set_parameters(self._parameters)
+        self.procedure.set_parameters(parameters)
         self.procedure.refresh_parameters()
 
-        del self._parameters
-        del self._class
-        del self._package
-        del self._module
-        del self._file
+
+def _procedure_source(cls):
+    """ Returns the module name, the module file and the name of a procedure class.
+
+    The result is stored in the class itself. Classes returned by :func:`_load_procedure_class`
+    store their original source there, as their modules are not in `sys.modules`.
+    """
+    source = cls.__dict__.get("_pickle_source")
+    if source is None:
+        module = sys.modules[cls.__module__]
+        source = cls._pickle_source = (module.__name__, module.__file__, cls.__name__)
+    return source
+
+
+# Modules loaded from their files by _load_procedure_class: {(file, name): (mtime, module)}
+_procedure_modules = {}
+
+
+def _load_procedure_class(module_name, filename, class_name):
+    """ Returns the procedure class `class_name` of the module `module_name` in `filename`.
+
+    If that module is imported, its class is returned, such that the class identity is
+    preserved. Otherwise the file is loaded as a module, which is cached until the file is
+    modified. A "__main__" module is loaded as "__mp_main__" (like in multiprocessing) in order
+    not to execute the script part.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, "__file__", None) == filename:
+        return getattr(module, class_name)
+
+    mtime = os.stat(filename).st_mtime_ns
+    cached = _procedure_modules.get((filename, module_name))
+    if cached is None or cached[0] != mtime:
+        name = "__mp_main__" if module_name == "__main__" else module_name
+        spec = spec_from_file_location(name, filename)
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        cached = _procedure_modules[(filename, module_name)] = (mtime, module)
+    cls = getattr(cached[1], class_name)
+    if "_pickle_source" not in cls.__dict__:
+        cls._pickle_source = (module_name, filename, class_name)
+    return cls
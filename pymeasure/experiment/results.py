@@ -23,19 +23,22 @@
 #
 
 from decimal import Decimal
+import locale
 import logging
 import os
 import re
-import sys
+import shutil
+import tempfile
+import threading
 from importlib import import_module
-from importlib.machinery import SourceFileLoader
 from datetime import datetime
 from string import Formatter
 
 import pandas as pd
 import pint
 
-from .procedure import Procedure, UnknownProcedure
+from .procedure import (Procedure, UnknownProcedure, _procedure_source,
+                        _load_procedure_class)
 from pymeasure.units import ureg
 
 log = logging.getLogger(__name__)
@@ -92,6 +95,12 @@ def unique_filename(directory, prefix='DATA', suffix='', ext='csv',
                     dated_folder=False, index=True, datetimeformat="%Y-%m-%d",
                     procedure=None):
     """ Returns a unique filename based on the directory and prefix
+
+    If `index` is True, the filename is "<prefix><date>_<index><suffix>.<ext>" with an index
+    above the highest index of the existing files. The directory is scanned only once per
+    filename pattern, afterwards the highest index is cached. The filename is claimed by
+    creating an empty file (exclusively), such that concurrent calls (e.g. of several
+    processes) never return the same filename.
     """
     now = datetime.now()
     directory = os.path.abspath(directory)
@@ -103,21 +112,49 @@ def unique_filename(directory, prefix='DATA', suffix='', ext='csv',
     if dated_folder:
         directory = os.path.join(directory, now.strftime('%Y-%m-%d'))
     if not os.path.exists(directory):
-        os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
     if index:
-        i = 1
         basename = f"{prefix}{now.strftime(datetimeformat)}"
-        basepath = os.path.join(directory, basename)
-        filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
-        while os.path.exists(filename):
-            i += 1
-            filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
+        key = (directory, basename, suffix, ext)
+        with _filename_indices_lock:
+            i = _filename_indices.get(key)
+            if i is None:
+                i = _highest_index(directory, basename, suffix, ext)
+            while True:
+                i += 1
+                filename = os.path.join(directory, "%s_%d%s.%s" % (basename, i, suffix, ext))
+                try:
+                    os.close(os.open(filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                except FileExistsError:
+                    continue  # e.g. created by another process
+                break
+            _filename_indices[key] = i
     else:
         basename = f"{prefix}{now.strftime(datetimeformat)}{suffix}.{ext}"
         filename = os.path.join(directory, basename)
     return filename
 
 
+# Highest index claimed by unique_filename per (directory, basename, suffix, ext)
+_filename_indices = {}
+_filename_indices_lock = threading.Lock()
+
+
+def _highest_index(directory, basename, suffix, ext):
+    """ Returns the highest index of the files "<basename>_<index><suffix>.<ext>" in the
+    directory (0 if there is none).
+    """
+    pattern = re.compile(r"%s_(\d+)%s\.%s$" % (
+        re.escape(basename), re.escape(suffix), re.escape(ext)))
+    highest = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if match:
+                highest = max(highest, int(match.group(1)))
+    return highest
+
+
 class CSVFormatter(logging.Formatter):
     """ Formatter of data results """
 
@@ -197,18 +234,22 @@ class Results:
     :cvar DELIMITER: The character used to delimit the data (default: ,)
     :cvar LINE_BREAK: The character used for line breaks (default \\n)
     :cvar CHUNK_SIZE: The length of the data chuck that is read
+    :cvar METADATA_SPACE: The number of characters reserved in the header for the metadata
 
     :param procedure: Procedure object
     :param data_filename: The data filename where the data is or should be
                           stored
+    :param write_header: Whether to write the header into a new data file immediately. If False,
+                         it is written by :meth:`write_header` (e.g. by the :class:`.Worker`).
     """
 
     COMMENT = '#'
     DELIMITER = ','
     LINE_BREAK = "\n"
     CHUNK_SIZE = 1000
+    METADATA_SPACE = 1024
 
-    def __init__(self, procedure, data_filename):
+    def __init__(self, procedure, data_filename, write_header=True):
         if not isinstance(procedure, Procedure):
             raise ValueError("Results require a Procedure object")
         self.procedure = procedure
@@ -227,49 +268,48 @@ class Results:
         self.data_filename = data_filename
         self.data_filenames = data_filenames
 
-        if os.path.exists(data_filename):  # Assume header is already written
-            self.reload()
+        self._data = None  # The data is read on first access
+        if os.path.exists(data_filename) and os.path.getsize(data_filename):
+            # Assume header is already written (empty files are claimed by unique_filename)
             self.procedure.status = Procedure.FINISHED
             # TODO: Correctly store and retrieve status
-        else:
-            for filename in self.data_filenames:
-                with open(filename, 'w') as f:
-                    f.write(self.header())
-                    f.write(self.labels())
-            self._data = None
+        elif write_header:
+            self.write_header()
 
-    def __getstate__(self):
-        # Get all information needed to reconstruct procedure
-        self._parameters = self.procedure.parameter_values()
-        self._class = self.procedure.__class__.__name__
-        module = sys.modules[self.procedure.__module__]
-        self._package = module.__package__
-        self._module = module.__name__
-        self._file = module.__file__
+    def write_header(self):
+        """ Writes the header and the column labels into the data files, unless the data
+        file exists already and is not empty.
+        """
+        if os.path.exists(self.data_filename) and os.path.getsize(self.data_filename):
+            return
+        for filename in self.data_filenames:
+            with open(filename, 'w') as f:
+                f.write(self.header())
+                f.write(self.labels())
 
+    def __getstate__(self):
+        # Store the procedure by its class and parameter values, the data is read from the file
         state = self.__dict__.copy()
-        del state['procedure']
+        procedure = state.pop('procedure')
         del state['procedure_class']
+        del state['parameters']
+        state['_data'] = None
+        state['_procedure'] = (*_procedure_source(procedure.__class__),
+                               procedure.parameter_values())
         return state
 
     def __setstate__(self, state):
+        module_name, filename, class_name, parameters = state.pop('_procedure')
         self.__dict__.update(state)
 
         # Restore the procedure
-        module = SourceFileLoader(self._module, self._file).load_module()
-        cls = getattr(module, self._class)
-
+        cls = _load_procedure_class(module_name, filename, class_name)
         self.procedure = cls()
-        self.procedure.set_parameters(self._parameters)
+        self.procedure.set_parameters(parameters)
         self.procedure.refresh_parameters()
 
         self.procedure_class = cls
-
-        del self._parameters
-        del self._class
-        del self._package
-        del self._module
-        del self._file
+        self.parameters = self.procedure.parameter_objects()
 
     def header(self):
         """ Returns a text header to accompany a datafile so that the procedure
@@ -283,6 +323,9 @@ class Results:
         for name, parameter in self.parameters.items():
             h.append("\t{}: {}".format(parameter.name, str(
                 parameter).encode("unicode_escape").decode("utf-8")))
+        if self.procedure.metadata_objects():
+            # Space for the metadata, which is filled in by store_metadata
+            h.append(" " * Results.METADATA_SPACE)
         h.append("Data:")
         self._header_count = len(h)
         h = [Results.COMMENT + line for line in h]  # Comment each line
@@ -323,52 +366,143 @@ class Results:
         return Results.LINE_BREAK.join(m) + Results.LINE_BREAK
 
     def store_metadata(self):
-        """ Inserts the metadata header (if any) into the datafile """
+        """ Inserts the metadata header (if any) into the datafile.
+
+        The metadata is written into the space reserved in the header, such that the data does
+        not have to be rewritten. If the file does not have (enough) reserved space, it is
+        rewritten into a temporary file, which replaces the data file atomically.
+        """
         c_header = self.metadata()
         if c_header is None:
             return
 
+        self._update_header_count()
         for filename in self.data_filenames:
-            with open(filename, 'r+') as f:
-                contents = f.readlines()
-                contents.insert(self._header_count - 1, c_header)
-
-                f.seek(0)
-                f.writelines(contents)
+            if not self._write_into_reserved_space(filename, c_header):
+                self._insert_into_header(filename, self._header_count - 1, c_header)
 
         self._header_count += self._metadata_count
 
     @staticmethod
-    def parse_header(header, procedure_class=None):
-        """ Returns a Procedure object with the parameters as defined in the
-        header text.
+    def _write_into_reserved_space(filename, text):
+        """ Overwrites the reserved space (a commented line of spaces) in the header of a file
+        with `text`, if the text fits into it. The remaining space stays reserved.
+
+        :return: Whether the text has been written.
         """
-        if procedure_class is not None:
-            procedure = procedure_class()
-        else:
-            procedure = None
+        comment = Results.COMMENT.encode()
+        with open(filename, 'rb+') as f:
+            position = 0
+            for line in f:
+                if not line.startswith(comment):
+                    return False  # end of the header
+                content = line.rstrip(b"\r\n")
+                if len(content) > len(comment) and content[len(comment):].strip(b" ") == b"":
+                    break
+                position += len(line)
+            else:
+                return False
+            line_break = line[len(content):].decode()
+            block = text.replace(Results.LINE_BREAK, line_break).encode(
+                locale.getpreferredencoding(False))
+            padding = len(content) - len(block) - len(comment)
+            if padding < 0:
+                return False
+            f.seek(position)
+            f.write(block + comment + b" " * padding)
+            f.flush()
+            os.fsync(f.fileno())
+        return True
 
-        header = header.split(Results.LINE_BREAK)
-        procedure_module = None
-        parameters = {}
-        for line in header:
+    @staticmethod
+    def _insert_into_header(filename, line_number, text):
+        """ Inserts `text` before the line `line_number` of a file.
+
+        The file is copied in chunks into a temporary file, which replaces the original one
+        atomically. The file is never rewritten in place, such that it is not corrupted if the
+        process is interrupted.
+        """
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with open(filename, newline='') as source, \
+                    open(fd, 'w', newline='') as target:
+                for _ in range(line_number):
+                    target.write(source.readline())
+                target.write(text)
+                shutil.copyfileobj(source, target)
+                target.flush()
+                os.fsync(target.fileno())
+            shutil.copymode(filename, temporary)
+            os.replace(temporary, filename)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    @staticmethod
+    def parse_header_sections(header):
+        """ Parses the header text without creating the procedure.
+
+        :param header: The header text (commented lines).
+        :return: Tuple of the procedure name (with module) and a dictionary of the sections
+            (e.g. "Parameters", "Metadata"), each a dictionary of the names and string values.
+        """
+        procedure_name = None
+        sections = {}
+        values = sections.setdefault("Parameters", {})
+        for line in header.split(Results.LINE_BREAK):
             if line.startswith(Results.COMMENT):
                 line = line[1:]  # Uncomment
             else:
                 raise ValueError("Parsing a header which contains "
                                  "uncommented sections")
             if line.startswith("Procedure"):
-                regex = r"<(?:(?P<module>[^>]+)\.)?(?P<class>[^.>]+)>"
-                search = re.search(regex, line)
-                procedure_module = search.group("module")
-                procedure_class = search.group("class")
+                search = re.search(r"<(?P<name>[^>]+)>", line)
+                procedure_name = search.group("name")
             elif line.startswith("\t"):
                 separator = ": "
                 partitioned_line = line[1:].partition(separator)
                 if partitioned_line[1] != separator:
                     raise Exception("Error partitioning header line %s." % line)
                 else:
-                    parameters[partitioned_line[0]] = partitioned_line[2]
+                    values[partitioned_line[0]] = partitioned_line[2]
+            elif line.endswith(":"):
+                values = sections.setdefault(line[:-1], {})
+        return procedure_name, sections
+
+    @staticmethod
+    def read_header(data_filename):
+        """ Reads the commented header of a data file.
+
+        :return: Tuple of the header text and its number of lines.
+        """
+        header = ""
+        header_count = 0
+        with open(data_filename) as f:
+            for line in f:
+                if not line.startswith(Results.COMMENT):
+                    break
+                header += line.strip('\t\v\n\r\f') + Results.LINE_BREAK
+                header_count += 1
+        return header[:-1], header_count
+
+    @staticmethod
+    def parse_header(header, procedure_class=None):
+        """ Returns a Procedure object with the parameters as defined in the
+        header text.
+        """
+        if procedure_class is not None:
+            procedure = procedure_class()
+        else:
+            procedure = None
+
+        procedure_name, sections = Results.parse_header_sections(header)
+        if procedure_name is not None:
+            procedure_module, _, procedure_class = procedure_name.rpartition(".")
+            procedure_module = procedure_module or None
+        parameters = {}
+        for values in sections.values():
+            parameters.update(values)
 
         if procedure is None:
             if procedure_class is None:
@@ -408,31 +542,23 @@ class Results:
 
     @staticmethod
     def load(data_filename, procedure_class=None):
-        """ Returns a Results object with the associated Procedure object and
-        data
+        """ Returns a Results object with the associated Procedure object.
+
+        Only the header is parsed, the data is read on first access of :attr:`data`
+        (or partially with :meth:`read_data`).
         """
-        header = ""
-        header_read = False
-        header_count = 0
-        with open(data_filename) as f:
-            while not header_read:
-                line = f.readline()
-                if line.startswith(Results.COMMENT):
-                    header += line.strip('\t\v\n\r\f') + Results.LINE_BREAK
-                    header_count += 1
-                else:
-                    header_read = True
-        procedure = Results.parse_header(header[:-1], procedure_class)
+        header, header_count = Results.read_header(data_filename)
+        procedure = Results.parse_header(header, procedure_class)
         results = Results(procedure, data_filename)
         results._header_count = header_count
         return results
 
     @property
     def data(self):
-        # Need to update header count for correct referencing
-        if self._header_count == -1:
-            self._header_count = len(
-                self.header()[-1].split(Results.LINE_BREAK))
+        """ The data as a pandas.DataFrame. It is read from the file on first access, afterwards
+        only new lines are read.
+        """
+        self._update_header_count()
         if self._data is None or len(self._data) == 0:
             # Data has not been read
             try:
@@ -462,6 +588,29 @@ class Results:
                 pass  # All data is up to date
         return self._data
 
+    def _update_header_count(self):
+        # Need to update header count for correct referencing
+        if self._header_count == -1:
+            _, self._header_count = Results.read_header(self.data_filename)
+
+    def read_data(self, columns=None, start=0, stop=None):
+        """ Reads (a part of) the data from the file without storing it in :attr:`data`.
+
+        :param columns: List of the column names to read, None reads all columns.
+        :param start: Index of the first row to read.
+        :param stop: Index after the last row to read, None reads until the end.
+        :return: pandas.DataFrame with the data.
+        """
+        self._update_header_count()
+        first_row = self._header_count + 1  # line number, after the column labels
+        return pd.read_csv(
+            self.data_filename,
+            comment=Results.COMMENT,
+            usecols=columns,
+            skiprows=range(first_row, first_row + start),
+            nrows=None if stop is None else max(stop - start, 0),
+        )
+
     def reload(self):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
@@ -349,7 +349,33 @@ class SequenceHandler:
         :param file_obj: file object
         """
 
-        file_obj.write("\n".join(str(item) for item in self._sequences))
+        file_obj.write(str(self))
+
+    def __str__(self):
+        return "\n".join(str(item) for item in self._sequences)
+
+    def sequence_length(self):
+        """
+        Return the number of entries of :meth:`parameters_sequence` without generating them.
+
+        :return: The number of parameter settings of the sequence.
+        """
+
+        def group_length(idx, level):
+            # Length of the nodes at `level` starting at `idx` (and their children)
+            length = 0
+            while idx < len(self._sequences) and self._sequences[idx].level == level:
+                item = self._sequences[idx]
+                values = self.eval_string(item.expression, item.parameter, item.level)
+                node_length = len(values) if values.ndim > 0 else 0
+                idx += 1
+                if idx < len(self._sequences) and self._sequences[idx].level > level:
+                    children_length, idx = group_length(idx, self._sequences[idx].level)
+                    node_length *= children_length
+                length += node_length
+            return length, idx
+
+        return group_length(0, 0)[0]
 
     def parameters_sequence(self, names_map=None):
         """
@@ -30,6 +30,7 @@ from queue import Queue
 from .listeners import Recorder
 from .procedure import Procedure
 from .results import Results
+from ..log import truncate_message
 from ..thread import StoppableThread
 
 log = logging.getLogger(__name__)
@@ -50,6 +51,9 @@ class Worker(StoppableThread):
     thread, a Recorder is run to write the results to
     """
 
+    #: Minimum interval in s between two emitted results in the debug log.
+    results_log_interval = 1
+
     def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
         """ Constructs a Worker to perform the Procedure
         defined in the file at the filepath
@@ -71,6 +75,8 @@ class Worker(StoppableThread):
             log_queue = Queue()
         self.log_queue = log_queue
         self.log_level = log_level
+        self._results_logged_at = -float('inf')
+        self._results_not_logged = 0
 
         global log
         log = logging.getLogger()
@@ -105,7 +111,8 @@ class Worker(StoppableThread):
 
     def emit(self, topic, record):
         """ Emits data of some topic over TCP """
-        log.debug("Emitting message: %s %s", topic, record)
+        if log.isEnabledFor(logging.DEBUG):
+            self._log_emit(topic, record)
 
         try:
             self.publisher.send_serialized(
@@ -119,6 +126,19 @@ class Worker(StoppableThread):
         elif topic == 'status' or topic == 'progress':
             self.monitor_queue.put((topic, record))
 
+    def _log_emit(self, topic, record):
+        """Log an emitted record, at most one result per `results_log_interval`."""
+        if topic == 'results':
+            now = time.monotonic()
+            if now < self._results_logged_at + self.results_log_interval:
+                self._results_not_logged += 1
+                return
+            self._results_logged_at = now
+            if self._results_not_logged:
+                log.debug("%d results were not logged", self._results_not_logged)
+                self._results_not_logged = 0
+        log.debug("Emitting message: %s %s", topic, truncate_message(str(record)))
+
     def handle_abort(self):
         log.exception("User stopped Worker execution prematurely")
         self.update_status(Procedure.ABORTED)
@@ -156,6 +176,7 @@ class Worker(StoppableThread):
 
         self.procedure = self.results.procedure
 
+        self.results.write_header()  # in case it has been deferred
         self.recorder = Recorder(self.results, self.recorder_queue)
         self.recorder.start()
 
@@ -172,7 +193,8 @@ class Worker(StoppableThread):
         try:
             self.procedure.startup()
             self.procedure.evaluate_metadata()
-            self.results.store_metadata()
+            with self.recorder.files_released():
+                self.results.store_metadata()
             self.procedure.execute()
         except (KeyboardInterrupt, SystemExit):
             self.handle_abort()
@@ -177,34 +177,52 @@ def write_parametrized_method_test(file,
     )
 
 
-def parse_stream(stream):
+def parse_stream(stream, timing=False):
     """
     Parse the data stream.
 
     It is expected, that a message is always written in one write, while
     reading may extend over several reads, e.g. reading bytes.
 
-    :return list[tuple[bytes | None, bytes | None]]: List of communication pairs
+    :param bool timing: Whether the stream contains timestamps, see :class:`ByteStreamHandler`.
+        In that case, the delays are returned as well.
+    :return list[tuple[bytes | None, bytes | None]]: List of communication pairs. If `timing`
+        is True, a tuple of the communication pairs and a list of the delays (in s) between the
+        write and the last read of each pair.
     """
     comm = []
+    delays = []
     lines = stream.readlines()
     write = None
     read = None
     mode = None
+    start = end = None
     for line in lines:
+        stamp = None
+        if timing:
+            stamp, _, rest = line.partition(b" ")
+            if rest.startswith((b"WRITE:", b"READ:")):
+                stamp = float(stamp)
+                line = rest
+            else:
+                stamp = None
         if line.startswith(b"WRITE:"):
             # Store the last comm_pair unless there is none.
             if write is not None or read is not None:
                 comm.append((write, read))
+                delays.append(end - start if start is not None and end is not None else 0)
                 read = None
             write = line[6:-1]
             mode = "W"
+            start = stamp
+            end = None
         elif line.startswith(b"READ:"):
             if read is not None:
                 read += line[5:-1]
             else:
                 read = line[5:-1]
             mode = "R"
+            end = stamp
         else:
             # newline due to "\n" character in communication
             if mode == "W":
@@ -215,11 +233,21 @@ def parse_stream(stream):
                 raise ValueError("Very first line does not contain 'WRITE' or 'READ'!")
     if read is not None or write is not None:
         comm.append((write, read))
+        delays.append(end - start if start is not None and end is not None else 0)
+    if timing:
+        return comm, delays
     return comm
 
 
 class ByteFormatter(logging.Formatter):
-    """Logging formatter with bytes values for the test generation."""
+    """Logging formatter with bytes values for the test generation.
+
+    :param bool timestamps: Prefix each message with its creation time (in s).
+    """
+
+    def __init__(self, *args, timestamps=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timestamps = timestamps
 
     @staticmethod
     def make_bytes(value):
@@ -230,18 +258,25 @@ class ByteFormatter(logging.Formatter):
         raise ValueError(f"value '{value}' is neither str nor bytes.")
 
     def format(self, record):
-        return b"".join((record.msg.replace(r"%s", "").encode(),
-                         *[self.make_bytes(arg) for arg in record.args]))  # type: ignore
+        message = b"".join((record.msg.replace(r"%s", "").encode(),
+                            *[self.make_bytes(arg) for arg in record.args]))  # type: ignore
+        if self.timestamps:
+            return f"{record.created:.6f} ".encode() + message
+        return message
 
 
 class ByteStreamHandler(logging.StreamHandler):
-    """Logging handler using bytes streams."""
+    """Logging handler using bytes streams.
+
+    :param bool timestamps: Record the time of each message, for example to replay a session
+        with realistic timing with a :class:`~pymeasure.adapters.ReplayAdapter`.
+    """
 
     terminator = b"\n"  # type: ignore
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, timestamps=False, **kwargs):
         super().__init__(*args, **kwargs)
-        self.formatter = ByteFormatter()
+        self.formatter = ByteFormatter(timestamps=timestamps)
 
 
 class TestInstrument:
@@ -467,6 +502,7 @@ class Generator:
             except ImportError:
                 raise Exception("Invalid Adapter provided for Instrument since"
                                 " PyVISA is not present")
+        adapter.log_limit = None  # the tests need the complete messages
         adapter.log.addHandler(ByteStreamHandler(self._stream))
         adapter.log.setLevel(logging.DEBUG)
         self.inst = instrument_class(adapter, **kwargs)
@@ -22,7 +22,29 @@
 # THE SOFTWARE.
 #
 
-from .channel import Channel
-from .instrument import Instrument
-from .resources import find_serial_port, list_resources
-from .generic_types import SCPIMixin, SCPIUnknownMixin
+from importlib import import_module
+
+# Attributes and the modules they are imported from on first access.
+_lazy_attributes = {
+    "Channel": ".channel",
+    "Instrument": ".instrument",
+    **dict.fromkeys(("find_serial_port", "list_resources"), ".resources"),
+    **dict.fromkeys(("SCPIMixin", "SCPIUnknownMixin"), ".generic_types"),
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name):
+    """Import the attributes lazily (PEP 562), to keep the import of the package fast."""
+    try:
+        module = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_attributes})
@@ -25,6 +25,9 @@
 # Parts of this code were copied and adapted from the Agilent33220A class.
 
 import logging
+
+import numpy as np
+
 from pymeasure.instruments import Instrument, Channel
 from pymeasure.instruments.validators import strict_discrete_set, strict_range
 from time import time
@@ -330,7 +333,10 @@ class Agilent33500Channel(Channel):
                             format = 'float': Accepts list of floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
 
-                            format = 'binary': Accepts a binary stream of 8 bit data.
+                            format = 'binary': Accepts an array of either integer DAC values
+                            (sent as 16 bit integers) or floating point values (sent as 32 bit
+                            floats), transmitted as a binary block. This is much faster than the
+                            text formats for long traces.
         :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
                             'binary'. See documentation on parameter data_points above.
         """
@@ -346,10 +352,17 @@ class Agilent33500Channel(Channel):
             data_string = separator.join(data_points_str)  # Join strings with separator
             self.write(f"SOUR{{ch}}:DATA:ARB {arb_name}, {data_string}")
             return
-        elif data_format == "binary":  # TODO: *Binary is not yet implemented*
-            raise NotImplementedError(
-                'The binary format has not yet been implemented. Use "DAC" or "float" instead.'
-            )
+        elif data_format == "binary":
+            data_points = np.asarray(data_points)
+            if np.issubdtype(data_points.dtype, np.integer):
+                command, datatype = "SOUR{ch}:DATA:ARB:DAC", "h"
+            else:
+                command, datatype = "SOUR{ch}:DATA:ARB", "f"
+            # Binary blocks are sent in little endian byte order
+            self.write("FORM:BORD SWAP")
+            self.write_binary_values(f"{command} {arb_name}, ", data_points,
+                                     datatype=datatype, is_big_endian=False)
+            return
         else:
             raise ValueError(
                 'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
@@ -717,7 +730,10 @@ class Agilent33500(Instrument):
                             -32767 to +32767. Minimum of 8 a maximum of 65536 points.
                             format = 'float': Accepts list of floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
-                            format = 'binary': Accepts a binary stream of 8 bit data.
+                            format = 'binary': Accepts an array of either integer DAC values
+                            (sent as 16 bit integers) or floating point values (sent as 32 bit
+                            floats), transmitted as a binary block. This is much faster than the
+                            text formats for long traces.
         :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
                             'binary'. See documentation on parameter data_points above.
         """
@@ -733,10 +749,17 @@ class Agilent33500(Instrument):
             data_string = separator.join(data_points_str)  # Join strings with separator
             self.write(f"DATA:ARB {arb_name}, {data_string}")
             return
-        elif data_format == "binary":  # TODO: *Binary is not yet implemented*
-            raise NotImplementedError(
-                'The binary format has not yet been implemented. Use "DAC" or "float" instead.'
-            )
+        elif data_format == "binary":
+            data_points = np.asarray(data_points)
+            if np.issubdtype(data_points.dtype, np.integer):
+                command, datatype = "DATA:ARB:DAC", "h"
+            else:
+                command, datatype = "DATA:ARB", "f"
+            # Binary blocks are sent in little endian byte order
+            self.write("FORM:BORD SWAP")
+            self.write_binary_values(f"{command} {arb_name}, ", data_points,
+                                     datatype=datatype, is_big_endian=False)
+            return
         else:
             raise ValueError(
                 'Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"'
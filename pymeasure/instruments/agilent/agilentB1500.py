@@ -418,9 +418,64 @@ class AgilentB1500(Instrument):
                 self.check_status(status_string)
                 return channel
 
+        def format_block(self, data, number_of_points):
+            """ Format the measurement values of many measurement points at
+            once. Each distinct status is checked (and logged) only once per
+            channel.
+
+            :param data: Comma separated measurement values read from the
+                         instrument
+            :type data: str
+            :param number_of_points: Number of measurement points
+            :type number_of_points: int
+            :return: Column headers (channel and data name), values
+                     (one column per header), and status of each value
+                     (as integer for FMT21, as letter otherwise)
+            :rtype: (list, list of np.ndarray, np.ndarray)
+            """
+            width = self.size - 1  # size includes the separator
+            elements = np.array(data.encode("ascii").split(b","))
+            if (elements.dtype.itemsize != width
+                    or np.any(np.char.str_len(elements) != width)):
+                raise ValueError(
+                    "Data does not consist of elements of width {}.".format(width))
+            chars = elements.view(np.uint8).reshape(-1, width)
+            stat = self.status_size
+
+            # check each combination of status and channel only once
+            for key in np.unique(
+                    np.ascontiguousarray(chars[:, :stat + 1]).view(f"S{stat + 1}")):
+                key = key.decode("ascii")
+                self.format_channel_check_status(key[:stat], key[stat])
+
+            if stat == 3:
+                status = (chars[:, :3] - ord("0")) @ np.array([100, 10, 1])
+            else:
+                status = chars[:, 0].view("S1").astype("U1")
+            values = np.ascontiguousarray(chars[:, stat + 2:]).view(
+                f"S{width - stat - 2}").ravel().astype(float)
+            values = values.reshape(number_of_points, -1)
+
+            heads = []
+            columns = []
+            for index, element in enumerate(elements[:values.shape[1]]):
+                element = element.decode("ascii")
+                channel = self.channels[element[stat]]
+                if isinstance(channel, int):
+                    channel = int(str(channel)[0:-2])
+                channel = self.smu_names.get(channel, channel)
+                data_name = self.data_names[element[stat + 1]]
+                heads.append(f"{channel} {data_name}")
+                if data_name in self.data_names_int:
+                    columns.append(values[:, index].astype(int))
+                else:
+                    columns.append(values[:, index])
+            return heads, columns, status.reshape(number_of_points, -1)
+
     class _data_formatting_FMT1(_data_formatting_generic):
         """ Data formatting for FMT1 format
         """
+        status_size = 1
 
         def __init__(self, smu_names={}, output_format_string="FMT1"):
             super().__init__(smu_names, output_format_string)
@@ -455,6 +510,7 @@ class AgilentB1500(Instrument):
     class _data_formatting_FMT21(_data_formatting_generic):
         """ Data formatting for FMT21 format
         """
+        status_size = 3
 
         def __init__(self, smu_names={}):
             super().__init__(smu_names, "FMT21")
@@ -847,28 +903,26 @@ class AgilentB1500(Instrument):
     # Read out of data
     ######################################
 
-    def read_data(self, number_of_points):
+    def read_data(self, number_of_points, return_status=False):
         """ Reads all data from buffer and returns Pandas DataFrame.
         Specify number of measurement points for correct splitting of
         the data list.
 
         :param number_of_points: Number of measurement points
         :type number_of_points: int
-        :return: Measurement Data
-        :rtype: pd.DataFrame
+        :param return_status: Whether to return the status of each value
+            as well, defaults to False
+        :type return_status: bool, optional
+        :return: Measurement Data, and if ``return_status`` is True, an
+            array of the status of each value (one column per data column)
+        :rtype: pd.DataFrame or (pd.DataFrame, np.ndarray)
         """
-        data = self.read()
-        data = data.split(',')
-        data = np.array(data)
-        data = np.split(data, number_of_points)
-        data = pd.DataFrame(data=data)
-        data = data.applymap(self._data_format.format_single)
-        heads = data.iloc[[0]].applymap(lambda x: ' '.join(x[1:3]))
-        # channel & data_type
-        heads = heads.to_numpy().tolist()  # 2D List
-        heads = heads[0]  # first row
-        data = data.applymap(lambda x: x[3])
+        heads, columns, status = self._data_format.format_block(
+            self.read(), number_of_points)
+        data = pd.DataFrame(dict(enumerate(columns)))
         data.columns = heads
+        if return_status:
+            return data, status
         return data
 
     def read_channels(self, nchannels):
@@ -280,8 +280,9 @@ class AnritsuMS464xB(Instrument):
 
     number_of_ports = Instrument.measurement(
         ":SYST:PORT:COUN?",
-        """Get the number of instrument test ports. """,
+        """Get the number of instrument test ports (cached). """,
         cast=int,
+        cache=True,
     )
 
     number_of_channels = Instrument.control(
@@ -23,6 +23,8 @@
 #
 
 import numpy as np
+from queue import Queue
+from threading import Thread
 from time import sleep
 from importlib.util import find_spec
 
@@ -115,72 +117,179 @@ class SynchronousAI:
             if rc is None:
                 break
 
-    def measure(self, hasAborted=lambda: False):
-        """ Initiates the scan after first checking the command
-        and does not block, returns the starting timestamp
+    @staticmethod
+    def _physical_converter(converter):
+        """ Returns a function, which converts an array of raw values to
+        physical values by evaluating the calibration polynomial at once
+        """
+        try:
+            coefficients = converter.get_to_physical_coefficients()
+            origin = converter.get_to_physical_expansion_origin()
+        except AttributeError:  # No polynomial available, convert value-wise
+            return converter.to_physical
+        return lambda raw: np.polynomial.polynomial.polyval(
+            raw.astype(np.float64) - origin, coefficients)
+
+    def measure(self, hasAborted=lambda: False, block_size=1):
+        """ Initiates the scan after first checking the command and reads
+        the data in blocks of `block_size` scans. After each block, the
+        progress is emitted, and the data, which is the last scan for a
+        `block_size` of 1 and the 2D array of the block's scans otherwise.
+        Choose a larger `block_size` for high sample rates.
         """
         self._verifyCommand()
         sleep(0.01)
         self.subdevice.command()
 
         length = len(self.channels)
-        dtype = self.subdevice.get_dtype()
-        converters = [c.get_converter() for c in self.channels]
+        dtype = np.dtype(self.subdevice.get_dtype())
+        converters = [self._physical_converter(c.get_converter()) for c in self.channels]
 
         self.data = np.zeros((self.samples, length), dtype=np.float32)
+        raw = np.zeros((self.samples, length), dtype=dtype)
+        buffer = memoryview(raw).cast('B')
 
         # Trigger AI
         self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
 
         # Measurement loop
-        count = 0
-        size = int(self.data.itemsize / 2) * length
-        previous_bin_slice = b''
+        scan_size = dtype.itemsize * length
+        block_bytes = scan_size * block_size
+        received = 0  # bytes
+        count = 0  # converted scans
 
         while not hasAborted() and self.samples > count:
-            bin_slice = previous_bin_slice
-            while len(bin_slice) < size:
-                bin_slice += self.subdevice.device.file.read(size)
-            previous_bin_slice = bin_slice[size:]
-            bin_slice = bin_slice[:size]
-            slice = np.fromstring(
-                bin_slice,
-                dtype=dtype,
-                count=length
-            )
-
-            if len(slice) != length:  # Reading finished
-                break
+            read = self.subdevice.device.file.readinto(
+                buffer[received:received + block_bytes])
+            finished = not read  # Reading finished, convert the remaining scans
+            received += read
+            available = received // scan_size
+            if not finished and available - count < block_size and available < self.samples:
+                continue  # Block is not complete yet
 
-            # Convert to physical values
-            for i, c in enumerate(converters):
-                self.data[count, i] = c.to_physical(slice[i])
+            if available > count:
+                # Convert to physical values
+                block = slice(count, available)
+                for i, convert in enumerate(converters):
+                    self.data[block, i] = convert(raw[block, i])
+                count = available
 
-            self.emit_progress(100. * count / self.samples)
-            self.emit_data(self.data[count])
-            count += 1
+                self.emit_progress(100. * count / self.samples)
+                if block_size == 1:
+                    self.emit_data(self.data[count - 1])
+                else:
+                    self.emit_data(self.data[block])
+            if finished:
+                break
 
         # Cancel measurement if it is still running (abort event)
         if self.subdevice.get_flags().running:
             self.subdevice.cancel()
 
 
-""" Command for limited samples
+class ContinuousAI(SynchronousAI):
+    """ Continuous acquisition of analog input channels, without a fixed
+    number of samples or duration. The data is provided by the
+    :meth:`stream` generator in blocks of `block_size` scans, using a pool of
+    `buffers` preallocated blocks, such that long-running acquisitions use
+    constant memory. As the acquisition has no fixed duration, the `period`
+    attribute of :class:`SynchronousAI` is None.
+    """
+
+    def __init__(self, channels, scan_period, block_size=1000, buffers=4):
+        self.channels = channels
+        self.samples = 0  # no limit
+        self.period = None  # no fixed duration
+        self.block_size = block_size
+        self.buffers = buffers
+        self.scanPeriod = int(1e9 * float(scan_period))  # nano-seconds
+
+        self.subdevice = self.channels[0].subdevice
+        self.subdevice.cmd = self._command()
+
+    def _command(self):
+        """ Returns the command used to initiate the sampling, which runs
+        until it is cancelled
+        """
+        command = super()._command()
+        command.stop_src = TRIG_SRC.none
+        command.stop_arg = 0
+        return command
 
-command = self.subdevice.get_cmd_generic_timed(len(self.channels),
-                self.scanPeriod)
-command.start_src = TRIG_SRC.int
-command.start_arg = 0
-command.stop_src = TRIG_SRC.count
-command.stop_arg = self.samples
-command.chanlist = self.channels
+    def stream(self, hasAborted=lambda: False):
+        """ Initiates the scan and yields blocks of `block_size` scans as 2D
+        arrays of physical values, until `hasAborted` returns True, the
+        acquisition ends or the generator is closed.
 
-    Command for continuous AI
+        A background thread reads and converts the data into the pool of
+        `buffers` blocks, such that the acquisition continues while the
+        consumer processes a block. A yielded block is valid until the next
+        block is requested, copy it if it has to be kept longer. The hardware
+        sets the pace: if the consumer is slower on average, all blocks are
+        in use and reading pauses, until the device buffer overruns and
+        comedi stops the acquisition, which ends the stream.
+        """
+        self._verifyCommand()
+        sleep(0.01)
+        self.subdevice.command()
+
+        length = len(self.channels)
+        dtype = np.dtype(self.subdevice.get_dtype())
+        converters = [self._physical_converter(c.get_converter()) for c in self.channels]
+
+        raw = np.zeros((self.block_size, length), dtype=dtype)
+        buffer = memoryview(raw).cast('B')
+        blocks = np.zeros((self.buffers, self.block_size, length), dtype=np.float32)
+        scan_size = dtype.itemsize * length
+        file = self.subdevice.device.file
+
+        free = Queue()  # indices of blocks, which may be overwritten
+        for index in range(self.buffers):
+            free.put(index)
+        filled = Queue()  # (index, scans) of converted blocks
+
+        def read():
+            try:
+                scans = self.block_size
+                while scans == self.block_size:
+                    index = free.get()
+                    if index is None:  # Stream closed
+                        break
+                    received = 0
+                    while received < len(buffer):
+                        count = file.readinto(buffer[received:])
+                        if not count:  # Reading finished
+                            break
+                        received += count
+                    scans = received // scan_size
+                    for i, convert in enumerate(converters):
+                        blocks[index, :scans, i] = convert(raw[:scans, i])
+                    filled.put((index, scans))
+            except Exception as exc:
+                filled.put(exc)
+            finally:
+                filled.put(None)
+
+        reader = Thread(target=read, daemon=True)
+
+        # Trigger AI
+        self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
+        reader.start()
 
-command = self.subdevice.get_cmd_generic_timed(len(self.channels), self.scanPeriod)
-command.start_src = TRIG_SRC.int
-command.start_arg = 0
-command.stop_src = TRIG_SRC.none
-command.stop_arg = 0
-command.chanlist = self.channels
-"""
+        try:
+            while not hasAborted():
+                item = filled.get()
+                if item is None:  # Acquisition ended
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                index, scans = item
+                if scans:
+                    yield blocks[index, :scans]
+                free.put(index)
+        finally:
+            free.put(None)
+            # Cancel measurement if it is still running (abort event)
+            if self.subdevice.get_flags().running:
+                self.subdevice.cancel()
+            reader.join()
@@ -24,6 +24,7 @@
 
 from inspect import getmembers
 import logging
+import time
 from warnings import warn
 
 log = logging.getLogger(__name__)
@@ -128,6 +129,7 @@ class CommonBase:
 
     def __init__(self, preprocess_reply=None, **kwargs):
         self._special_names = self._setup_special_names()
+        self._property_cache = {}
         self._create_channels()
         if preprocess_reply is not None:
             warn(("Parameter `preprocess_reply` is deprecated. "
@@ -433,6 +435,43 @@ class CommonBase:
         self.wait_for(query_delay)
         return self.read_binary_values(**kwargs)
 
+    # Cache of property values
+    def _cached(self, key, getter, cache=True):
+        """Return the cached value for `key` or get it with `getter` and cache it.
+
+        :param tuple key: Cache key, its first element is the command.
+        :param getter: Callable returning the value, if it is not cached.
+        :param cache: True to keep the value until invalidated, or a lifetime in seconds.
+        """
+        try:
+            timestamp, value = self._property_cache[key]
+        except KeyError:
+            pass
+        else:
+            if cache is True or time.monotonic() - timestamp < cache:
+                return value
+        value = getter()
+        self._property_cache[key] = time.monotonic(), value
+        return value
+
+    def invalidate_cache(self, command=None):
+        """Invalidate cached property values, such that they are read again from the device.
+
+        Property values are only cached if the `cache` parameter of the property is set, see
+        :meth:`control`.
+
+        :param command: Get command whose cached values to invalidate. If None, all cached values
+            of this instance and of all its channels are invalidated.
+        """
+        if command is None:
+            self._property_cache.clear()
+            for name, child in vars(self).items():
+                if isinstance(child, CommonBase) and name != "parent":
+                    child.invalidate_cache()
+        else:
+            for key in [key for key in self._property_cache if key[0] == command]:
+                del self._property_cache[key]
+
     # Property creators
     @staticmethod
     def control(  # noqa: C901 accept that this is a complex method
@@ -453,6 +492,8 @@ class CommonBase:
         maxsplit=-1,
         cast=float,
         values_kwargs=None,
+        cache=False,
+        invalidates_cache=False,
         **kwargs
     ):
         """Return a property for the class based on the supplied
@@ -493,6 +534,11 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Cache the reply to `get_command` in order to save communication for values,
+            which do not change. If True, the value is kept until setting this property or calling
+            :meth:`invalidate_cache`. A number defines the lifetime of the cached value in seconds.
+        :param invalidates_cache: If True, setting this property invalidates all cached values of
+            the instance, e.g. because it changes ranges, which are cached.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -552,12 +598,23 @@ class CommonBase:
                  ):
             if get_command is None:
                 raise LookupError("Property can not be read.")
-            vals = self.values(command_process(get_command),
-                               separator=separator,
-                               cast=cast,
-                               preprocess_reply=preprocess_reply,
-                               maxsplit=maxsplit,
-                               **values_kwargs)
+            if cache:
+                vals = list(self._cached(
+                    (command_process(get_command), separator, cast, maxsplit, preprocess_reply),
+                    lambda: self.values(command_process(get_command),
+                                        separator=separator,
+                                        cast=cast,
+                                        preprocess_reply=preprocess_reply,
+                                        maxsplit=maxsplit,
+                                        **values_kwargs),
+                    cache))
+            else:
+                vals = self.values(command_process(get_command),
+                                   separator=separator,
+                                   cast=cast,
+                                   preprocess_reply=preprocess_reply,
+                                   maxsplit=maxsplit,
+                                   **values_kwargs)
             if check_get_errors:
                 try:
                     error_list = self.check_get_errors()
@@ -616,6 +673,10 @@ class CommonBase:
                     'for CommonBase.control'.format(type(values))
                 )
             self.write(command_process(set_command) % value)
+            if invalidates_cache:
+                self.invalidate_cache()
+            elif cache and get_command is not None:
+                self.invalidate_cache(command_process(get_command))
             if check_set_errors:
                 try:
                     error_list = self.check_set_errors()
@@ -652,6 +713,7 @@ class CommonBase:
                     maxsplit=-1,
                     cast=float,
                     values_kwargs=None,
+                    cache=False,
                     **kwargs):
         """ Return a property for the class based on the supplied
         commands. This is a measurement quantity that may only be
@@ -683,6 +745,8 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Cache the reply, see :meth:`control`. If True, the value is kept until
+            :meth:`invalidate_cache` is called. A number defines the lifetime in seconds.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -710,6 +774,7 @@ class CommonBase:
                                   maxsplit=maxsplit,
                                   cast=cast,
                                   values_kwargs=values_kwargs,
+                                  cache=cache,
                                   )
 
     @staticmethod
@@ -717,6 +782,7 @@ class CommonBase:
                 validator=lambda x, y: x, values=(), map_values=False,
                 set_process=lambda v: v,
                 check_set_errors=False, dynamic=False,
+                invalidates_cache=False,
                 ):
         """Return a property for the class based on the supplied
         commands. This property may be set, but raises an exception
@@ -735,6 +801,8 @@ class CommonBase:
         :param check_set_errors: Toggles checking errors after setting
         :param dynamic: Specify whether the property parameters are meant to be changed in
             instances or subclasses. See :meth:`control` for an usage example.
+        :param invalidates_cache: If True, setting this property invalidates all cached values of
+            the instance, see :meth:`control`.
         """
 
         return CommonBase.control(get_command=None,
@@ -746,6 +814,7 @@ class CommonBase:
                                   set_process=set_process,
                                   check_set_errors=check_set_errors,
                                   dynamic=dynamic,
+                                  invalidates_cache=invalidates_cache,
                                   )
 
     def check_errors(self):
@@ -56,17 +56,15 @@ class SCPIMixin:
         cast=str,
     )
 
-    options = Instrument.measurement(
-        "*OPT?",
-        """Get the device options installed.""",
-        cast=str,
-    )
+    @property
+    def options(self):
+        """Get the device options installed (cached if :attr:`cache_identification`)."""
+        return self._identification("*OPT?", lambda: self._query_str("*OPT?"))
 
-    id = Instrument.measurement(
-        "*IDN?",
-        """Get the identification of the instrument.""",
-        cast=str,
-    )
+    @property
+    def id(self):
+        """Get the identification of the instrument (cached if :attr:`cache_identification`)."""
+        return self._identification("*IDN?", lambda: self._query_str("*IDN?"))
 
     next_error = Instrument.measurement(
         "SYST:ERR?",
@@ -75,6 +73,11 @@ class SCPIMixin:
         """,
     )
 
+    def _query_str(self, command):
+        """Return the string values of the reply, a single value is not wrapped in a list."""
+        values = self.values(command, cast=str)
+        return values[0] if len(values) == 1 else values
+
     # SCPI default methods
     def clear(self):
         """Clear the instrument status byte."""
@@ -83,6 +86,7 @@ class SCPIMixin:
     def reset(self):
         """Reset the instrument."""
         self.write("*RST")
+        self.invalidate_cache()
 
     def check_errors(self):
         """ Read all errors from the instrument.
@@ -76,6 +76,12 @@ class Instrument(CommonBase):
         Discarded otherwise.
     """
 
+    #: Cache the replies of :attr:`id` and :attr:`options` until :meth:`reset` or
+    #: :meth:`~pymeasure.instruments.common_base.CommonBase.invalidate_cache` is called.
+    #: Enable it in a driver or an instance to save communication. Reading them does not
+    #: talk to the device anymore, so do not use them to check the connection in that case.
+    cache_identification = False
+
     # noinspection PyPep8Naming
     def __init__(self, adapter, name, includeSCPI=None,
                  preprocess_reply=None,
@@ -133,20 +139,26 @@ class Instrument(CommonBase):
 
     @property
     def options(self):
-        """ Get the device options installed. """
+        """ Get the device options installed (cached if :attr:`cache_identification`). """
         if self.SCPI:
-            return self.ask("*OPT?").strip()
+            return self._identification("*OPT?", lambda: self.ask("*OPT?").strip())
         else:
             raise NotImplementedError("Non SCPI instruments require implementation in subclasses")
 
     @property
     def id(self):
-        """ Get the identification of the instrument. """
+        """ Get the identification of the instrument (cached if :attr:`cache_identification`). """
         if self.SCPI:
-            return self.ask("*IDN?").strip()
+            return self._identification("*IDN?", lambda: self.ask("*IDN?").strip())
         else:
             raise NotImplementedError("Non SCPI instruments require implementation in subclasses")
 
+    def _identification(self, command, getter):
+        """Return the reply of `getter`, cached under `command` if :attr:`cache_identification`."""
+        if self.cache_identification:
+            return self._cached((command,), getter)
+        return getter()
+
     @property
     def next_error(self):
         """Get the next error of the instrument (tuple of code and message)."""
@@ -217,6 +229,7 @@ class Instrument(CommonBase):
         """ Resets the instrument. """
         if self.SCPI:
             self.write("*RST")
+            self.invalidate_cache()
         else:
             raise NotImplementedError("Non SCPI instruments require implementation in subclasses")
 
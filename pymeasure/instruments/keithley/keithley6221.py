@@ -266,15 +266,14 @@ class Keithley6221(KeithleyBuffer, Instrument):
             raise ValueError("datapoints must be a list or numpy array")
         elif len(datapoints) > 100:
             raise ValueError("datapoints cannot be longer than 100 points")
-        elif not all([x >= -1 and x <= 1 for x in datapoints]):
+        elif not np.all(np.abs(datapoints) <= 1):
             raise ValueError("all data points must be between -1 and 1")
 
         if location not in [1, 2, 3, 4]:
             raise ValueError("location must be in [1, 2, 3, 4]")
 
-        # Make list of strings
-        datapoints = [str(x) for x in datapoints]
-        data = ", ".join(datapoints)
+        # The instrument accepts the data points only as ASCII list
+        data = ", ".join(map(str, datapoints))
 
         # Write the data points to the Keithley 6221
         self.write(":SOUR:WAVE:ARB:DATA %s" % data)
@@ -484,7 +484,7 @@ class KeysightDSOX1102G(Instrument):
         img = self.binary_values(query, header_bytes=10, dtype=np.uint8)
         return bytearray(img)
 
-    def download_data(self, source, points=62500):
+    def download_data(self, source, points=62500, format_="ascii"):
         """ Get data from specified source of oscilloscope. Returned objects are a np.ndarray of
         data values (no temporal axis) and a dict of the waveform preamble, which can be used to
         build the corresponding time values for all data points.
@@ -492,22 +492,53 @@ class KeysightDSOX1102G(Instrument):
         Multimeter will be stopped for proper acquisition.
 
         :param source: measurement source, can be "channel1", "channel2", "function", "fft",
-            "wmemory1", "wmemory2", or "ext".
+            "wmemory1", "wmemory2", or "ext". A list of sources downloads all of them in a row.
         :param points: integer number of points to acquire. Note that oscilloscope may return fewer
             points than specified, this is not an issue of this library. Can be 100, 250, 500, 1000,
             2000, 5000, 10000, 20000, 50000, or 62500.
+        :param format_: transfer format "ascii", "word", or "byte". The binary formats are much
+            smaller on the wire and faster to parse, "byte" has a reduced vertical resolution.
+            The binary data is scaled with the preamble, such that all formats return volts.
 
         :return data_ndarray, waveform_preamble_dict: see waveform_preamble property for dict
-            format.
+            format. For a list of sources, a list of data arrays and a list of preambles are
+            returned instead.
         """
-        # TODO: Consider downloading from multiple sources at the same time.
-        self.waveform_source = source
         self.waveform_points_mode = "normal"
         self.waveform_points = points
-
+        if format_ != "ascii":
+            self.waveform_format = format_
+            self.write(":waveform:unsigned 1;:waveform:byteorder MSBF")
+
+        if isinstance(source, str):
+            return self._download_source(source, format_)
+        data, preambles = [], []
+        for src in source:
+            values, preamble = self._download_source(src, format_)
+            data.append(values)
+            preambles.append(preamble)
+        return data, preambles
+
+    def _download_source(self, source, format_):
+        """Download the data of a single source, see :meth:`download_data`."""
+        self.waveform_source = source
         preamble = self.waveform_preamble
-        data_bytes = self.waveform_data
-        return np.array(data_bytes), preamble
+        if format_ == "ascii":
+            return np.array(self.waveform_data), preamble
+        raw = self._read_waveform_block(dtype=">u2" if format_ == "word" else "u1")
+        # in float, as the unsigned raw values are below the reference for negative voltages
+        data = ((raw.astype(np.float64) - preamble["yreference"]) * preamble["yincrement"]
+                + preamble["yorigin"])
+        return data, preamble
+
+    def _read_waveform_block(self, dtype):
+        """Read the waveform data as IEEE 488.2 binary block and return the raw values."""
+        self.write(":waveform:data?")
+        header = self.read_bytes(2)  # "#N" with N the number of length digits
+        length = int(self.read_bytes(int(header[1:2])))
+        data = self.read_bytes(length)
+        self.read_bytes(1)  # termination character
+        return np.frombuffer(data, dtype=dtype)
 
     def _timebase(self):
         """
@@ -1308,6 +1308,43 @@ class VirtualBench():
             """
             return self.mso.read_analog_digital_u64()
 
+        def stream_analog(self, count=None, autoTrigger=True, buffers=4):
+            """ Repeatedly acquires and transfers the analog data and yields
+            it as 2D NumPy array (samples x channels), without building a
+            dataframe. Each block is one acquisition record, the acquisition
+            is not gapless. A new acquisition is only started, when the next
+            block is requested.
+
+            The blocks are stored in a ring of ``buffers`` preallocated
+            arrays, such that memory stays constant. A yielded block is
+            overwritten after ``buffers`` further blocks, copy it if it has to
+            be kept longer.
+
+            :param count: Number of acquisitions, defaults to None (endless)
+            :type count: int, optional
+            :param bool autoTrigger: Enable/Disable auto triggering
+            :param int buffers: Number of preallocated blocks
+            :return: Generator of analog data blocks
+            :rtype: generator of np.ndarray
+            """
+            ring = None
+            index = 0
+            try:
+                while count is None or index < count:
+                    self.run(autoTrigger)
+                    (analog_data_out, analog_data_stride
+                     ) = self.read_analog_digital_u64()[0:2]
+                    data = np.asarray(analog_data_out).reshape(
+                        analog_data_stride, -1).T
+                    if ring is None or ring.shape[1:] != data.shape:
+                        ring = np.empty((buffers, *data.shape))
+                    block = ring[index % buffers]
+                    block[:] = data
+                    index += 1
+                    yield block
+            finally:
+                self.stop()
+
         def read_analog_digital_dataframe(self):
             """ Transfers data from the instrument and returns a pandas
             dataframe of the analog measurement data, including time
@@ -26,7 +26,6 @@ from abc import ABCMeta
 import re
 import sys
 import time
-from decimal import Decimal
 import numpy as np
 
 from pymeasure.instruments import Instrument, Channel
@@ -808,33 +807,29 @@ class TeledyneOscilloscope(Instrument, metaclass=ABCMeta):
 
         # If the number of points is big enough, split the data in small chunks and read it one
         # chunk at a time. For less than a certain amount of points we do not bother splitting them.
+        # The chunks are written directly into a preallocated array and the waveform setup is only
+        # sent, if it changed since the last chunk.
         chunk_bytes = 20000
         chunk_points = chunk_bytes - self._header_size - self._footer_size
-        iterations = -(expected_points // -chunk_points)
-        i = 0
-        data = []
-        while i < iterations:
-            # number of points already read
-            read_points = i * chunk_points
-            # number of points still to read
-            remaining_points = expected_points - read_points
+        data = np.empty(expected_points, dtype=np.uint8)
+        current_points, current_first_point = requested_points, 0
+        for read_points in range(0, expected_points, chunk_points):
             # number of points requested in a single chunk
-            requested_points = chunk_points if remaining_points > chunk_points else remaining_points
-            self.waveform_points = requested_points
-            # number of bytes requested in a single chunk
-            requested_bytes = requested_points + self._header_size + self._footer_size
+            points = min(chunk_points, expected_points - read_points)
+            if points != current_points:
+                self.waveform_points = current_points = points
             # read the next chunk starting from this points
             first_point = read_points * sparsing
-            self.waveform_first_point = first_point
-            # read chunk of points
+            if first_point != current_first_point:
+                self.waveform_first_point = current_first_point = first_point
+            # number of bytes requested in a single chunk
+            requested_bytes = points + self._header_size + self._footer_size
             values = self._digitize(src=self.waveform_source, num_bytes=requested_bytes)
             # perform many sanity checks on the received data
             self._header_footer_sanity_checks(values)
             self._npoints_sanity_checks(values)
-            # append the points without the header and footer
-            data.append(values[self._header_size:-self._footer_size])
-            i += 1
-        data = np.concatenate(data)
+            # store the points without the header and footer
+            data[read_points:read_points + points] = values[self._header_size:-self._footer_size]
         preamble = self.waveform_preamble
         return data, preamble
 
@@ -850,7 +845,7 @@ class TeledyneOscilloscope(Instrument, metaclass=ABCMeta):
             img = self.binary_values("SCDP", dtype=np.uint8)
         return bytearray(img)
 
-    def _process_data(self, ydata, preamble):
+    def _process_data(self, ydata, preamble, lazy_time=False):
         """Apply scale and offset to the data points acquired from the scope.
         - Y axis : the scale is ydiv / 25 and the offset -yoffset. the
         offset is not applied for the MATH source.
@@ -858,27 +853,26 @@ class TeledyneOscilloscope(Instrument, metaclass=ABCMeta):
         7 = 14 / 2 factor comes from the fact that there are 14 vertical grid lines and the data
         starts from the left half of the screen.
 
+        :param lazy_time: If True, return the X axis as a tuple of (first time point, time step)
+            instead of an array.
         :return: tuple of (numpy array of Y points, numpy array of X points, waveform preamble) """
 
-        def _scale_data(y):
-            if preamble["source"] == "MATH":
-                value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
-                value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
-            else:
-                value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
-                value -= preamble["yoffset"]
-            return value
-
-        def _scale_time(x):
-            return float(Decimal(-preamble["xdiv"] * self._grid_number / 2.) +
-                         Decimal(float(x * preamble["sparsing"])) /
-                         Decimal(preamble["sampling_rate"]))
-
-        data_points = np.vectorize(_scale_data)(ydata)
-        time_points = np.vectorize(_scale_time)(np.arange(len(data_points)))
+        if preamble["source"] == "MATH":
+            data_points = ydata.view(np.uint8) * preamble["ydiv"] / 25.
+            data_points -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
+        else:
+            data_points = ydata.view(np.int8) * preamble["ydiv"] / 25.
+            data_points -= preamble["yoffset"]
+
+        time_start = -preamble["xdiv"] * self._grid_number / 2.
+        time_step = preamble["sparsing"] / preamble["sampling_rate"]
+        if lazy_time:
+            time_points = (time_start, time_step)
+        else:
+            time_points = time_start + np.arange(len(data_points)) * time_step
         return data_points, time_points, preamble
 
-    def download_waveform(self, source, requested_points=None, sparsing=None):
+    def download_waveform(self, source, requested_points=None, sparsing=None, lazy_time=False):
         """Get data points from the specified source of the oscilloscope.
 
         The returned objects are two np.ndarray of data and time points and a dict with the
@@ -892,6 +886,9 @@ class TeledyneOscilloscope(Instrument, metaclass=ABCMeta):
         :param sparsing: interval between data points. For example if sparsing = 4, only one
                point every 4 points is read. If 0 or None the sparsing of the previous call is
                assumed, i.e. the value of the sparsing stored in the oscilloscope memory.
+        :param lazy_time: If True, the time points are not calculated, instead a tuple of the
+               first time point and the time step is returned. The time of the n-th point is
+               ``first + n * step``. This saves memory for long waveforms.
         :return: data_ndarray, time_ndarray, waveform_preamble_dict: see waveform_preamble
                  property for dict format.
         """
@@ -909,7 +906,7 @@ class TeledyneOscilloscope(Instrument, metaclass=ABCMeta):
         preamble["sparsing"] = sparsing
         preamble["first_point"] = 0
         # Scale the Y-data and create the X-data
-        return self._process_data(ydata, preamble)
+        return self._process_data(ydata, preamble, lazy_time=lazy_time)
 
     ###############
     #   Trigger   #
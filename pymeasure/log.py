@@ -32,6 +32,20 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+def truncate_message(message, limit=1024):
+    """Shorten a str or bytes `message` to `limit` elements for logging.
+
+    The length of a truncated message is appended, e.g. :code:`b"abc... (123456 bytes)"`.
+
+    :param limit: Maximum number of characters or bytes. None does not truncate.
+    """
+    if limit is None or len(message) <= limit:
+        return message
+    if isinstance(message, str):
+        return f"{message[:limit]}... ({len(message)} characters)"
+    return bytes(message[:limit]) + f"... ({len(message)} bytes)".encode()
+
+
 class QueueListener(logging.handlers.QueueListener):
     def is_alive(self):
         try:
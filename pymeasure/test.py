@@ -62,6 +62,6 @@ def expected_protocol(instrument_cls, comm_pairs,
         "Unprocessed protocol definitions remain: "
         f"{comm_pairs[protocol._index:]}.")
     assert protocol._write_buffer is None, (
-        f"Non-empty write buffer remains: '{protocol._write_buffer}'.")
+        f"Non-empty write buffer remains: '{bytes(protocol._write_buffer)}'.")
     assert protocol._read_buffer is None, (
-        f"Non-empty read buffer remains: '{protocol._read_buffer}'.")
+        f"Non-empty read buffer remains: '{bytes(protocol._read_buffer)}'.")
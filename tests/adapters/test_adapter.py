@@ -182,3 +182,16 @@ class TestLoggingForTestGenerator:
         record = caplog.records[0]
         assert record.msg == "READ:%s"
         assert record.args == (read,)
+
+    def test_log_limit(self, adapter, caplog):
+        adapter.log_limit = 4
+        adapter.comm_pairs = [(None, self.message)]
+        adapter.read_bytes(-1)
+        assert caplog.records[0].args == (b"some... (20 bytes)",)
+
+    def test_no_log_limit(self, adapter, caplog):
+        adapter.log_limit = None
+        message = self.message * 100
+        adapter.comm_pairs = [(None, message)]
+        adapter.read_bytes(-1)
+        assert caplog.records[0].args == (message,)
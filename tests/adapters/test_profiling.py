@@ -0,0 +1,130 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.adapters.profiling import IOProfile, command_prefix
+from pymeasure.instruments import Channel, Instrument
+
+
+class FakeChannel(Channel):
+    voltage = Channel.measurement("{ch} VOLT?", """Measure a voltage.""")
+
+
+class FakeInstrument(Instrument):
+    def __init__(self, adapter, name="Fake", **kwargs):
+        super().__init__(adapter, name, includeSCPI=False, **kwargs)
+
+    voltage = Instrument.measurement("5 VOLT?", """Measure a voltage.""")
+
+    current = Instrument.control("7 CURR?", "7 CURR %g", """Control a current.""")
+
+    ch_1 = Instrument.ChannelCreator(FakeChannel, 1)
+
+    def measure(self):
+        return self.ask("6 MEAS?")
+
+
+@pytest.mark.parametrize("message, prefix", (
+    ("VOLT 5", "VOLT"),
+    (b"VOLT 5", "VOLT"),
+    ("  *IDN?", "*IDN?"),
+    ("", ""),
+    (None, ""),
+    (b"\xff\x00", "�\x00"),
+    ("A" * 30, "A" * 20),
+))
+def test_command_prefix(message, prefix):
+    assert command_prefix(message) == prefix
+
+
+def test_disabled_by_default():
+    adapter = FakeAdapter()
+    adapter.write("5")
+    assert adapter._profile is None
+
+
+def test_profile_counts():
+    adapter = FakeAdapter()
+    with adapter.profile() as profile:
+        adapter.write("VOLT 5")
+        adapter.read()
+        adapter.write("CURR 1")
+        adapter.write_bytes(b"CURR 2")
+        adapter.read_bytes(6)
+    assert adapter._profile is None
+    volt = profile.by_command["VOLT"]
+    assert (volt.writes, volt.reads, volt.bytes_written, volt.bytes_read) == (1, 1, 6, 6)
+    curr = profile.by_command["CURR"]
+    assert (curr.writes, curr.reads, curr.bytes_written, curr.bytes_read) == (2, 1, 12, 6)
+    assert sum(curr.histogram) == curr.count == 3
+    assert curr.time >= curr.max_time > 0
+
+
+def test_profile_continued():
+    adapter = FakeAdapter()
+    profile = IOProfile()
+    with adapter.profile(profile):
+        adapter.write("A")
+    with FakeAdapter().profile(profile) as second:
+        assert second is profile
+    assert profile.by_command["A"].writes == 1
+
+
+def test_profile_caller():
+    instrument = FakeInstrument(FakeAdapter())
+    with instrument.adapter.profile() as profile:
+        instrument.voltage
+        instrument.measure()
+    assert profile.by_caller["FakeInstrument.get('5 VOLT?')"].count == 2
+    # Python < 3.11 has no qualified names of code objects
+    assert sum(stat.count for caller, stat in profile.by_caller.items()
+               if caller.endswith("measure")) == 2
+    assert profile.by_command["5"].count == 2
+
+
+def test_profile_caller_property():
+    instrument = FakeInstrument(FakeAdapter())
+    with instrument.adapter.profile() as profile:
+        instrument.current = 1
+        instrument.current
+        instrument.ch_1.voltage
+        instrument.write("8")
+    assert profile.by_caller["FakeInstrument.set('7 CURR %g')"].writes == 1
+    assert profile.by_caller["FakeInstrument.get('7 CURR?')"].count == 2
+    assert profile.by_caller["FakeChannel.get('{ch} VOLT?')"].count == 2
+    assert profile.by_caller["test_profile_caller_property"].writes == 1
+
+
+def test_report():
+    adapter = FakeAdapter()
+    with adapter.profile() as profile:
+        adapter.write("VOLT 5")
+        adapter.read()
+        adapter.write("CURR 1")
+    lines = profile.report().split("\n")
+    assert lines[0].split()[:3] == ["command", "count", "bytes"]
+    assert {line.split()[0] for line in lines[1:]} == {"VOLT", "CURR"}
+    assert len(profile.report(by="caller", limit=1).split("\n")) == 2
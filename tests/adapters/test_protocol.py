@@ -25,7 +25,7 @@
 from unittest.mock import call
 import pytest
 
-from pymeasure.adapters.protocol import to_bytes, ProtocolAdapter
+from pymeasure.adapters.protocol import to_bytes, ProtocolAdapter, ReplayAdapter
 
 from pytest import mark, raises, fixture, warns
 
@@ -119,6 +119,14 @@ class Test_write_bytes:
         a.write_bytes(b"writ")
         assert a._index == 0
 
+    def test_write_byte_by_byte(self):
+        message = b"DATA " + b"x" * 1000
+        a = ProtocolAdapter([(message, 5)])
+        for byte in message:
+            a.write_bytes(bytes((byte,)))
+        assert a._write_buffer is None
+        assert a._read_buffer == b"5"
+
     def test_leftover_response(self):
         a = ProtocolAdapter([("written", 5)])
         a._read_buffer = b"5"
@@ -248,3 +256,81 @@ def test_write_and_read_with_and_without_bytes():
 def test_comm_pairs_are_all_length_2(pairs):
     with raises(ValueError):
         ProtocolAdapter(pairs)
+
+
+def test_connection_created_lazily():
+    a = ProtocolAdapter(connection_attributes={"timeout": 100})
+    assert a._connection is None
+    assert a.connection.timeout == 100
+    assert a._connection is not None
+
+
+def test_close_does_not_create_connection():
+    a = ProtocolAdapter()
+    a.close()
+    assert a._connection is None
+
+
+def test_comm_pairs_appended_later():
+    a = ProtocolAdapter([("c1", "a1")])
+    a.comm_pairs.append(("c2", "a2"))
+    assert a.ask("c1") == "a1"
+    assert a.ask("c2") == "a2"
+
+
+def test_comm_pairs_reassigned():
+    a = ProtocolAdapter([("abc", "resp")])
+    assert a.ask("abc") == "resp"
+    a.comm_pairs = [("abc", "other")]
+    a._index = 0
+    assert a.ask("abc") == "other"
+
+
+def test_read_large_message_in_parts():
+    message = bytes(range(256)) * 100
+    a = ProtocolAdapter([(None, message)])
+    parts = [a.read_bytes(1000) for _ in range(26)]
+    assert all(isinstance(part, bytes) for part in parts)
+    assert b"".join(parts) == message
+    assert a._read_buffer is None
+
+
+class TestReplayAdapter:
+    @fixture
+    def sleeps(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("pymeasure.adapters.protocol.time.sleep", sleeps.append)
+        return sleeps
+
+    def test_delay_after_write(self, sleeps):
+        a = ReplayAdapter([("c1", "a1"), ("c2", None)], delays=[10, 5])
+        assert a.ask("c1") == "a1"
+        assert sleeps[0] == pytest.approx(10, abs=0.1)
+        a.write("c2")
+        assert len(sleeps) == 1
+
+    def test_delay_without_write(self, sleeps):
+        a = ReplayAdapter([(None, "a1")], delays=[10])
+        assert a.read() == "a1"
+        assert sleeps[0] == pytest.approx(10, abs=0.1)
+
+    def test_time_scale(self, sleeps):
+        a = ReplayAdapter([("c1", "a1")], delays=[10], time_scale=0.5)
+        a.ask("c1")
+        assert sleeps[0] == pytest.approx(5, abs=0.1)
+
+    def test_no_delay(self, sleeps):
+        a = ReplayAdapter([("c1", "a1")])
+        a.ask("c1")
+        assert sleeps == []
+
+    def test_delays_length(self):
+        with raises(ValueError):
+            ReplayAdapter([("c1", "a1")], delays=[1, 2])
+
+    def test_from_file(self, tmp_path, sleeps):
+        path = tmp_path / "session.txt"
+        path.write_bytes(b"1.000000 WRITE:c1\n3.000000 READ:a1\n")
+        a = ReplayAdapter.from_file(path, time_scale=2)
+        assert a.ask("c1") == "a1"
+        assert sleeps[0] == pytest.approx(4, abs=0.1)
@@ -92,3 +92,25 @@ def test_adapter_write_binary_values(adapter, test_input, expected):
     adapter.write_binary_values("OUTP", test_input, datatype='B')
     # Add 10 bytes more, just to check that no extra bytes are present
     assert adapter.connection.read(len(expected) + 10) == expected
+
+
+def test_read_bytes_unlimited_larger_than_waiting(adapter):
+    """Test that reads are sized by the input buffer and return everything."""
+    adapter.write_bytes(bytes(range(256)) * 12)
+    assert adapter.read_bytes(-1) == bytes(range(256)) * 12
+
+
+@pytest.mark.parametrize("count", (-1, 10, 1000))
+def test_iter_bytes(adapter, count):
+    data = bytes(range(256)) * 4
+    adapter.write_bytes(data)
+    chunks = list(adapter.iter_bytes(count, chunk_size=100))
+    assert b"".join(chunks) == (data[:count] if count > 0 else data)
+    assert all(chunks)
+
+
+def test_iter_bytes_break_on_termchar(adapter):
+    adapter.read_termination = "\n"
+    adapter.write_bytes(b"basd\x02\nfasdf\n")
+    assert list(adapter.iter_bytes(break_on_termchar=True)) == [b"basd\x02\n"]
+    assert list(adapter.iter_bytes(break_on_termchar=True)) == [b"fasdf\n"]
@@ -0,0 +1,88 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+from io import StringIO
+from unittest import mock
+
+import pytest
+
+from pymeasure.display.Qt import QtCore
+from pymeasure.display.windows import ManagedWindow
+from pymeasure.experiment import FloatParameter, IntegerParameter, Procedure
+
+calls = []
+
+
+class EstimatedProcedure(Procedure):
+    points = IntegerParameter("Points", default=10)
+    delay = FloatParameter("Delay", default=0.5)
+    DATA_COLUMNS = ["Point", "Value"]
+
+    def get_estimates(self, sequence_length=None):
+        calls.append(sequence_length)
+        return self.points * self.delay
+
+
+class Window(ManagedWindow):
+    def __init__(self):
+        super().__init__(EstimatedProcedure, inputs=["points", "delay"], displays=["points"],
+                         x_axis="Point", y_axis="Value", sequencer=True,
+                         sequencer_inputs=["points", "delay"])
+
+
+@pytest.fixture
+def window(qtbot):
+    window = Window()
+    qtbot.addWidget(window)
+    # stop the update thread
+    window.estimator.update_box.setCheckState(QtCore.Qt.CheckState.Unchecked)
+    window.sequencer.data.load(StringIO('- "Points", "[1, 2]"\n-- "Delay", "arange(3)"'))
+    calls.clear()
+    yield window
+    logging.getLogger().removeHandler(window.log_widget.handler)
+
+
+def test_estimates_are_cached(window):
+    sequencer = window.sequencer
+    with mock.patch.object(sequencer, "get_sequence", wraps=sequencer.get_sequence) as sequence, \
+            mock.patch.object(sequencer, "get_sequence_length",
+                              wraps=sequencer.get_sequence_length) as length:
+        estimates = window.estimator.get_estimates()
+        assert window.estimator.get_estimates()[:3] == estimates[:3]
+        sequence.assert_not_called()  # the sequence itself is not asked for
+        assert length.call_count == 1
+    assert calls == [6]
+    assert estimates[0] == ("Duration", "5 s")
+    assert estimates[1] == ("Sequence length", "6")
+    assert estimates[2] == ("Sequence duration", "30 s")
+
+
+def test_estimates_updated_on_change(window):
+    window.estimator.get_estimates()
+    window.inputs.points.setValue(20)
+    assert window.estimator.get_estimates()[0] == ("Duration", "10 s")
+    window.sequencer.data.load(StringIO('- "Points", "[1, 2, 3]"'))
+    assert window.estimator.get_estimates()[1] == ("Sequence length", "3")
+    assert calls == [6, 6, 3]
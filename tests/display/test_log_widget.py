@@ -0,0 +1,84 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+import pytest
+
+from pymeasure.display.log import BufferedLogHandler
+from pymeasure.display.widgets.log_widget import LogWidget
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("pymeasure.test_log_widget")
+    logger.setLevel(logging.DEBUG)
+    yield logger
+    logger.handlers.clear()
+
+
+def test_buffered_log_handler_drops_oldest(logger):
+    handler = BufferedLogHandler(capacity=3)
+    logger.addHandler(handler)
+    for i in range(5):
+        logger.info("message %d", i)
+    records, dropped = handler.take()
+    assert [record.getMessage() for record in records] == [f"message {i}" for i in (2, 3, 4)]
+    assert dropped == 2
+    assert handler.take() == ([], 0)
+
+
+def test_log_widget_batches_records(qtbot, logger):
+    widget = LogWidget("Log")
+    qtbot.addWidget(widget)
+    logger.addHandler(widget.handler)
+    for i in range(3):
+        logger.info("message %d", i)
+    assert widget.view.toPlainText() == ""  # not yet updated
+
+    widget.update_view()
+    lines = widget.view.toPlainText().splitlines()
+    assert [line.split(" : ")[1] for line in lines] == [
+        f"message {i} (INFO)" for i in range(3)]
+
+
+def test_log_widget_bounded(qtbot, logger, monkeypatch):
+    monkeypatch.setattr(LogWidget, "maximum_lines", 10)
+    widget = LogWidget("Log")
+    qtbot.addWidget(widget)
+    logger.addHandler(widget.handler)
+    for i in range(25):
+        logger.debug("message %d", i)
+    widget.update_view()
+
+    lines = widget.view.toPlainText().splitlines()
+    assert widget.view.blockCount() == 10
+    assert lines[0] == "... 16 log messages dropped ..."
+    assert lines[1].endswith("message 16 (DEBUG)")
+    assert lines[-1].endswith("message 24 (DEBUG)")
+
+    logger.debug("message 25")
+    widget.update_view()
+    assert widget.view.blockCount() == 10
+    assert widget.view.toPlainText().splitlines()[-1].endswith("message 25 (DEBUG)")
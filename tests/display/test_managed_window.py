@@ -0,0 +1,203 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import os
+
+import pytest
+
+from pymeasure.display.Qt import QtCore, QtWidgets
+from pymeasure.display.widgets import ResultsDialog
+from pymeasure.display.windows import ManagedWindow
+from pymeasure.experiment import IntegerParameter, Procedure, Results
+
+
+class PointProcedure(Procedure):
+    point = IntegerParameter("Point", default=0)
+    DATA_COLUMNS = ["Point", "Value"]
+
+
+class Window(ManagedWindow):
+    def __init__(self):
+        super().__init__(PointProcedure, inputs=["point"], displays=["point"],
+                         x_axis="Point", y_axis="Value")
+
+
+@pytest.fixture
+def window(qtbot, tmp_path):
+    window = Window()
+    qtbot.addWidget(window)
+    window.directory = str(tmp_path)
+    window.manager._start_on_add = False  # do not run the experiments
+    yield window
+    logging.getLogger().removeHandler(window.log_widget.handler)
+
+
+def test_queue_procedures(window):
+    window.queue_procedures(PointProcedure(point=i) for i in range(20))
+
+    experiments = window.manager.experiments
+    assert len(experiments) == window.browser.topLevelItemCount() == 20
+    assert [e.procedure.point for e in experiments] == list(range(20))
+    assert all(e.curve_list == [] for e in experiments)
+    assert all(os.path.getsize(e.data_filename) == 0 for e in experiments)  # header deferred
+    assert experiments.next() is experiments[0]
+
+    experiment = experiments[1]
+    window.manager._create_curves(experiment)
+    assert len(experiment.curve_list) == 2  # plot and log widget
+    assert experiment.curve_factory is None
+    assert experiment.curve_list[0] in window.plot_widget.plot.items
+    assert Results.load(experiment.data_filename).procedure.point == 1
+
+
+def test_queue_procedures_invalid_filename(window, tmp_path):
+    window.filename = "data_{Unknown}"
+    window.queue_procedures(PointProcedure(point=i) for i in range(3))
+    assert len(window.manager.experiments) == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_queue_procedures_failing_filename(window, monkeypatch):
+    """The experiments created before a failing filename are queued, as their files exist."""
+    results_filename = window._results_filename
+
+    def failing_filename(procedure):
+        if procedure.point == 2:
+            raise OSError("disk full")
+        return results_filename(procedure)
+
+    monkeypatch.setattr(window, "_results_filename", failing_filename)
+    with pytest.raises(OSError):
+        window.queue_procedures(PointProcedure(point=i) for i in range(4))
+    assert [e.procedure.point for e in window.manager.experiments] == [0, 1]
+
+
+def test_queue_sequence_processes_events(qtbot, monkeypatch):
+    class SequencerWindow(Window):
+        def __init__(self):
+            ManagedWindow.__init__(self, PointProcedure, inputs=["point"], displays=["point"],
+                                   x_axis="Point", y_axis="Value", sequencer=True,
+                                   sequencer_inputs=["point"])
+
+    window = SequencerWindow()
+    qtbot.addWidget(window)
+    try:
+        queued = []
+        monkeypatch.setattr(window, "queue_procedures",
+                            lambda procedures: queued.extend(procedures))
+        monkeypatch.setattr(window.sequencer, "get_sequence",
+                            lambda: [({"point": i},) for i in range(250)])
+        calls = []
+        monkeypatch.setattr(QtWidgets.QApplication, "processEvents",
+                            lambda *args: calls.append(len(queued)))
+        window.sequencer.queue_sequence()
+    finally:
+        logging.getLogger().removeHandler(window.log_widget.handler)
+    assert [procedure.point for procedure in queued] == list(range(250))
+    assert calls == [0, 100, 200]
+
+
+def test_remove_before_start(window):
+    window.queue_procedures(PointProcedure(point=i) for i in range(3))
+    experiments = list(window.manager.experiments)
+    window.manager.remove(experiments[1])
+    assert not os.path.exists(experiments[1].data_filename)  # reserved file deleted
+    window.manager.clear()
+    assert not any(os.path.exists(e.data_filename) for e in experiments)
+
+
+def test_remove_keeps_written_files(window):
+    window.queue_procedures([PointProcedure()])
+    experiment = window.manager.experiments[0]
+    experiment.results.write_header()
+    window.manager.remove(experiment)
+    assert os.path.getsize(experiment.data_filename) > 0
+
+
+def test_queue_procedures_with_overridden_queue(qtbot):
+    class CustomWindow(Window):
+        def queue(self, procedure=None):
+            queued.append(procedure)
+
+    queued = []
+    window = CustomWindow()
+    qtbot.addWidget(window)
+    try:
+        procedures = [PointProcedure(point=i) for i in range(3)]
+        window.queue_procedures(procedures)
+    finally:
+        logging.getLogger().removeHandler(window.log_widget.handler)
+    assert queued == procedures
+
+
+def test_queued_procedures_run(window, qtbot):
+    window.manager._start_on_add = True
+    with qtbot.waitSignals([window.manager.finished] * 2, timeout=10000):
+        window.queue_procedures(PointProcedure(point=i) for i in range(2))
+    for i, experiment in enumerate(window.manager.experiments):
+        assert experiment.procedure.status == Procedure.FINISHED
+        assert experiment.curve_list
+        assert Results.load(experiment.data_filename).procedure.point == i
+
+
+@pytest.mark.parametrize("hidden", (False, True))
+def test_load_experiments(window, qtbot, tmp_path, hidden):
+    filenames = []
+    for i in range(3):
+        results = Results(PointProcedure(point=i), str(tmp_path / f"open{i}.csv"))
+        with open(results.data_filename, "a") as f:
+            f.write(f"{i},{i / 10}\n")
+        filenames.append(results.data_filename)
+
+    window.load_experiments(filenames, hidden=hidden)
+    qtbot.waitUntil(lambda: len(window.manager.experiments) == 3, timeout=10000)
+
+    for experiment in window.manager.experiments:
+        curve = experiment.curve_list[0]
+        assert (curve in window.plot_widget.plot.items) is not hidden
+        assert (experiment.results._data is None) is hidden
+
+    if hidden:  # show an experiment
+        experiment = window.manager.experiments[0]
+        experiment.browser_item.setCheckState(0, QtCore.Qt.CheckState.Checked)
+        assert experiment.curve_list[0] in window.plot_widget.plot.items
+        assert len(experiment.results._data) == 1
+
+
+@pytest.mark.parametrize("hidden", (False, True))
+def test_open_experiment(window, monkeypatch, tmp_path, hidden):
+    filename = Results(PointProcedure(), str(tmp_path / "open.csv")).data_filename
+
+    def exec(dialog):
+        dialog.hidden_checkbox.setChecked(hidden)
+        return True
+
+    loaded = []
+    monkeypatch.setattr(ResultsDialog, "exec", exec)
+    monkeypatch.setattr(ResultsDialog, "selectedFiles", lambda dialog: [filename])
+    monkeypatch.setattr(window, "load_experiments",
+                        lambda filenames, hidden: loaded.append((filenames, hidden)))
+    window.open_experiment()
+    assert loaded == [([filename], hidden)]
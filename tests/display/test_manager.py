@@ -0,0 +1,129 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.display.manager import Experiment, ExperimentQueue
+from pymeasure.experiment import IntegerParameter, Procedure, Results
+
+
+class IndexProcedure(Procedure):
+    index = IntegerParameter("Index")
+    DATA_COLUMNS = ["Value"]
+
+
+@pytest.fixture
+def experiments(tmp_path):
+    return [Experiment(Results(IndexProcedure(index=i), str(tmp_path / f"data{i}.csv")),
+                       browser_item=object())
+            for i in range(5)]
+
+
+@pytest.fixture
+def queue(experiments):
+    queue = ExperimentQueue()
+    for experiment in experiments:
+        queue.append(experiment)
+    return queue
+
+
+def test_next(queue, experiments):
+    assert queue.next() is experiments[0]
+    experiments[0].procedure.status = Procedure.RUNNING
+    assert queue.next() is experiments[1]
+    for experiment in experiments[1:]:
+        experiment.procedure.status = Procedure.FINISHED
+    assert not queue.has_next()
+    with pytest.raises(StopIteration):
+        queue.next()
+
+
+def test_finished_experiment_is_not_queued(queue, experiments, tmp_path):
+    # Results of an existing file are finished
+    loaded = Experiment(Results(IndexProcedure(index=0), str(tmp_path / "data0.csv")))
+    queue.remove(experiments[0])
+    queue.append(loaded)
+    assert queue.next() is experiments[1]
+
+
+def test_remove(queue, experiments):
+    queue.remove(experiments[0])
+    assert experiments[0] not in queue
+    assert "data0.csv" not in queue
+    assert queue.with_browser_item(experiments[0].browser_item) is None
+    assert queue.next() is experiments[1]
+    assert queue[:] == experiments[1:]
+    assert len(queue) == 4
+    with pytest.raises(Exception, match="not in the ExperimentQueue"):
+        queue.remove(experiments[0])
+
+
+def test_remove_running_experiment(queue, experiments):
+    experiments[2].procedure.status = Procedure.RUNNING
+    with pytest.raises(Exception, match="running"):
+        queue.remove(experiments[2])
+    assert experiments[2] in queue
+
+
+def test_contains(queue, experiments):
+    assert experiments[3] in queue
+    assert "data3.csv" in queue
+    assert "/other/directory/data3.csv" in queue  # compared by basename
+    assert "data7.csv" not in queue
+    assert 3 not in queue
+
+
+def test_with_browser_item(queue, experiments):
+    assert queue.with_browser_item(experiments[4].browser_item) is experiments[4]
+    assert queue.with_browser_item(object()) is None
+
+
+def test_remove_and_append_again(queue, experiments):
+    queue.remove(experiments[1])
+    queue.remove(experiments[3])
+    queue.append(experiments[3])
+    queue.append(experiments[1])
+    assert list(queue) == [experiments[i] for i in (0, 2, 4, 3, 1)]
+    assert queue[3] is experiments[3]
+    assert queue[-1] is experiments[1]
+    order = []
+    while queue.has_next():
+        experiment = queue.next()
+        order.append(experiment)
+        experiment.procedure.status = Procedure.FINISHED
+    assert order == [experiments[i] for i in (0, 2, 4, 3, 1)]
+
+
+def test_queue_is_read_only(queue, experiments):
+    assert queue.queue == tuple(experiments)
+    with pytest.raises(AttributeError):
+        queue.queue.append(experiments[0])
+
+
+def test_index_after_append(queue, experiments, tmp_path):
+    assert queue[4] is experiments[4]
+    new = Experiment(Results(IndexProcedure(index=5), str(tmp_path / "data5.csv")))
+    queue.append(new)
+    assert queue[5] is new
+    assert queue[1:3] == experiments[1:3]
@@ -0,0 +1,81 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.display.listeners import ResultsLoader
+from pymeasure.experiment import IntegerParameter, Procedure, Results
+
+
+class RowsProcedure(Procedure):
+    rows = IntegerParameter("Rows")
+    DATA_COLUMNS = ["Index", "Value"]
+
+
+@pytest.fixture
+def filenames(tmp_path):
+    filenames = []
+    for i in range(1, 6):
+        filename = str(tmp_path / f"data{i}.csv")
+        procedure = RowsProcedure(rows=i)
+        results = Results(procedure, filename)
+        with open(filename, "a") as file:
+            file.writelines(f"{j},{j / 10}\n" for j in range(i))
+        filenames.append(results.data_filename)
+    return filenames
+
+
+def test_results_loader(qtbot, filenames):
+    loader = ResultsLoader(filenames[1:] + ["does_not_exist.csv"])
+    loaded = []
+    failed = []
+    loader.loaded.connect(loaded.append)
+    loader.failed.connect(lambda filename, message: failed.append(filename))
+    with qtbot.waitSignal(loader.finished, timeout=10000):
+        loader.start()
+    assert sorted(results.data_filename for results in loaded) == filenames[1:]
+    for results in loaded:
+        # the data is already loaded
+        assert len(results._data) == results.procedure.rows
+    assert failed == ["does_not_exist.csv"]
+
+
+def test_results_loader_stop(qtbot, filenames):
+    loader = ResultsLoader(filenames, max_workers=1)
+    loaded = []
+    loader.loaded.connect(loaded.append)
+    loader.stop()
+    with qtbot.waitSignal(loader.finished, timeout=10000):
+        loader.start()
+    assert len(loaded) < len(filenames)
+
+
+def test_results_loader_without_data(qtbot, filenames):
+    loader = ResultsLoader(filenames, read_data=False)
+    loaded = []
+    loader.loaded.connect(loaded.append)
+    with qtbot.waitSignal(loader.finished, timeout=10000):
+        loader.start()
+    assert len(loaded) == len(filenames)
+    assert all(results._data is None for results in loaded)
@@ -0,0 +1,142 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from pymeasure.experiment import Metadata, ResultsCatalog
+from pymeasure.experiment.results import Results
+from data.procedure_for_testing import RandomProcedure
+
+
+class MetadataProcedure(RandomProcedure):
+    sample = Metadata("Sample", default="S1")
+
+
+def write(filename, iterations, delay, rows, procedure_class=RandomProcedure):
+    procedure = procedure_class(iterations=iterations, delay=delay)
+    results = Results(procedure, str(filename))
+    procedure.evaluate_metadata()
+    results.store_metadata()
+    with open(filename, "a") as f:
+        f.writelines(f"{i},{i / 10}\n" for i in range(rows))
+
+
+@pytest.fixture
+def directory(tmp_path):
+    write(tmp_path / "a.csv", 10, 0.5, 3)
+    write(tmp_path / "b.csv", 20, 1.5, 0)
+    (tmp_path / "sub").mkdir()
+    write(tmp_path / "sub" / "c.csv", 30, 2.5, 5, MetadataProcedure)
+    (tmp_path / "other.txt").write_text("not a results file")
+    return tmp_path
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with ResultsCatalog(str(tmp_path / "catalog.sqlite")) as catalog:
+        yield catalog
+
+
+def names(filenames):
+    return [os.path.basename(filename) for filename in filenames]
+
+
+def test_update(catalog, directory):
+    assert catalog.update(directory) == 3
+    assert catalog.update(directory) == 0
+    (directory / "a.csv").unlink()
+    write(directory / "a.csv", 11, 0.5, 4)
+    os.utime(directory / "a.csv", (0, 1e9))  # ensure a new modification time
+    (directory / "b.csv").unlink()
+    assert catalog.update(directory) == 1
+    assert sorted(names(catalog.find())) == ["a.csv", "c.csv"]
+    assert catalog.info(directory / "a.csv")["Parameters"]["Loop Iterations"] == "11"
+
+
+def test_not_recursive(catalog, directory):
+    assert catalog.update(directory, recursive=False) == 2
+    catalog.update(directory)
+    assert catalog.update(directory, recursive=False) == 0
+    assert sorted(names(catalog.find())) == ["a.csv", "b.csv", "c.csv"]  # c.csv is kept
+
+
+def test_other_extensions_are_kept(catalog, directory):
+    catalog.update(directory)
+    write(directory / "d.dat", 10, 0.5, 1)
+    assert catalog.update(directory, extensions=(".dat",)) == 1
+    assert sorted(names(catalog.find())) == ["a.csv", "b.csv", "c.csv", "d.dat"]
+
+
+def test_similar_directories_are_kept(catalog, tmp_path):
+    for name in ("data_1", "data%1", "DATA1"):
+        (tmp_path / name).mkdir()
+        write(tmp_path / name / "a.csv", 10, 0.5, 1)
+    catalog.update(tmp_path / "data_1")
+    catalog.update(tmp_path / "data%1")
+    catalog.update(tmp_path / "DATA1")
+    catalog.update(tmp_path / "data_1")  # must not remove the other directories' files
+    assert len(catalog.find()) == 3
+
+
+def test_empty_files_are_skipped(catalog, directory, caplog):
+    (directory / "reserved.csv").touch()  # filename reserved by a queued experiment
+    assert catalog.update(directory) == 3
+    assert "reserved.csv" not in caplog.text
+    write(directory / "reserved.csv", 10, 0.5, 1)
+    assert catalog.update(directory) == 1
+    (directory / "a.csv").write_text("")
+    catalog.update(directory)
+    assert sorted(names(catalog.find())) == ["b.csv", "c.csv", "reserved.csv"]
+
+
+def test_info(catalog, directory):
+    catalog.update(directory)
+    info = catalog.info(directory / "sub" / "c.csv")
+    assert info["procedure"].endswith("MetadataProcedure")
+    assert info["rows"] == 5
+    assert info["Parameters"]["Delay Time"] == "2.5 s"
+    assert info["Metadata"] == {"Sample": "S1"}
+    assert catalog.info(directory / "missing.csv") is None
+
+
+@pytest.mark.parametrize("kwargs, result", (
+    ({"parameters": {"Delay Time": (">", 1)}}, ["b.csv", "c.csv"]),
+    ({"parameters": {"Delay Time": ("<=", 1.5), "Loop Iterations": 10}}, ["a.csv"]),
+    ({"parameters": {"Delay Time": "0.5 s"}}, ["a.csv"]),
+    ({"parameters": {"Sample": "S1"}}, ["c.csv"]),
+    ({"procedure": "MetadataProcedure"}, ["c.csv"]),
+    ({"modified_after": datetime.now() + timedelta(days=1)}, []),
+    ({"modified_before": datetime.now() + timedelta(days=1)}, ["a.csv", "b.csv", "c.csv"]),
+))
+def test_find(catalog, directory, kwargs, result):
+    catalog.update(directory)
+    assert sorted(names(catalog.find(**kwargs))) == result
+
+
+def test_find_invalid_operator(catalog):
+    with pytest.raises(ValueError):
+        catalog.find(parameters={"Delay Time": ("; DROP TABLE files", 1)})
@@ -22,10 +22,14 @@
 # THE SOFTWARE.
 #
 
+import os
+import subprocess
+import sys
 import pytest
 import pickle
 
-from pymeasure.experiment.procedure import Procedure, ProcedureWrapper
+from pymeasure.experiment.procedure import (Procedure, ProcedureWrapper, _load_procedure_class,
+                                            _procedure_source)
 from pymeasure.experiment.parameters import Parameter
 from pymeasure.units import ureg
 
@@ -59,6 +63,89 @@ def test_procedure_wrapper():
     assert hasattr(new_wrapper, 'procedure')
     assert new_wrapper.procedure.iterations == 101
     assert RandomProcedure.iterations.value == 100
+    assert new_wrapper.procedure.__class__ is RandomProcedure
+
+
+PROCEDURE_SOURCE = """
+from pymeasure.experiment import Procedure, IntegerParameter
+
+class FileProcedure(Procedure):
+    iterations = IntegerParameter('Loop Iterations', default={})
+
+if __name__ == "__main__":
+    raise RuntimeError("script part executed")
+"""
+
+
+@pytest.mark.parametrize("module_name", ("file_procedure", "__main__"))
+def test_load_procedure_class_is_cached_until_modified(tmp_path, module_name):
+    filename = str(tmp_path / "file_procedure.py")
+    with open(filename, "w") as f:
+        f.write(PROCEDURE_SOURCE.format(5))
+    cls = _load_procedure_class(module_name, filename, "FileProcedure")
+    assert cls.iterations.default == 5
+    assert _load_procedure_class(module_name, filename, "FileProcedure") is cls
+
+    with open(filename, "w") as f:
+        f.write(PROCEDURE_SOURCE.format(7))
+    os.utime(filename, ns=(0, os.stat(filename).st_mtime_ns + 10**9))
+    new_cls = _load_procedure_class(module_name, filename, "FileProcedure")
+    assert new_cls is not cls
+    assert new_cls.iterations.default == 7
+
+
+PICKLE_SCRIPT = """
+import pickle
+from pymeasure.experiment import Results
+from pymeasure.experiment.procedure import ProcedureWrapper
+{}
+procedure = FileProcedure(iterations=42)
+with open("state.pkl", "wb") as f:
+    pickle.dump((ProcedureWrapper(procedure), Results(procedure, "data.csv")), f)
+"""
+
+REPICKLE_SCRIPT = """
+import pickle
+with open("state.pkl", "rb") as f:
+    objects = pickle.loads(pickle.dumps(pickle.load(f)))
+print([obj.procedure.iterations for obj in objects])
+"""
+
+
+@pytest.mark.parametrize("as_script", (False, True))
+def test_pickle_unpickled_procedure_in_new_process(tmp_path, as_script):
+    """Objects unpickled in another process, which loaded the procedure class from its file,
+    can be pickled again."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    if as_script:  # the procedure class is defined in __main__
+        script = tmp_path / "script.py"
+        script.write_text(PROCEDURE_SOURCE.format(5).split("if __name__")[0]
+                          + "if __name__ == '__main__':\n"
+                          + PICKLE_SCRIPT.format("").replace("\n", "\n    "))
+        subprocess.run([sys.executable, str(script)], cwd=tmp_path, env=env, check=True)
+    else:
+        (tmp_path / "file_procedure.py").write_text(PROCEDURE_SOURCE.format(5))
+        subprocess.run(
+            [sys.executable, "-c",
+             PICKLE_SCRIPT.format("from file_procedure import FileProcedure")],
+            cwd=tmp_path, env=env, check=True)
+    # Start from a different directory, such that the module cannot be imported by its name.
+    (tmp_path / "other").mkdir()
+    os.replace(tmp_path / "state.pkl", tmp_path / "other" / "state.pkl")
+    result = subprocess.run([sys.executable, "-c", REPICKLE_SCRIPT], cwd=tmp_path / "other",
+                            env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[42, 42]"
+
+
+def test_procedure_source_is_stored_in_class():
+    class LocalProcedure(RandomProcedure):
+        pass
+
+    source = _procedure_source(LocalProcedure)
+    assert source == (__name__, __file__, "LocalProcedure")
+    assert LocalProcedure.__dict__["_pickle_source"] is source
+    assert _procedure_source(RandomProcedure)[2] == "RandomProcedure"  # not inherited
 
 
 # This test checks that user can define properties using the parameters inside the procedure
@@ -34,7 +34,7 @@ import numpy as np
 from pymeasure.units import ureg
 from pymeasure.experiment.results import Results, CSVFormatter
 from pymeasure.experiment.procedure import Procedure, Parameter
-from pymeasure.experiment import BooleanParameter
+from pymeasure.experiment import BooleanParameter, Metadata
 from data.procedure_for_testing import RandomProcedure
 
 
@@ -111,14 +111,33 @@ def test_procedure_filestorage():
     assert RandomProcedure.iterations.value == 100
 
 
+def test_pickle_is_compact_and_keeps_procedure_class(tmp_path):
+    procedure = RandomProcedure()
+    procedure.iterations = 101
+    results = Results(procedure, str(tmp_path / "data.csv"))
+    with open(results.data_filename, 'a') as f:
+        f.writelines(f"{i},{i / 10}\n" for i in range(1000))
+    size = len(pickle.dumps(results))
+    assert len(results.data) == 1000
+    assert len(pickle.dumps(results)) == size  # loaded data is not pickled
+
+    new_results = pickle.loads(pickle.dumps(results))
+    assert new_results.procedure_class is RandomProcedure
+    assert isinstance(new_results.procedure, RandomProcedure)
+    assert new_results.parameters['iterations'].value == 101
+    assert len(new_results.data) == 1000  # read from the file
+
+
 class TestResults:
     # TODO: add a full set of Results tests
 
     @mock.patch('pymeasure.experiment.results.open', mock.mock_open(), create=True)
     @mock.patch('os.path.exists', return_value=True)
+    @mock.patch('os.path.getsize', return_value=100)
     @mock.patch('pymeasure.experiment.results.pd.read_csv')
     def test_regression_attr_data_when_up_to_date_should_retain_dtype(self,
                                                                       read_csv_mock,
+                                                                      path_getsize_mock,
                                                                       path_exists_mock):
         procedure_mock = mock.MagicMock(spec=Procedure)
         result = Results(procedure_mock, 'test.csv')
@@ -150,6 +169,93 @@ class TestResults:
         pd.read_csv(filename, comment="#")  # assert no error
         assert (result.parameters['par'].value == np.linspace(1, 100, 17)).all()
 
+    @pytest.fixture
+    def results_file(self, tmpdir):
+        filename = os.path.join(str(tmpdir), 'data.csv')
+        results = Results(RandomProcedure(), filename)
+        with open(filename, 'a') as f:
+            f.writelines(f"{i},{i / 10}\n" for i in range(10))
+        return results.data_filename
+
+    def test_load_reads_header_only(self, results_file):
+        with mock.patch('pymeasure.experiment.results.pd.read_csv') as read_csv_mock:
+            results = Results.load(results_file, procedure_class=RandomProcedure)
+        read_csv_mock.assert_not_called()
+        assert results.data['Iteration'].tolist() == list(range(10))
+
+    def test_data_reads_appended_lines(self, results_file):
+        results = Results(RandomProcedure(), results_file)  # not via load
+        assert len(results.data) == 10
+        with open(results_file, 'a') as f:
+            f.write("10,1.0\n")
+        assert results.data['Iteration'].tolist() == list(range(11))
+
+    @pytest.mark.parametrize("kwargs, columns, iterations", (
+        ({}, ['Iteration', 'Random Number'], list(range(10))),
+        ({'columns': ['Iteration']}, ['Iteration'], list(range(10))),
+        ({'start': 3, 'stop': 5}, ['Iteration', 'Random Number'], [3, 4]),
+        ({'start': 8}, ['Iteration', 'Random Number'], [8, 9]),
+        ({'start': 5, 'stop': 5}, ['Iteration', 'Random Number'], []),
+    ))
+    def test_read_data(self, results_file, kwargs, columns, iterations):
+        results = Results.load(results_file, procedure_class=RandomProcedure)
+        data = results.read_data(**kwargs)
+        assert data.columns.tolist() == columns
+        assert data['Iteration'].tolist() == iterations
+        assert results._data is None
+
+
+class MetadataProcedure(RandomProcedure):
+    sample = Metadata("Sample", default="S1")
+
+
+class TestStoreMetadata:
+    @staticmethod
+    def make_results(directory):
+        results = Results(MetadataProcedure(), os.path.join(str(directory), 'data.csv'))
+        results.procedure.evaluate_metadata()
+        with open(results.data_filename, 'a') as f:
+            f.writelines(f"{i},{i / 10}\n" for i in range(10))
+        return results
+
+    @pytest.fixture
+    def results(self, tmpdir):
+        return self.make_results(tmpdir)
+
+    def check_file(self, results):
+        loaded = Results.load(results.data_filename, procedure_class=MetadataProcedure)
+        assert loaded.procedure.sample == "S1"
+        assert loaded.data['Iteration'].tolist() == list(range(10))
+        assert results.data['Iteration'].tolist() == list(range(10))
+        assert results._header_count == loaded._header_count
+        assert os.listdir(os.path.dirname(results.data_filename)) == ['data.csv']
+
+    def test_reserved_space(self, results):
+        size = os.path.getsize(results.data_filename)
+        with mock.patch.object(Results, '_insert_into_header') as insert:
+            results.store_metadata()
+        insert.assert_not_called()
+        assert os.path.getsize(results.data_filename) == size
+        self.check_file(results)
+
+    def test_without_reserved_space(self, tmpdir, monkeypatch):
+        monkeypatch.setattr(Results, "METADATA_SPACE", 5)  # too small
+        results = self.make_results(tmpdir)
+        os.chmod(results.data_filename, 0o640)
+        results.store_metadata()
+        assert os.stat(results.data_filename).st_mode & 0o777 == 0o640
+        self.check_file(results)
+
+    def test_insert_removes_temporary_file_on_error(self, results):
+        with open(results.data_filename) as f:
+            content = f.read()
+        with mock.patch('pymeasure.experiment.results.os.replace', side_effect=OSError):
+            with pytest.raises(OSError):
+                Results._insert_into_header(results.data_filename, 1, "#Test\n")
+        with open(results.data_filename) as f:
+            assert f.read() == content
+        assert os.listdir(os.path.dirname(results.data_filename)) == ['data.csv']
+
 
 def test_parameter_reading():
     data_path = os.path.join(os.path.dirname(__file__), "data/results_for_testing_parameters.csv")
@@ -124,3 +124,28 @@ def test_sequencer_errors(seq_file_text_err):
     with pytest.raises(exception, match=exc_text):
         seq = SequenceHandler(file_obj=fd)
         seq.parameters_sequence()
+
+
+@pytest.mark.parametrize("file_text", [
+    seq_file_text_1,
+    seq_file_text_2,
+    seq_file_text_3,
+    """
+- "P1", "[1,2]"
+-- "P2", "[3, 4, 5]"
+--- "P3", "[4, 5, 6]"
+-- "P4", "arange(4)"
+- "P5", "range(0)"
+- "P6", "linspace(0, 1, 5)"
+-- "P7", "7"
+""",
+])
+def test_sequence_length(file_text):
+    seq = SequenceHandler(file_obj=StringIO(file_text))
+    assert seq.sequence_length() == len(seq.parameters_sequence())
+
+
+def test_sequence_length_error():
+    seq = SequenceHandler(file_obj=StringIO(seq_file_text_err1))
+    with pytest.raises(SequenceEvaluationError):
+        seq.sequence_length()
@@ -0,0 +1,77 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from pymeasure.experiment import results as results_module
+from pymeasure.experiment.results import Results, unique_filename
+from data.procedure_for_testing import RandomProcedure
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    monkeypatch.setattr(results_module, "_filename_indices", {})
+
+
+def test_first_index(tmp_path):
+    filename = unique_filename(tmp_path, prefix="DATA", datetimeformat="")
+    assert filename == str(tmp_path / "DATA_1.csv")
+    assert os.path.getsize(filename) == 0  # claimed
+
+
+def test_above_highest_existing_index(tmp_path):
+    for name in ("DATA_2.csv", "DATA_17.csv", "DATA_99.txt", "DATA_x.csv", "OTHER_50.csv"):
+        (tmp_path / name).touch()
+    assert unique_filename(tmp_path, datetimeformat="") == str(tmp_path / "DATA_18.csv")
+
+
+def test_scans_directory_once(tmp_path):
+    with mock.patch("pymeasure.experiment.results.os.scandir", wraps=os.scandir) as scandir:
+        filenames = [unique_filename(tmp_path, datetimeformat="") for _ in range(5)]
+    assert scandir.call_count == 1
+    assert [os.path.basename(f) for f in filenames] == [f"DATA_{i}.csv" for i in range(1, 6)]
+
+
+def test_skips_files_created_by_others(tmp_path):
+    unique_filename(tmp_path, datetimeformat="")
+    (tmp_path / "DATA_2.csv").touch()  # e.g. by another process
+    assert unique_filename(tmp_path, datetimeformat="") == str(tmp_path / "DATA_3.csv")
+
+
+def test_concurrent_calls_are_unique(tmp_path):
+    with ThreadPoolExecutor(8) as executor:
+        filenames = list(executor.map(
+            lambda _: unique_filename(tmp_path, datetimeformat=""), range(100)))
+    assert len(set(filenames)) == 100
+
+
+def test_results_write_header_into_claimed_file(tmp_path):
+    filename = unique_filename(tmp_path)
+    results = Results(RandomProcedure(), filename)
+    assert Results.load(filename).parameters["iterations"].value == 100
+    assert results.data.empty
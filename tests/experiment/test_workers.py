@@ -29,7 +29,7 @@ import os
 import tempfile
 from time import sleep
 
-from pymeasure.experiment import Listener, Procedure
+from pymeasure.experiment import Listener, Procedure, Metadata
 from pymeasure.experiment.workers import Worker
 from pymeasure.experiment.results import Results
 from data.procedure_for_testing import RandomProcedure
@@ -65,6 +65,28 @@ def test_worker_finish():
     assert new_results.data.shape == (100, 2)
 
 
+class MetadataProcedure(RandomProcedure):
+    sample = Metadata("Sample", default="S1")
+
+
+@pytest.mark.parametrize("metadata_space", (1024, 0))
+def test_worker_stores_metadata(monkeypatch, metadata_space):
+    # Without reserved space, the file is replaced while the recorder has it open
+    monkeypatch.setattr(Results, "METADATA_SPACE", metadata_space)
+    procedure = MetadataProcedure()
+    procedure.iterations = 10
+    procedure.delay = 0
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    new_results = Results.load(file, procedure_class=MetadataProcedure)
+    assert new_results.procedure.sample == "S1"
+    assert new_results.data['Iteration'].tolist() == list(range(10))
+
+
 def test_worker_closes_file_after_finishing():
     procedure = RandomProcedure()
     procedure.iterations = 100
@@ -129,3 +151,19 @@ def test_zmq_topic_filtering_works(caplog):
     assert procedure.status == procedure.FINISHED
     assert len(received) == 3
     assert all([item[0] == 'results' for item in received])
+
+
+def test_emitted_results_log_sampled(caplog):
+    worker = Worker(Results(RandomProcedure(), tempfile.mktemp()), log_level=logging.DEBUG)
+    worker.results_log_interval = 100
+    with caplog.at_level(logging.DEBUG):
+        for i in range(5):
+            worker._log_emit('results', {'Iteration': i})
+        worker._log_emit('progress', 50)
+        worker._results_logged_at -= 100
+        worker._log_emit('results', {'Iteration': 5})
+    messages = [r.getMessage() for r in caplog.records if r.name == "root"]
+    assert messages == ["Emitting message: results {'Iteration': 0}",
+                        "Emitting message: progress 50",
+                        "4 results were not logged",
+                        "Emitting message: results {'Iteration': 5}"]
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 from pymeasure.test import expected_protocol
 from pymeasure.instruments.agilent.agilent33500 import Agilent33500
@@ -304,3 +305,34 @@ def test_channel_phase_synchronization():
         ]
     ) as inst:
         assert inst.phase_sync() is None
+
+
+def test_data_arb_binary_dac():
+    """
+    Test Agilent 33500 binary upload of DAC values
+    """
+    with expected_protocol(
+        Agilent33500,
+        [
+            ("FORM:BORD SWAP", None),
+            (b"SOUR1:DATA:ARB:DAC test, #14\xff\x7f\x01\x80", None),
+            ("FORM:BORD SWAP", None),
+            (b"DATA:ARB:DAC test, #14\xff\x7f\x01\x80", None),
+        ],
+    ) as inst:
+        inst.ch_1.data_arb("test", np.array([32767, -32767]), data_format="binary")
+        inst.data_arb("test", [32767, -32767], data_format="binary")
+
+
+def test_data_arb_binary_float():
+    """
+    Test Agilent 33500 binary upload of floating point values
+    """
+    with expected_protocol(
+        Agilent33500,
+        [
+            ("FORM:BORD SWAP", None),
+            (b"SOUR2:DATA:ARB test, #18\x00\x00\x80\x3f\x00\x00\x80\xbf", None),
+        ],
+    ) as inst:
+        inst.ch_2.data_arb("test", np.array([1.0, -1.0]), data_format="binary")
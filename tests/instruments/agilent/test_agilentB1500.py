@@ -0,0 +1,75 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import logging
+
+import numpy as np
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.agilent.agilentB1500 import AgilentB1500
+
+SMU_NAMES = {1: "SMU1", 2: "SMU2"}
+
+
+@pytest.mark.parametrize("fmt, data, status", (
+    ("FMT1", "NAV+1.00000E+00,NBI-2.50000E-03,TAV+2.00000E+00,NBI+1.25000E-03",
+     [["N", "N"], ["T", "N"]]),
+    ("FMT11", "NAV+1.000000E+00,NBI-2.500000E-03,TAV+2.000000E+00,NBI+1.250000E-03",
+     [["N", "N"], ["T", "N"]]),
+    ("FMT21", "000Av+1.000000E+00,000BI-2.500000E-03,008Av+2.000000E+00,000BI+1.250000E-03",
+     [[0, 0], [8, 0]]),
+))
+def test_read_data(fmt, data, status, caplog):
+    with expected_protocol(AgilentB1500, [(None, data)]) as inst:
+        inst._data_format = inst._data_formatting(fmt, SMU_NAMES)
+        name_a = "Voltage (V)" if fmt != "FMT21" else "Voltage Output (V)"
+        name_b = "Current (A)" if fmt != "FMT21" else "Current Measurement (A)"
+        with caplog.at_level(logging.INFO):
+            df, stat = inst.read_data(2, return_status=True)
+        assert list(df.columns) == [f"SMU1 {name_a}", f"SMU2 {name_b}"]
+        assert df.iloc[:, 0].tolist() == [1, 2]
+        assert df.iloc[:, 1].tolist() == [-2.5e-3, 1.25e-3]
+        assert stat.tolist() == status
+        # the single compliance status is logged once
+        records = [r for r in caplog.records if r.name.endswith("agilentB1500")]
+        assert len(records) == 1
+
+
+def test_read_data_matches_format_single():
+    data = ",".join(f"000{ch}{name}{value:+.6E}" for value in np.linspace(-1, 1, 50)
+                    for ch, name in (("A", "V"), ("B", "I")))
+    with expected_protocol(AgilentB1500, [(None, data)]) as inst:
+        inst._data_format = inst._data_formatting("FMT21", SMU_NAMES)
+        df = inst.read_data(50)
+        expected = [inst._data_format.format_single(e)[3] for e in data.split(",")]
+        assert df.to_numpy().ravel().tolist() == expected
+
+
+def test_read_data_invalid_width():
+    with expected_protocol(AgilentB1500, [(None, "NAV+1.0,NBI-2.50000E-03")]) as inst:
+        inst._data_format = inst._data_formatting("FMT1", SMU_NAMES)
+        with pytest.raises(ValueError):
+            inst.read_data(1)
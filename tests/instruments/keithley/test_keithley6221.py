@@ -0,0 +1,46 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.keithley.keithley6221 import Keithley6221
+
+
+def test_define_arbitrary_waveform():
+    with expected_protocol(
+        Keithley6221,
+        [(":SOUR:WAVE:ARB:DATA 0.5, -1.0, 0.0", None),
+         (":SOUR:WAVE:ARB:COPY 2", None),
+         (":SOUR:WAVE:FUNC ARB2", None)],
+    ) as inst:
+        inst.define_arbitary_waveform(np.array([0.5, -1, 0]), location=2)
+
+
+@pytest.mark.parametrize("datapoints", ([0, 1.5], np.array([0, -2]), [0, np.nan]))
+def test_define_arbitrary_waveform_out_of_range(datapoints):
+    with expected_protocol(Keithley6221, []) as inst:
+        with pytest.raises(ValueError, match="between -1 and 1"):
+            inst.define_arbitary_waveform(datapoints)
@@ -0,0 +1,82 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.keysight.keysightDSOX1102G import KeysightDSOX1102G
+
+PREAMBLE = {"format": "WORD", "type": "NORMAL", "points": 2, "count": 1, "xincrement": 1e-6,
+            "xorigin": -1e-3, "xreference": 0, "yincrement": 0.01, "yorigin": 0.5,
+            "yreference": 32768}
+
+
+def setup_comm(source):
+    return [(f":waveform:source {source}", None),
+            (":waveform:preamble?", "1,0,2,1,1.0E-06,-1.0E-03,0,1.0E-02,5.0E-01,32768"),
+            (":waveform:data?", b"#14\x80\x00\x80\x0a\n"),
+            ]
+
+
+@pytest.mark.parametrize("format_, raw, values", (
+    ("word", b"#14\x80\x00\x80\x0a\n", [0.5, 0.6]),
+    ("byte", b"#12\x80\x8a\n", [0.5, 0.6]),
+    # below the reference
+    ("word", b"#14\x7f\xff\x00\x00\n", [0.49, -327.18]),
+    ("byte", b"#12\x7f\x00\n", [0.49, -0.78]),
+))
+def test_download_data_binary(format_, raw, values):
+    with expected_protocol(
+        KeysightDSOX1102G,
+        [(":waveform:points:mode NORM", None),
+         (":waveform:points 100", None),
+         (f":waveform:format {format_.upper()}", None),
+         (":waveform:unsigned 1;:waveform:byteorder MSBF", None),
+         (":waveform:source CHAN1", None),
+         (":waveform:preamble?", "1,0,2,1,1.0E-06,-1.0E-03,0,1.0E-02,5.0E-01,"
+          + ("32768" if format_ == "word" else "128")),
+         (":waveform:data?", raw),
+         ],
+    ) as inst:
+        data, preamble = inst.download_data("channel1", points=100, format_=format_)
+        assert list(data) == pytest.approx(values)
+        assert preamble["yincrement"] == 0.01
+
+
+def test_download_data_multiple_sources():
+    with expected_protocol(
+        KeysightDSOX1102G,
+        [(":waveform:points:mode NORM", None),
+         (":waveform:points 100", None),
+         (":waveform:format WORD", None),
+         (":waveform:unsigned 1;:waveform:byteorder MSBF", None),
+         *setup_comm("CHAN1"),
+         *setup_comm("CHAN2"),
+         ],
+    ) as inst:
+        data, preambles = inst.download_data(["channel1", "channel2"], points=100, format_="word")
+        assert len(data) == 2
+        assert list(data[1]) == pytest.approx([0.5, 0.6])
+        assert preambles == [PREAMBLE, PREAMBLE]
@@ -246,8 +246,6 @@ def test_download_one_point():
              (b"WFSU NP,1", None),
              (b"WFSU FP,0", None),
              (b"SANU? C1", b"7.00E+06"),
-             (b"WFSU NP,1", None),
-             (b"WFSU FP,0", None),
              (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x01" + b"\n\n"),
              (b"WFSU?", b"SP,1,NP,2,FP,0"),
              (b"ACQW?", b"SAMPLING"),
@@ -296,8 +294,6 @@ def test_download_two_points():
              (b"WFSU NP,2", None),
              (b"WFSU FP,0", None),
              (b"SANU? C1", b"7.00E+06"),
-             (b"WFSU NP,2", None),
-             (b"WFSU FP,0", None),
              (b"C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\x01" + b"\n\n"),
              (b"WFSU?", b"SP,1,NP,2,FP,0"),
              (b"ACQW?", b"SAMPLING"),
@@ -341,6 +337,36 @@ def test_download_two_points():
         assert y[1] == y[0]
 
 
+def test_download_lazy_time():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,0", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"3.00E+00"),
+             (b"WFSU NP,3", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000003" + b"\x01\xff\x00" + b"\n\n"),
+             (b"WFSU?", b"SP,1,NP,3,FP,0"),
+             (b"ACQW?", b"SAMPLING"),
+             (b"SARA?", b"1.00E+09"),
+             (b"SAST?", b"Stop"),
+             (b"MSIZ?", b"7M"),
+             (b"TDIV?", b"5.00E-04"),
+             (b"TRDL?", b"-0.00E+00"),
+             (b"SANU? C1", b"3.00E+00"),
+             (b"C1:VDIV?", b"5.00E-02"),
+             (b"C1:OFST?", b"-1.50E-01"),
+             (b"C1:UNIT?", b"V")
+             ],
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        y, x, preamble = instr.download_waveform(source="c1", requested_points=0, sparsing=1,
+                                                 lazy_time=True)
+        assert x == (-5e-4 * 14 / 2., 1 / 1e9)
+        assert list(y) == [1 * 0.05 / 25. + 0.150, -1 * 0.05 / 25. + 0.150, 0.150]
+
+
 def test_trigger():
     with expected_protocol(
             LeCroyT3DSO1204,
@@ -0,0 +1,88 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import importlib.util
+import sys
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def virtualbench(monkeypatch):
+    """The virtualbench module, with a minimal pyvirtualbench if it is not installed."""
+    if importlib.util.find_spec("pyvirtualbench") is None:
+        pyvb = ModuleType("pyvirtualbench")
+        pyvb.PyVirtualBench = object
+        monkeypatch.setitem(sys.modules, "pyvirtualbench", pyvb)
+    # Load a separate instance, to not leave the module with a fake dependency behind.
+    spec = importlib.util.find_spec("pymeasure.instruments.ni.virtualbench")
+    spec = importlib.util.spec_from_file_location("_virtualbench_under_test", spec.origin)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def mso(virtualbench):
+    MSO = virtualbench.VirtualBench.MixedSignalOscilloscope
+    mso = MSO.__new__(MSO)
+    mso.mso = MagicMock()
+    records = iter(range(100))
+
+    def read_analog_digital_u64():
+        i = 10 * next(records)
+        # 2 channels of 3 samples each, stored one channel after the other
+        return [i, i + 1, i + 2, i + 5, i + 6, i + 7], 2, None, [], [], None, None, None
+
+    mso.mso.read_analog_digital_u64.side_effect = read_analog_digital_u64
+    return mso
+
+
+def test_stream_analog(mso):
+    blocks = [block.copy() for block in mso.stream_analog(count=3, autoTrigger=False)]
+    assert len(blocks) == 3
+    np.testing.assert_array_equal(blocks[1], [[10, 15], [11, 16], [12, 17]])
+    assert mso.mso.run.call_count == 3
+    mso.mso.run.assert_called_with(False)
+    mso.mso.stop.assert_called_once_with()
+
+
+def test_stream_analog_acquires_on_request(mso):
+    stream = mso.stream_analog()
+    np.testing.assert_array_equal(next(stream), [[0, 5], [1, 6], [2, 7]])
+    assert mso.mso.run.call_count == 1
+    mso.mso.stop.assert_not_called()
+    stream.close()
+    mso.mso.stop.assert_called_once_with()
+
+
+def test_stream_analog_buffers(mso):
+    """The blocks are stored in a ring of preallocated buffers."""
+    blocks = list(mso.stream_analog(count=3, buffers=2))
+    assert np.shares_memory(blocks[0], blocks[2])
+    assert not np.shares_memory(blocks[0], blocks[1])
+    np.testing.assert_array_equal(blocks[2], [[20, 25], [21, 26], [22, 27]])
@@ -0,0 +1,225 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments import comedi
+from pymeasure.instruments.comedi import ContinuousAI, SynchronousAI
+
+
+class FakeFile:
+    """Device file returning the data in reads of at most `chunk` bytes."""
+
+    def __init__(self, data, chunk):
+        self.data = data
+        self.chunk = chunk
+        self.position = 0
+
+    def readinto(self, buffer):
+        content = self.data[self.position:self.position + min(self.chunk, len(buffer))]
+        buffer[:len(content)] = content
+        self.position += len(content)
+        return len(content)
+
+
+class FakeSubdevice:
+    dtype = np.uint16
+
+    def __init__(self, data, chunk):
+        self.device = SimpleNamespace(file=FakeFile(data, chunk), do_insn=lambda insn: None)
+        self.running = True
+        self.cancelled = False
+
+    def get_cmd_generic_timed(self, length, scan_period):
+        return SimpleNamespace()
+
+    def command_test(self):
+        return None
+
+    def command(self):
+        pass
+
+    def get_dtype(self):
+        return self.dtype
+
+    def get_flags(self):
+        return SimpleNamespace(running=self.running)
+
+    def cancel(self):
+        self.running = False
+        self.cancelled = True
+
+
+class PolynomialConverter:
+    """Converter providing the calibration polynomial: 1 + 0.5 (raw - 100)."""
+
+    def get_to_physical_coefficients(self):
+        return [1, 0.5]
+
+    def get_to_physical_expansion_origin(self):
+        return 100
+
+    def to_physical(self, raw):
+        raise AssertionError("The polynomial should be evaluated at once.")
+
+
+class ValueConverter:
+    """Converter without a polynomial, which converts value-wise."""
+
+    def to_physical(self, raw):
+        return np.asarray(raw) * 2.
+
+
+class CMDF(list):
+    wake_eos = 32
+
+
+@pytest.fixture
+def pycomedi(monkeypatch):
+    """Replace the names imported from pycomedi, which is not necessarily installed."""
+    names = {
+        "TRIG_SRC": SimpleNamespace(int="int", count="count", none="none"),
+        "CMDF": CMDF(),
+        "_NamedInt": lambda name, value: value,
+        "inttrig_insn": lambda subdevice: None,
+    }
+    for name, value in names.items():
+        monkeypatch.setattr(comedi, name, value, raising=False)
+
+
+def make_channels(data, chunk):
+    subdevice = FakeSubdevice(np.asarray(data, dtype=FakeSubdevice.dtype).tobytes(), chunk)
+    return [SimpleNamespace(subdevice=subdevice, get_converter=PolynomialConverter),
+            SimpleNamespace(subdevice=subdevice, get_converter=ValueConverter)]
+
+
+def expected(raw):
+    raw = np.asarray(raw, dtype=float).reshape(-1, 2)
+    return np.column_stack((1 + 0.5 * (raw[:, 0] - 100), 2 * raw[:, 1]))
+
+
+class TestSynchronousAI:
+    raw = [100, 1, 102, 2, 104, 3, 106, 4, 108, 5]  # 5 scans of 2 channels
+
+    def measure(self, chunk, block_size, samples=5):
+        channels = make_channels(self.raw, chunk)
+        ai = SynchronousAI(channels, period=1, samples=samples)
+        ai.progress, ai.blocks = [], []
+        ai.emit_progress = ai.progress.append
+        ai.emit_data = lambda data: ai.blocks.append(np.array(data))
+        ai.measure(block_size=block_size)
+        return ai
+
+    @pytest.mark.parametrize("chunk", (1, 3, 4, 100))
+    def test_short_reads(self, pycomedi, chunk):
+        """Reads of any size, also splitting values and scans, give the same data."""
+        ai = self.measure(chunk, block_size=1)
+        np.testing.assert_allclose(ai.data, expected(self.raw))
+        assert ai.progress == [20, 40, 60, 80, 100]
+        np.testing.assert_allclose(ai.blocks, expected(self.raw))
+
+    @pytest.mark.parametrize("chunk", (1, 3, 100))
+    def test_blocks(self, pycomedi, chunk):
+        """Blocks of two scans are emitted, the last block is partial."""
+        ai = self.measure(chunk, block_size=2)
+        assert ai.progress == [40, 80, 100]
+        assert [len(block) for block in ai.blocks] == [2, 2, 1]
+        np.testing.assert_allclose(np.concatenate(ai.blocks), expected(self.raw))
+
+    def test_acquisition_ends_early(self, pycomedi):
+        """If the device delivers less scans, a partial scan is not converted."""
+        ai = self.measure(chunk=3, block_size=2, samples=10)
+        assert ai.progress == [20, 40, 50]
+        np.testing.assert_allclose(np.concatenate(ai.blocks), expected(self.raw))
+        np.testing.assert_allclose(ai.data[5:], 0)
+
+    def test_cancel_on_abort(self, pycomedi):
+        channels = make_channels(self.raw, chunk=100)
+        ai = SynchronousAI(channels, period=1, samples=5)
+        ai.measure(hasAborted=lambda: True)
+        assert channels[0].subdevice.cancelled
+
+
+@pytest.mark.parametrize("converter, result", (
+    (PolynomialConverter(), [0, 1, 2]),
+    (ValueConverter(), [196, 200, 204]),
+))
+def test_physical_converter(converter, result):
+    convert = SynchronousAI._physical_converter(converter)
+    np.testing.assert_allclose(convert(np.array([98, 100, 102], dtype=np.uint16)), result)
+
+
+class TestContinuousAI:
+    raw = list(range(200, 220))  # 10 scans of 2 channels
+
+    @pytest.mark.parametrize("chunk", (1, 3, 100))
+    def test_stream(self, pycomedi, chunk):
+        """Blocks are yielded until the acquisition ends, the last one is partial."""
+        channels = make_channels(self.raw, chunk)
+        ai = ContinuousAI(channels, scan_period=1e-3, block_size=4, buffers=2)
+        blocks = [block.copy() for block in ai.stream()]
+        assert [len(block) for block in blocks] == [4, 4, 2]
+        np.testing.assert_allclose(np.concatenate(blocks), expected(self.raw))
+        assert channels[0].subdevice.cancelled
+
+    def test_attributes(self, pycomedi):
+        ai = ContinuousAI(make_channels(self.raw, 100), scan_period=1e-3)
+        assert ai.period is None
+        assert ai.samples == 0
+        assert ai.scanPeriod == 1000000
+
+    def test_close(self, pycomedi):
+        """Closing the generator cancels the acquisition and stops the reader."""
+        channels = make_channels(self.raw, 100)
+        ai = ContinuousAI(channels, scan_period=1e-3, block_size=2, buffers=2)
+        stream = ai.stream()
+        np.testing.assert_allclose(next(stream), expected(self.raw)[:2])
+        stream.close()
+        assert channels[0].subdevice.cancelled
+
+    def test_abort(self, pycomedi):
+        channels = make_channels(self.raw, 100)
+        ai = ContinuousAI(channels, scan_period=1e-3, block_size=2)
+        assert list(ai.stream(hasAborted=lambda: True)) == []
+        assert channels[0].subdevice.cancelled
+
+    def test_block_reuse(self, pycomedi):
+        """A block stays valid until the next one is requested."""
+        ai = ContinuousAI(make_channels(self.raw, 100), scan_period=1e-3, block_size=2,
+                          buffers=2)
+        blocks = []
+        for block in ai.stream():
+            np.testing.assert_allclose(block, expected(self.raw)[2 * len(blocks):][:2])
+            blocks.append(block)
+        assert np.shares_memory(blocks[0], blocks[2])
+
+    def test_read_error(self, pycomedi):
+        channels = make_channels(self.raw, 100)
+        channels[0].subdevice.device.file.readinto = lambda buffer: 1 / 0
+        ai = ContinuousAI(channels, scan_period=1e-3, block_size=2)
+        with pytest.raises(ZeroDivisionError):
+            next(ai.stream())
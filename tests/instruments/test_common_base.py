@@ -1012,3 +1012,58 @@ def test_dynamic_property_values_defined_at_superclass_level():
     inst.fake_ctrl2 = 17  # should raise an error if change unsuccessful
     with pytest.raises(ValueError):
         inst.fake_ctrl2 = 2  # should not raise an error if change unsuccessful
+
+
+class CachedBase(CommonBaseTesting):
+    forever = CommonBase.measurement("F?", "doc", cache=True)
+    ranged = CommonBase.control("R?", "R %d", "doc", cache=True, cast=int)
+    lifetime = CommonBase.measurement("L?", "doc", cache=0)
+    mode = CommonBase.setting("M %d", "doc", invalidates_cache=True)
+
+
+class CachedParent(CachedBase):
+    channels = CommonBase.MultiChannelCreator(CachedBase, ("A",))
+
+
+def test_cache_forever():
+    with expected_protocol(CachedBase, [("F?", "5")]) as inst:
+        assert inst.forever == 5
+        assert inst.forever == 5
+
+
+def test_cache_lifetime_expired():
+    with expected_protocol(CachedBase, [("L?", "5"), ("L?", "6")]) as inst:
+        assert inst.lifetime == 5
+        assert inst.lifetime == 6
+
+
+def test_cache_invalidated_by_own_setter():
+    with expected_protocol(CachedBase, [("R?", "5"), ("R 7", None), ("R?", "7")]) as inst:
+        assert inst.ranged == 5
+        inst.ranged = 7
+        assert inst.ranged == 7
+        assert inst.ranged == 7
+
+
+def test_cache_invalidated_by_setting():
+    with expected_protocol(CachedBase, [("F?", "5"), ("M 1", None), ("F?", "6")]) as inst:
+        assert inst.forever == 5
+        inst.mode = 1
+        assert inst.forever == 6
+
+
+def test_invalidate_cache_includes_channels():
+    with expected_protocol(CachedParent, [("F?", "5"), ("F?", "5"), ("F?", "6"), ("F?", "6")]
+                           ) as inst:
+        assert inst.forever == inst.ch_A.forever == 5
+        inst.invalidate_cache()
+        assert inst.forever == inst.ch_A.forever == 6
+
+
+def test_invalidate_cache_single_command():
+    with expected_protocol(CachedBase, [("F?", "5"), ("R?", "1"), ("F?", "6")]) as inst:
+        assert inst.forever == 5
+        assert inst.ranged == 1
+        inst.invalidate_cache("F?")
+        assert inst.forever == 6
+        assert inst.ranged == 1
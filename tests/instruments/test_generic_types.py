@@ -68,6 +68,24 @@ class Test_SCPIMixin:
                 name="test") as inst:
             getattr(inst, method)()
 
+    def test_id_not_cached_by_default(self):
+        with expected_protocol(
+                self.SCPIInstrument,
+                [("*IDN?", "xyz"), ("*IDN?", "xyz")],
+                name="test") as inst:
+            assert inst.id == inst.id == "xyz"
+
+    def test_id_cached_until_reset(self):
+        with expected_protocol(
+                self.SCPIInstrument,
+                [("*IDN?", "a,b"), ("*OPT?", "opt"), ("*RST", None), ("*IDN?", "a,b")],
+                name="test") as inst:
+            inst.cache_identification = True
+            assert inst.id == inst.id == ["a", "b"]
+            assert inst.options == inst.options == "opt"
+            inst.reset()
+            assert inst.id == ["a", "b"]
+
     def test_check_errors(self):
         with expected_protocol(
                 self.SCPIInstrument,
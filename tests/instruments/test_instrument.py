@@ -234,6 +234,16 @@ def test_SCPI_properties(method, write, reply):
         assert getattr(instr, method) == reply
 
 
+@pytest.mark.parametrize("cache, writes", ((False, 2), (True, 1)))
+def test_SCPI_id_cache(cache, writes):
+    with expected_protocol(
+            Instrument,
+            [("*IDN?", "xyz")] * writes,
+            name="test") as instr:
+        instr.cache_identification = cache
+        assert instr.id == instr.id == "xyz"
+
+
 @pytest.mark.parametrize("method, write", (("clear", "*CLS"),
                                            ("reset", "*RST")
                                            ))
@@ -244,6 +244,25 @@ class Test_parse_stream:
         with io.BytesIO(text) as buf:
             assert parse_stream(buf) == comms
 
+    def test_parsing_timing(self):
+        text = (b"1.000000 WRITE:abc\n1.250000 READ:d\n\n1.500000 READ:ef\n"
+                b"2.000000 WRITE:ghi\n3.000000 READ:12\n")
+        with io.BytesIO(text) as buf:
+            comms, delays = parse_stream(buf, timing=True)
+        assert comms == [(b"abc", b"d\nef"), (b"ghi", b"12")]
+        assert delays == pytest.approx([0.5, 1])
+
+    def test_record_timing(self):
+        adapter = ProtocolAdapter([("abc", "def")])
+        stream = io.BytesIO()
+        adapter.log.addHandler(ByteStreamHandler(stream, timestamps=True))
+        adapter.log.setLevel(logging.DEBUG)
+        adapter.ask("abc")
+        stream.seek(0)
+        comms, delays = parse_stream(stream, timing=True)
+        assert comms == [(b"abc", b"def")]
+        assert 0 <= delays[0] < 1
+
 
 class Test_generator:
     @pytest.fixture
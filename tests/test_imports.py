@@ -0,0 +1,65 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import subprocess
+import sys
+
+import pytest
+
+import pymeasure
+import pymeasure.experiment
+import pymeasure.instruments
+
+
+@pytest.mark.parametrize("statement, modules", (
+    ("import pymeasure.experiment", ("pandas", "pint", "numpy")),
+    ("from pymeasure.experiment import Procedure", ("pandas", "pint")),
+    ("import pymeasure.instruments", ("pyvisa", "numpy")),
+))
+def test_lazy_import(statement, modules):
+    """Importing the package does not import heavy dependencies."""
+    code = f"import sys; {statement}; print(*[m for m in {modules!r} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True)
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("package, name", (
+    (pymeasure.experiment, "Results"),
+    (pymeasure.instruments, "Instrument"),
+))
+def test_lazy_attributes(package, name):
+    assert name in dir(package)
+    assert name in package.__all__
+    assert getattr(package, name).__name__ == name
+
+
+@pytest.mark.parametrize("package", (pymeasure, pymeasure.experiment, pymeasure.instruments))
+def test_missing_attribute(package):
+    with pytest.raises(AttributeError):
+        package.does_not_exist
+
+
+def test_version():
+    assert isinstance(pymeasure.__version__, str)
@@ -25,8 +25,10 @@
 import time
 from unittest import mock
 
+import pytest
+
 from pymeasure.process import context
-from pymeasure.log import Scribe, setup_logging
+from pymeasure.log import Scribe, setup_logging, truncate_message
 
 
 # TODO: Add tests for logging convenience functions and TopicQueueHandler
@@ -56,3 +58,14 @@ def test_setup_file_logging():
         mocked_file_log.assert_not_called()
         setup_logging(filename='log.txt')
         mocked_file_log.assert_called_once()
+
+
+@pytest.mark.parametrize("message, limit, result", (
+    ("abc", 3, "abc"),
+    ("abcd", 3, "abc... (4 characters)"),
+    (b"abcd", 2, b"ab... (4 bytes)"),
+    (bytearray(b"abcd"), 2, b"ab... (4 bytes)"),
+    ("abcd", None, "abcd"),
+))
+def test_truncate_message(message, limit, result):
+    assert truncate_message(message, limit) == result